@@ -196,7 +196,17 @@ def get_example_forthic(example_dir):
     return result
 
 
+# Maps app directories to fully initialized interpreters. Each request gets a clone.
+BASE_INTERPS = {}
+
+
 def get_interp(app_dir):
+    if app_dir not in BASE_INTERPS:
+        BASE_INTERPS[app_dir] = make_interp(app_dir)
+    return BASE_INTERPS[app_dir].clone()
+
+
+def make_interp(app_dir):
     def configure_cache_module(interp):
         interp.register_module(CacheModule)
         interp.run(f"['cache'] USE-MODULES '{app_dir}' cache.CWD!")
@@ -1 +1,2 @@
-__import__('pkg_resources').declare_namespace(__name__)
+# pkgutil-style namespace package (pkg_resources.declare_namespace is slow to import)
+__path__ = __import__('pkgutil').extend_path(__path__, __name__)
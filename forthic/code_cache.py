@@ -0,0 +1,136 @@
+import os
+import sys
+import marshal
+import hashlib
+import tempfile
+from .tokens import StringToken, StartArrayToken, EndArrayToken, StartModuleToken, EndModuleToken, \
+    StartDefinitionToken, EndDefinitionToken, WordToken, CommentToken, EOSToken, Token
+from .tokenizer import FastTokenizer, TokenizerError
+from typing import Dict, List, Optional, Tuple
+
+
+# Change this whenever the tokenizer or the format of cache files changes
+CODE_CACHE_VERSION = 1
+
+# Tokens are stored as a byte string of indexes into TOKEN_CLASSES and a list of fields (None for classes without
+# fields)
+TOKEN_CLASSES = [
+    StringToken,
+    StartArrayToken,
+    EndArrayToken,
+    StartModuleToken,
+    EndModuleToken,
+    StartDefinitionToken,
+    EndDefinitionToken,
+    WordToken,
+]
+TOKEN_CLASS_INDEXES = {token_class: i for i, token_class in enumerate(TOKEN_CLASSES)}
+
+
+class CodeCache:
+    """Stores tokenized Forthic code on disk so module code and screens aren't re-tokenized at each start
+
+    Cache files are stored in `directory` (typically next to the app), one per source string. They're keyed by
+    a hash of the source, the `CODE_CACHE_VERSION`, and the Python version, so changing any of these simply
+    results in a cache miss. Comments are dropped when code is cached.
+
+    An interpreter uses a code cache if one is assigned to its `code_cache` attribute.
+    """
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.tokens: Dict[str, List[Token]] = {}   # Maps source strings to tokens loaded during this process
+        self.num_hits: int = 0
+        self.num_misses: int = 0
+
+    def get_tokens(self, string: str) -> Optional[List[Token]]:
+        """Returns the tokens of a Forthic string, or None if the string can't be tokenized
+
+        Tokens are loaded from the cache if possible. Otherwise, the string is tokenized and the tokens are
+        written to the cache.
+        """
+        result = self.tokens.get(string)
+        if result is not None:
+            return result
+
+        path = self.get_path(string)
+        result = self.read_tokens(path)
+        if result is None:
+            self.num_misses += 1
+            result = tokenize(string)
+            if result is None:
+                return None
+            self.write_tokens(path, result)
+        else:
+            self.num_hits += 1
+
+        self.tokens[string] = result
+        return result
+
+    def get_path(self, string: str) -> str:
+        key = f'{CODE_CACHE_VERSION}:{sys.version_info[:2]}:{string}'
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{digest}.tokens')
+
+    def read_tokens(self, path: str) -> Optional[List[Token]]:
+        try:
+            with open(path, 'rb') as f:
+                data = marshal.loads(f.read())
+            return decode_tokens(data)
+        except (OSError, EOFError, ValueError, TypeError, IndexError):
+            return None
+
+    def write_tokens(self, path: str, tokens: List[Token]) -> None:
+        """Writes tokens to a temporary file first so readers never see a partially written cache file"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump(encode_tokens(tokens), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def clear(self) -> None:
+        """Removes all cache files"""
+        self.tokens = {}
+        if not os.path.isdir(self.directory):
+            return
+        for filename in os.listdir(self.directory):
+            if filename.endswith('.tokens'):
+                os.remove(os.path.join(self.directory, filename))
+
+
+def tokenize(string: str) -> Optional[List[Token]]:
+    """Returns the tokens of a Forthic string without comments, or None if it has tokenizer errors"""
+    result: List[Token] = []
+    tokenizer = FastTokenizer(string)
+    try:
+        token = tokenizer.next_token()
+        while not isinstance(token, EOSToken):
+            if not isinstance(token, CommentToken):
+                result.append(token)
+            token = tokenizer.next_token()
+    except TokenizerError:
+        return None
+    return result
+
+
+def encode_tokens(tokens: List[Token]) -> Tuple[bytes, List[Optional[str]]]:
+    """Returns the class indexes of tokens and their fields (None for tokens without fields)"""
+    indexes = bytes(TOKEN_CLASS_INDEXES[type(token)] for token in tokens)
+    fields: List[Optional[str]] = [
+        getattr(token, type(token).__slots__[0]) if type(token).__slots__ else None for token in tokens
+    ]
+    return indexes, fields
+
+
+def decode_tokens(data: Tuple[bytes, List[Optional[str]]]) -> List[Token]:
+    indexes, fields = data
+    if len(indexes) != len(fields):
+        raise ValueError('Invalid token data')
+    token_classes = TOKEN_CLASSES
+    return [
+        token_classes[i]() if field is None else token_classes[i](field)   # type: ignore
+        for i, field in zip(indexes, fields)
+    ]
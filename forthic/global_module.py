@@ -3,24 +3,52 @@ import os
 import random
 import math
 import pytz
-import pdb
 import datetime
-from dateutil import parser
 import urllib
 import json
 import io
 import csv
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from collections.abc import Mapping
-from .module import Word, Module, PushValueWord
-from .profile import ProfileAnalyzer
+from .module import (
+    Word,
+    Module,
+    PushValueWord,
+    fork_variable_values,
+    set_thread_variable_values,
+    shallow_copy,
+    thread_variable_values,
+)
+from .lazy_seq import LazySeq
+from .profile import AggregateWordProfile, ProfileAnalyzer
 from .interfaces import IInterpreter
 
 from typing import Optional, Union, Any, List
 
+# NOTE: dateutil, pdb, and concurrent.futures are imported by the words that use them so importing the
+# interpreter stays fast
+
 
 DLE = chr(16)   # ASCII DLE char
 
+# Max number of literal words kept by the global module
+LITERAL_CACHE_SIZE = 4096
+
+# Literal words with values of these types can be shared wherever their token appears
+IMMUTABLE_LITERAL_TYPES = (bool, int, float, str, datetime.date, datetime.time, type(None))
+
+DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+TIME_RE = re.compile(r'(\d{1,2}):(\d{2})')
+
+# Classifies the common shapes of literals handled by the default `literal_handlers`
+LITERAL_RE = re.compile(r"""
+    (?P<bool>True|False)\Z
+    | (?P<int>[-+]?\d+)\Z
+    | (?P<float>[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?)\Z
+    | (?P<date>\d{4}-\d{2}-\d{2})
+    | (?P<time>\d{1,2}:\d{2})
+""", re.VERBOSE)
+
 
 class StackDump(RuntimeError):
     pass
@@ -35,19 +63,34 @@ class InvalidTimeError(GlobalModuleError):
 
 
 class MemoWord(Word):
-    def __init__(self, name, varname):
+    """Pushes the value of a memo variable, running the `<name>!` word first if the variable hasn't been set
+
+    The variable and `<name>!` word are resolved in the module where `MEMO` was called, so each execution is a
+    direct variable check rather than a run of Forthic. `<name>!` is looked up whenever the memo is refreshed,
+    so it may be redefined after `MEMO` runs.
+    """
+    def __init__(self, name: str, module: Module, varname: str):
         super().__init__(name)
+        self.module = module
         self.varname = varname
+        self.refresh_word_name = f'{name}!'
+
+    def clone(self, memo):
+        result = memo.get(id(self))
+        if result is None:
+            result = shallow_copy(self)
+            memo[id(self)] = result
+            result.module = self.module.clone(memo)
+        return result
 
     def execute(self, interp: IInterpreter):
-        # If varname is null, execute name!
-        interp.run(f'{self.varname} @')
-        var_value = interp.stack_pop()
-        if var_value is None:
-            interp.run(f'{self.name}!')
+        value = self.module.variables[self.varname].value
+        if value is None:
+            interp.find_module_word(self.module, self.refresh_word_name).execute(interp)   # type: ignore
+            value = self.module.variables[self.varname].value
 
         # Return value of variable
-        interp.run(f'{self.varname} @')
+        interp.stack_push(value)
 
 
 class GlobalModule(Module):
@@ -66,10 +109,6 @@ class GlobalModule(Module):
         super().__init__('<GLOBAL>', interp)
         self.timezone = timezone
 
-        # "Screens" of Forthic code can be loaded from disk/memory. Since screens can load other screens,
-        # we need to be careful not to get into a loop. The `active_screens` keeps track of this.
-        self.active_screens = set()
-
         # `literal_handlers` convert tokens into values when no other words can be found.
         # A Forthic interpreter can be customized here to recoginize domain-specific literals.
         self.literal_handlers = [
@@ -79,6 +118,19 @@ class GlobalModule(Module):
             self.to_date,
             self.to_time,
         ]
+        self.default_literal_handlers = self.literal_handlers[:]
+        self.classified_literal_handlers = {
+            'bool': self.to_bool,
+            'int': self.to_int,
+            'float': self.to_float,
+            'date': self.to_date,
+            'time': self.to_time,
+        }
+
+        # Maps token strings to literal words, least recently used first. The cache is only valid for the
+        # `literal_handlers` it was built with.
+        self.literal_cache: OrderedDict[str, PushValueWord] = OrderedDict()
+        self.literal_cache_handlers = self.literal_handlers[:]
 
         # ----------------
         # Base words
@@ -118,6 +170,10 @@ class GlobalModule(Module):
             'FOREACH-w/KEY>ERRORS', self.word_FOREACH_w_KEY_to_ERRORS
         )
         self.add_module_word('PROCESS-ITEMS', self.word_PROCESS_ITEMS)
+        self.add_module_word('PARALLEL-MAP', self.word_PARALLEL_MAP)
+        self.add_module_word('PARALLEL-FOREACH>ERRORS', self.word_PARALLEL_FOREACH_to_ERRORS)
+        self.add_module_word('PARALLEL-WORKERS!', self.word_PARALLEL_WORKERS_bang)
+        self.add_module_word('PROCESS-MAP', self.word_PROCESS_MAP)
         self.add_module_word('ZIP', self.word_ZIP)
         self.add_module_word('ZIP-WITH', self.word_ZIP_WITH)
         self.add_module_word('KEYS', self.word_KEYS)
@@ -144,6 +200,8 @@ class GlobalModule(Module):
         self.add_module_word('FLATTEN', self.word_FLATTEN)
         self.add_module_word('KEY-OF', self.word_KEY_OF)
         self.add_module_word('REDUCE', self.word_REDUCE)
+        self.add_module_word('>LAZY', self.word_to_LAZY)
+        self.add_module_word('>LIST', self.word_to_LIST)
 
         # ----------------
         # Stack words
@@ -263,10 +321,17 @@ class GlobalModule(Module):
         # ----------------
         # Profiling words
         self.add_module_word('PROFILE-START', self.word_PROFILE_START)
+        self.add_module_word('PROFILE-AGGREGATE-START', self.word_PROFILE_AGGREGATE_START)
+        self.add_module_word('PROFILE-MEMORY-START', self.word_PROFILE_MEMORY_START)
         self.add_module_word('PROFILE-TIMESTAMP', self.word_PROFILE_TIMESTAMP)
         self.add_module_word('PROFILE-END', self.word_PROFILE_END)
         self.add_module_word('PROFILE-DATA', self.word_PROFILE_DATA)
+        self.add_module_word('PROFILE-TRACE', self.word_PROFILE_TRACE)
         self.add_module_word('PROFILE-REPORT', self.word_PROFILE_REPORT)
+        self.add_module_word('PROFILE-SAMPLE-START', self.word_PROFILE_SAMPLE_START)
+        self.add_module_word('PROFILE-SAMPLE-END', self.word_PROFILE_SAMPLE_END)
+        self.add_module_word('PROFILE-FOLDED', self.word_PROFILE_FOLDED)
+        self.add_module_word('PROFILE-SPEEDSCOPE', self.word_PROFILE_SPEEDSCOPE)
 
         # ----------------
         # Python-only words
@@ -280,7 +345,41 @@ class GlobalModule(Module):
         return result
 
     def find_literal_word(self, string: str):
-        """Converts a string into a literal using one of the registered converters"""
+        """Converts a string into a literal using one of the registered converters
+
+        Literal words with immutable values are cached by string. Interpreters bypass the cache during profiling
+        runs (see `Interpreter.find_word_uncached`) so each literal is counted as its own word.
+        """
+        if self.literal_handlers != self.literal_cache_handlers:
+            self.literal_cache.clear()
+            self.literal_cache_handlers = self.literal_handlers[:]
+
+        result = self.literal_cache.get(string)
+        if result is not None:
+            try:
+                self.literal_cache.move_to_end(string)
+            except KeyError:
+                # Another thread evicted the literal after it was found
+                pass
+            return result
+
+        result = self.convert_literal_word(string)
+        if result is not None and isinstance(result.value, IMMUTABLE_LITERAL_TYPES):
+            self.literal_cache[string] = result
+            if len(self.literal_cache) > LITERAL_CACHE_SIZE:
+                self.literal_cache.popitem(last=False)
+        return result
+
+    def convert_literal_word(self, string: str) -> Optional[PushValueWord]:
+        """Returns a new literal word for a string, or None if no converter recognizes it"""
+        # Common literals are classified with a single regex match when the default converters are in use
+        if self.literal_handlers == self.default_literal_handlers:
+            match = LITERAL_RE.match(string)
+            if match:
+                value = self.classified_literal_handlers[match.lastgroup](string)
+                if value is not None:
+                    return PushValueWord(string, value)
+
         for handler in self.literal_handlers:
             value = handler(string)
             if value is not None:
@@ -317,7 +416,7 @@ class GlobalModule(Module):
 
     def to_date(self, str_val: str) -> Optional[datetime.date]:
         """If str_val can be converted to date, return value; otherwise None"""
-        match = re.match(r'(\d{4})-(\d{2})-(\d{2})', str_val)
+        match = DATE_RE.match(str_val)
         if not match:
             return None
 
@@ -329,7 +428,7 @@ class GlobalModule(Module):
 
     def to_time(self, str_val: str) -> Optional[datetime.time]:
         """If str_val can be converted to time, return value; otherwise None"""
-        match = re.match(r'(\d{1,2}):(\d{2})', str_val)
+        match = TIME_RE.match(str_val)
         if not match:
             return None
 
@@ -403,8 +502,8 @@ class GlobalModule(Module):
         interp.run(f': {name_bang_at}   {name_bang} {var_name} @;')
 
         # name word
-        word = MemoWord(name, var_name)
-        interp.cur_module().add_word(word)
+        module = interp.cur_module()
+        interp.add_definition(module, MemoWord(name, module, var_name))
 
     # ( names -- )
     def word_EXPORT(self, interp: IInterpreter):
@@ -457,18 +556,7 @@ class GlobalModule(Module):
     def word_REC_at(self, interp: IInterpreter):
         field = interp.stack_pop()
         rec = interp.stack_pop()
-
-        if not rec:
-            interp.stack_push(None)
-            return
-
-        if isinstance(field, list):
-            fields = field
-        else:
-            fields = [field]
-
-        result = drill_for_value(rec, fields)
-        interp.stack_push(result)
+        interp.stack_push(rec_at(rec, field))
 
     # ( rec value field -- rec )
     def word_l_REC_bang(self, interp: IInterpreter):
@@ -518,22 +606,29 @@ class GlobalModule(Module):
     def word_LOAD_SCREEN(self, interp: IInterpreter):
         """Runs screen"""
         name = interp.stack_pop()
-        if name in self.active_screens:
+
+        # "Screens" of Forthic code can be loaded from disk/memory. Since screens can load other screens,
+        # we need to be careful not to get into a loop. The interpreter's `active_screens` (which are tracked
+        # per thread) keep track of this.
+        active_screens = interp.active_screens
+        if name in active_screens:
             raise GlobalModuleError(
                 f"Can't load screen '{name}' because it is currently being loaded"
             )
 
         screen = interp.app_module.get_screen(name)
 
-        self.active_screens.add(name)
-        interp.run_in_module(interp.app_module, screen)
-        self.active_screens.remove(name)
+        active_screens.add(name)
+        try:
+            interp.run_in_module(interp.app_module, screen)
+        finally:
+            active_screens.remove(name)
 
     # ( array item -- array )
     # ( record key/val -- record )
     def word_APPEND(self, interp: IInterpreter):
         item = interp.stack_pop()
-        result = interp.stack_pop()
+        result = to_list(interp.stack_pop())
 
         if not result:
             result = []
@@ -548,7 +643,7 @@ class GlobalModule(Module):
     # ( array -- array )
     # ( record -- record )
     def word_REVERSE(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             interp.stack_push(container)
@@ -565,7 +660,7 @@ class GlobalModule(Module):
     # ( record -- record )
     # NOTE: If record, assuming its values are hashable
     def word_UNIQUE(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             interp.stack_push(container)
@@ -588,7 +683,7 @@ class GlobalModule(Module):
     # ( record key -- record )
     def word_L_DEL(self, interp: IInterpreter):
         key = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             interp.stack_push(container)
@@ -606,7 +701,7 @@ class GlobalModule(Module):
     def word_RELABEL(self, interp: IInterpreter):
         new_keys = interp.stack_pop()
         old_keys = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             interp.stack_push(container)
@@ -636,7 +731,7 @@ class GlobalModule(Module):
     # ( record field -- field_to_item )
     def word_BY_FIELD(self, interp: IInterpreter):
         field = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -656,7 +751,7 @@ class GlobalModule(Module):
     # ( record field -- field_to_items )
     def word_GROUP_BY_FIELD(self, interp: IInterpreter):
         field = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -676,7 +771,7 @@ class GlobalModule(Module):
     # ( record forthic -- group_to_items )
     def word_GROUP_BY(self, interp: IInterpreter):
         forthic = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -686,12 +781,18 @@ class GlobalModule(Module):
         else:
             values = container.values()
 
+        compiled = interp.compile_forthic(forthic)
+        item_function = interp.get_item_function(compiled)
         result = defaultdict(list)
-        for v in values:
-            interp.stack_push(v)
-            interp.run(forthic)
-            group = interp.stack_pop()
-            result[group].append(v)
+        if item_function:
+            for v in values:
+                result[item_function(v)].append(v)
+        else:
+            for v in values:
+                interp.stack_push(v)
+                compiled.execute(interp)
+                group = interp.stack_pop()
+                result[group].append(v)
 
         interp.stack_push(result)
 
@@ -699,7 +800,7 @@ class GlobalModule(Module):
     # ( record forthic -- group_to_items )
     def word_GROUP_BY_w_KEY(self, interp: IInterpreter):
         forthic = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -711,13 +812,14 @@ class GlobalModule(Module):
             keys = list(container.keys())
             values = list(container.values())
 
+        compiled = interp.compile_forthic(forthic)
         result = defaultdict(list)
         for i in range(len(values)):
             key = keys[i]
             value = values[i]
             interp.stack_push(key)
             interp.stack_push(value)
-            interp.run(forthic)
+            compiled.execute(interp)
             group = interp.stack_pop()
             result[group].append(value)
 
@@ -727,7 +829,7 @@ class GlobalModule(Module):
     # ( record n -- records )
     def word_GROUPS_OF(self, interp: IInterpreter):
         size = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
         if size <= 0:
             raise GlobalModuleError('GROUPS-OF requires group size > 0')
 
@@ -768,19 +870,26 @@ class GlobalModule(Module):
             interp.stack_push(items)
             return
 
+        compiled = interp.compile_forthic(forthic)
         result: Any = []
         if isinstance(items, list):
-            for i in range(len(items)):
-                item = items[i]
-                interp.stack_push(item)
-                interp.run(forthic)
-                value = interp.stack_pop()
-                result.append(value)
+            item_function = interp.get_item_function(compiled)
+            if item_function:
+                result = [item_function(item) for item in items]
+            else:
+                for i in range(len(items)):
+                    item = items[i]
+                    interp.stack_push(item)
+                    compiled.execute(interp)
+                    value = interp.stack_pop()
+                    result.append(value)
+        elif isinstance(items, LazySeq):
+            result = items.map(interp, compiled)
         else:
             result = {}
             for k, item in items.items():
                 interp.stack_push(item)
-                interp.run(forthic)
+                compiled.execute(interp)
                 value = interp.stack_pop()
                 result[k] = value
 
@@ -796,21 +905,24 @@ class GlobalModule(Module):
             interp.stack_push(items)
             return
 
+        compiled = interp.compile_forthic(forthic)
         result: Any = []
         if isinstance(items, list):
             for i in range(len(items)):
                 item = items[i]
                 interp.stack_push(i)
                 interp.stack_push(item)
-                interp.run(forthic)
+                compiled.execute(interp)
                 value = interp.stack_pop()
                 result.append(value)
+        elif isinstance(items, LazySeq):
+            result = items.map(interp, compiled, with_index=True)
         else:
             result = {}
             for k, item in items.items():
                 interp.stack_push(k)
                 interp.stack_push(item)
-                interp.run(forthic)
+                compiled.execute(interp)
                 value = interp.stack_pop()
                 result[k] = value
 
@@ -855,10 +967,12 @@ class GlobalModule(Module):
         if not items:
             items = []
 
+        compiled = interp.compile_forthic(forthic)
+
         def process_item(item):
             try:
                 interp.stack_push(item)
-                interp.run(forthic)
+                compiled.execute(interp)
             except Exception as e:
                 interp.stack_push(item)
                 interp.stack_push(e)
@@ -875,11 +989,86 @@ class GlobalModule(Module):
                 return
         interp.run(done_forthic)
 
+    # ( array forthic -- array )
+    # ( record forthic -- record )
+    def word_PARALLEL_MAP(self, interp: IInterpreter):
+        """Like MAP, but runs `forthic` for up to `parallel_workers` items at a time (see `parallel_run`)"""
+        forthic = interp.stack_pop()
+        items = to_list(interp.stack_pop())
+
+        if not items:
+            interp.stack_push(items)
+            return
+
+        compiled = interp.compile_forthic(forthic)
+        result: Any
+        if isinstance(items, list):
+            result = parallel_run(interp, compiled, items)
+        else:
+            values = parallel_run(interp, compiled, list(items.values()))
+            result = dict(zip(items.keys(), values))
+
+        interp.stack_push(result)
+
+    # ( array forthic -- errors )
+    # ( record forthic -- errors )
+    def word_PARALLEL_FOREACH_to_ERRORS(self, interp: IInterpreter):
+        """Like FOREACH>ERRORS, but runs `forthic` for up to `parallel_workers` items at a time
+
+        Anything `forthic` leaves on the stack is dropped (see `parallel_run`).
+        """
+        forthic = interp.stack_pop()
+        container = to_list(interp.stack_pop())
+
+        if not container:
+            container = []
+
+        items = container if isinstance(container, list) else list(container.values())
+        compiled = interp.compile_forthic(forthic)
+        errors = parallel_run(interp, compiled, items, return_errors=True)
+        interp.stack_push(errors)
+
+    # ( num_workers -- )
+    def word_PARALLEL_WORKERS_bang(self, interp: IInterpreter):
+        """Sets the interpreter's `parallel_workers`
+
+        This is a setting shared by every thread, so only the thread that created the interpreter can change it
+        (e.g., while setting it up).
+        """
+        num_workers = interp.stack_pop()
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise GlobalModuleError(f'PARALLEL-WORKERS! requires a positive integer, not {num_workers}')
+        if not interp.is_owner_thread():
+            raise GlobalModuleError(
+                "PARALLEL-WORKERS! can only be used by the thread that created the interpreter"
+            )
+        interp.parallel_workers = num_workers
+
+    # ( array forthic -- array )
+    # ( record forthic -- record )
+    def word_PROCESS_MAP(self, interp: IInterpreter):
+        """Like MAP, but runs `forthic` in worker processes (see `Interpreter.process_map`)"""
+        forthic = interp.stack_pop()
+        items = to_list(interp.stack_pop())
+
+        if not items:
+            interp.stack_push(items)
+            return
+
+        result: Any
+        if isinstance(items, list):
+            result = interp.process_map(forthic, items)
+        else:
+            values = interp.process_map(forthic, list(items.values()))
+            result = dict(zip(items.keys(), values))
+
+        interp.stack_push(result)
+
     # ( array1 array2 -- array )
     # ( record1 record2 -- record )
     def word_ZIP(self, interp: IInterpreter):
-        container2 = interp.stack_pop()
-        container1 = interp.stack_pop()
+        container2 = to_list(interp.stack_pop())
+        container1 = to_list(interp.stack_pop())
 
         if not container1:
             container1 = []
@@ -903,8 +1092,8 @@ class GlobalModule(Module):
     # ( record1 record2 forthic -- record )
     def word_ZIP_WITH(self, interp: IInterpreter):
         forthic = interp.stack_pop()
-        container2 = interp.stack_pop()
-        container1 = interp.stack_pop()
+        container2 = to_list(interp.stack_pop())
+        container1 = to_list(interp.stack_pop())
 
         if not container1:
             container1 = []
@@ -912,6 +1101,7 @@ class GlobalModule(Module):
         if not container2:
             container2 = []
 
+        compiled = interp.compile_forthic(forthic)
         if isinstance(container2, list):
             result: Any = []
             for i in range(len(container1)):
@@ -919,7 +1109,7 @@ class GlobalModule(Module):
                 value2 = container2[i] if i < len(container2) else None
                 interp.stack_push(value1)
                 interp.stack_push(value2)
-                interp.run(forthic)
+                compiled.execute(interp)
                 res = interp.stack_pop()
                 result.append(res)
         else:
@@ -927,7 +1117,7 @@ class GlobalModule(Module):
             for k, v in container1.items():
                 interp.stack_push(v)
                 interp.stack_push(container2.get(k))
-                interp.run(forthic)
+                compiled.execute(interp)
                 res = interp.stack_pop()
                 result[k] = res
 
@@ -936,7 +1126,7 @@ class GlobalModule(Module):
     # ( array -- array )
     # ( record -- array )
     def word_KEYS(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -951,7 +1141,7 @@ class GlobalModule(Module):
     # ( array -- array )
     # ( record -- array )
     def word_VALUES(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -980,7 +1170,7 @@ class GlobalModule(Module):
     def word_SLICE(self, interp: IInterpreter):
         end = int(interp.stack_pop())
         start = int(interp.stack_pop())
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
         length = len(container)
 
         if not container:
@@ -1030,8 +1220,8 @@ class GlobalModule(Module):
     # ( larray rarray -- array )
     # ( lrecord rrecord -- record )
     def word_DIFFERENCE(self, interp: IInterpreter):
-        rcontainer = interp.stack_pop()
-        lcontainer = interp.stack_pop()
+        rcontainer = to_list(interp.stack_pop())
+        lcontainer = to_list(interp.stack_pop())
 
         if not lcontainer:
             lcontainer = []
@@ -1061,8 +1251,8 @@ class GlobalModule(Module):
     # ( larray rarray -- array )
     # ( lrecord rrecord -- record )
     def word_INTERSECTION(self, interp: IInterpreter):
-        rcontainer = interp.stack_pop()
-        lcontainer = interp.stack_pop()
+        rcontainer = to_list(interp.stack_pop())
+        lcontainer = to_list(interp.stack_pop())
 
         if not lcontainer:
             lcontainer = []
@@ -1087,8 +1277,8 @@ class GlobalModule(Module):
     # ( larray rarray -- array )
     # ( lrecord rrecord -- record )
     def word_UNION(self, interp: IInterpreter):
-        rcontainer = interp.stack_pop()
-        lcontainer = interp.stack_pop()
+        rcontainer = to_list(interp.stack_pop())
+        lcontainer = to_list(interp.stack_pop())
 
         if not lcontainer:
             lcontainer = []
@@ -1123,19 +1313,28 @@ class GlobalModule(Module):
             interp.stack_push(container)
             return
 
+        compiled = interp.compile_forthic(forthic)
+        item_function = interp.get_item_function(compiled)
         if isinstance(container, list):
             result: Any = []
-            for item in container:
-                interp.stack_push(item)
-                interp.run(forthic)
-                should_select = interp.stack_pop()
-                if should_select:
-                    result.append(item)
+            if item_function:
+                result = [item for item in container if item_function(item)]
+            else:
+                for item in container:
+                    interp.stack_push(item)
+                    compiled.execute(interp)
+                    should_select = interp.stack_pop()
+                    if should_select:
+                        result.append(item)
+        elif isinstance(container, LazySeq):
+            result = container.select(interp, compiled)
+        elif item_function:
+            result = {k: v for k, v in container.items() if item_function(v)}
         else:
             result = {}
             for k, v in container.items():
                 interp.stack_push(v)
-                interp.run(forthic)
+                compiled.execute(interp)
                 should_select = interp.stack_pop()
                 if should_select:
                     result[k] = v
@@ -1152,22 +1351,25 @@ class GlobalModule(Module):
             interp.stack_push(container)
             return
 
+        compiled = interp.compile_forthic(forthic)
         if isinstance(container, list):
             result: Any = []
             for i in range(len(container)):
                 item = container[i]
                 interp.stack_push(i)
                 interp.stack_push(item)
-                interp.run(forthic)
+                compiled.execute(interp)
                 should_select = interp.stack_pop()
                 if should_select:
                     result.append(item)
+        elif isinstance(container, LazySeq):
+            result = container.select(interp, compiled, with_index=True)
         else:
             result = {}
             for k, v in container.items():
                 interp.stack_push(k)
                 interp.stack_push(v)
-                interp.run(forthic)
+                compiled.execute(interp)
                 should_select = interp.stack_pop()
                 if should_select:
                     result[k] = v
@@ -1185,7 +1387,9 @@ class GlobalModule(Module):
 
         if isinstance(container, list):
             taken = container[:n]
-            rest = container[n:]
+            rest: Any = container[n:]
+        elif isinstance(container, LazySeq):
+            taken, rest = container.take(n)
         else:
             keys = sorted(list(container.keys()))
             taken_keys = keys[:n]
@@ -1206,7 +1410,9 @@ class GlobalModule(Module):
             container = []
 
         if isinstance(container, list):
-            rest = container[n:]
+            rest: Any = container[n:]
+        elif isinstance(container, LazySeq):
+            rest = container.drop(n)
         else:
             keys = sorted(list(container.keys()))
             rest_keys = keys[n:]
@@ -1217,7 +1423,7 @@ class GlobalModule(Module):
     # ( array -- array )
     # ( record -- record )
     def word_ROTATE(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             result = container
@@ -1235,7 +1441,7 @@ class GlobalModule(Module):
     # Moves element to front of array
     def word_ROTATE_ELEMENT(self, interp: IInterpreter):
         element = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -1254,7 +1460,7 @@ class GlobalModule(Module):
     # ( array -- array )
     # ( record -- record )
     def word_SHUFFLE(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -1270,7 +1476,7 @@ class GlobalModule(Module):
     # ( array -- array )
     # ( record -- record )
     def word_SORT(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -1286,16 +1492,17 @@ class GlobalModule(Module):
     # ( record forthic -- record )
     def word_SORT_w_FORTHIC(self, interp: IInterpreter):
         forthic = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
 
+        compiled = interp.compile_forthic(forthic)
         if isinstance(container, list):
 
             def forthic_func(val):
                 interp.stack_push(val)
-                interp.run(forthic)
+                compiled.execute(interp)
                 res = interp.stack_pop()
                 return res
 
@@ -1309,7 +1516,7 @@ class GlobalModule(Module):
     # ( record key_func -- record )
     def word_SORT_w_KEY_FUNC(self, interp: IInterpreter):
         key_func = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -1334,7 +1541,7 @@ class GlobalModule(Module):
     # ( record n -- value )
     def word_NTH(self, interp: IInterpreter):
         n = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if n is None or not container:
             interp.stack_push(None)
@@ -1356,7 +1563,7 @@ class GlobalModule(Module):
     # ( array -- item )
     # ( record -- value )
     def word_LAST(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             interp.stack_push(None)
@@ -1373,7 +1580,7 @@ class GlobalModule(Module):
 
     # ( array -- a1 a2 .. an )
     def word_UNPACK(self, interp: IInterpreter):
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -1389,7 +1596,7 @@ class GlobalModule(Module):
     # ( nested_arrays -- array )
     # ( nested_records -- record )
     def word_FLATTEN(self, interp: IInterpreter):
-        nested = interp.stack_pop()
+        nested = to_list(interp.stack_pop())
 
         if not nested:
             nested = []
@@ -1422,7 +1629,7 @@ class GlobalModule(Module):
     # ( record item -- key )
     def word_KEY_OF(self, interp: IInterpreter):
         item = interp.stack_pop()
-        container = interp.stack_pop()
+        container = to_list(interp.stack_pop())
 
         if not container:
             container = []
@@ -1451,21 +1658,42 @@ class GlobalModule(Module):
         if not container:
             container = []
 
-        if isinstance(container, list):
+        compiled = interp.compile_forthic(forthic)
+        if isinstance(container, (list, LazySeq)):
             interp.stack_push(initial)
             for item in container:
                 interp.stack_push(item)
-                interp.run(forthic)
+                compiled.execute(interp)
             result = interp.stack_pop()
         else:
             interp.stack_push(initial)
             for _, v in container.items():
                 interp.stack_push(v)
-                interp.run(forthic)
+                compiled.execute(interp)
             result = interp.stack_pop()
 
         interp.stack_push(result)
 
+    # ( array -- lazy )
+    def word_to_LAZY(self, interp: IInterpreter):
+        """Converts an array into a lazy sequence (see `LazySeq`)"""
+        items = interp.stack_pop()
+
+        if not items:
+            items = []
+
+        if not isinstance(items, (list, LazySeq)):
+            raise GlobalModuleError(f'>LAZY requires an array, not {type(items).__name__}')
+
+        result = items if isinstance(items, LazySeq) else LazySeq(items)
+        interp.stack_push(result)
+
+    # ( lazy -- array )
+    def word_to_LIST(self, interp: IInterpreter):
+        """Computes the items of a lazy sequence, returning them as an array. Other values are unchanged."""
+        items = to_list(interp.stack_pop())
+        interp.stack_push(items)
+
     # ( item -- )
     def word_POP(self, interp: IInterpreter):
         interp.stack_pop()
@@ -1487,7 +1715,7 @@ class GlobalModule(Module):
     # ( array_of_str -- str )
     def word_CONCAT(self, interp: IInterpreter):
         """Concatenates two strings"""
-        str2 = interp.stack_pop()
+        str2 = to_list(interp.stack_pop())
         array = None
         if isinstance(str2, list):
             array = str2
@@ -1669,6 +1897,7 @@ class GlobalModule(Module):
         child_items_forthic = interp.stack_pop()
         root = interp.stack_pop()
 
+        compiled = interp.compile_forthic(child_items_forthic)
         result = []
 
         def traverse(item, depth):
@@ -1680,7 +1909,7 @@ class GlobalModule(Module):
             }
             result.append(node_item)
             interp.stack_push(item)
-            interp.run(child_items_forthic)
+            compiled.execute(interp)
             children = interp.stack_pop()
             for c in children:
                 traverse(c, depth + 1)
@@ -1766,12 +1995,13 @@ class GlobalModule(Module):
     def word_l_REPEAT(self, interp: IInterpreter):
         num_times = interp.stack_pop()
         forthic = interp.stack_pop()
+        compiled = interp.compile_forthic(forthic)
         for _ in range(num_times):
             # Store item so we can push it back later
             item = interp.stack_pop()
             interp.stack_push(item)
 
-            interp.run(forthic)
+            compiled.execute(interp)
             res = interp.stack_pop()
 
             # Push original item and result
@@ -1797,7 +2027,7 @@ class GlobalModule(Module):
     # ( item -- json )
     def word_to_JSON(self, interp: IInterpreter):
         item = interp.stack_pop()
-        result = json.dumps(item)
+        result = json.dumps(item, default=json_default)
         interp.stack_push(result)
 
     # ( json -- item )
@@ -1871,6 +2101,7 @@ class GlobalModule(Module):
             top_of_stack = interp.stack[-1]
 
         if interp.dev_mode:
+            import pdb
             print(top_of_stack)
             pdb.set_trace()
         else:
@@ -1921,6 +2152,7 @@ class GlobalModule(Module):
         if isinstance(item, datetime.datetime):
             result = item
         else:
+            from dateutil import parser
             t = parser.parse(item)
             tz = self.timezone
             if t.tzinfo:
@@ -1952,17 +2184,7 @@ class GlobalModule(Module):
     # ( item -- date )
     def word_to_DATE(self, interp: IInterpreter):
         item = interp.stack_pop()
-
-        result = None
-        if not item:
-            result = None
-        elif isinstance(item, datetime.datetime):
-            result = item.date()
-        elif isinstance(item, datetime.date):
-            result = item
-        else:
-            result = parser.parse(item).date()
-        interp.stack_push(result)
+        interp.stack_push(to_date(item))
 
     # ( -- date )
     def word_TODAY(self, interp: IInterpreter):
@@ -2082,6 +2304,7 @@ class GlobalModule(Module):
             interp.stack_push(None)
             return
 
+        from dateutil import parser
         result = parser.parse(string)
         interp.stack_push(result)
 
@@ -2097,7 +2320,7 @@ class GlobalModule(Module):
     # ( [a1 a2...] -- sum )
     def word_plus(self, interp: IInterpreter):
         """Adds two numbers or an array of numbers"""
-        b = interp.stack_pop()
+        b = to_list(interp.stack_pop())
         result = 0
         if isinstance(b, list):
             for num in b:
@@ -2251,7 +2474,7 @@ class GlobalModule(Module):
     # ( a b -- bool )
     # ( [a1 a2...] -- bool )
     def word_OR(self, interp: IInterpreter):
-        b = interp.stack_pop()
+        b = to_list(interp.stack_pop())
         if isinstance(b, list):
             result = any(b)
         else:
@@ -2262,7 +2485,7 @@ class GlobalModule(Module):
     # ( a b -- bool )
     # ( [a1 a2...] -- bool )
     def word_AND(self, interp: IInterpreter):
-        b = interp.stack_pop()
+        b = to_list(interp.stack_pop())
         if isinstance(b, list):
             result = all(b)
         else:
@@ -2372,7 +2595,7 @@ class GlobalModule(Module):
     # ( val start_ranges -- index )
     def word_RANGE_INDEX(self, interp: IInterpreter):
         """Returns index of range that value falls into"""
-        start_ranges = interp.stack_pop()
+        start_ranges = to_list(interp.stack_pop())
         val = interp.stack_pop()
 
         # Cap off the value ranges with infinity
@@ -2398,6 +2621,14 @@ class GlobalModule(Module):
     def word_PROFILE_START(self, interp: IInterpreter):
         interp.start_profiling()
 
+    # ( -- )
+    def word_PROFILE_AGGREGATE_START(self, interp: IInterpreter):
+        interp.start_profiling(aggregate=True)
+
+    # ( -- )
+    def word_PROFILE_MEMORY_START(self, interp: IInterpreter):
+        interp.start_profiling(memory=True)
+
     # ( label -- )
     def word_PROFILE_TIMESTAMP(self, interp: IInterpreter):
         label = interp.stack_pop()
@@ -2407,11 +2638,46 @@ class GlobalModule(Module):
     def word_PROFILE_END(self, interp: IInterpreter):
         interp.stop_profiling()
         result = None
-        if interp.cur_word_profile:
-            interp.cur_word_profile = interp.cur_word_profile.get_parent()
+        if isinstance(interp.cur_word_profile, AggregateWordProfile):
+            result = ProfileAnalyzer(interp.cur_word_profile.get_root())
+        elif interp.cur_word_profile:
+            # The analyzer starts at the parent of PROFILE-END's profile. If PROFILE-END wasn't profiled (e.g., it's in a
+            # definition that was running when profiling started), it starts at the last completed profile instead.
+            parent = interp.cur_word_profile.get_parent()
+            if parent is not None:
+                interp.cur_word_profile = parent
             result = ProfileAnalyzer(interp.cur_word_profile)
         interp.stack_push(result)
 
+    # ( rate -- )
+    def word_PROFILE_SAMPLE_START(self, interp: IInterpreter):
+        rate = interp.stack_pop()
+        interp.start_sampling(rate)
+
+    # ( -- profiler )
+    def word_PROFILE_SAMPLE_END(self, interp: IInterpreter):
+        interp.stack_push(interp.stop_sampling())
+
+    # ( profiler -- folded )
+    def word_PROFILE_FOLDED(self, interp: IInterpreter):
+        profiler = interp.stack_pop()
+        result = profiler.folded() if profiler else ''
+        interp.stack_push(result)
+
+    # ( profiler -- json )
+    def word_PROFILE_SPEEDSCOPE(self, interp: IInterpreter):
+        profiler = interp.stack_pop()
+        result = json.dumps(profiler.speedscope()) if profiler else None
+        interp.stack_push(result)
+
+    # ( -- json )
+    def word_PROFILE_TRACE(self, interp: IInterpreter):
+        trace = interp.profile_trace
+        result = None
+        if trace:
+            result = json.dumps(trace.get_chrome_trace(interp.profile_timestamps()))
+        interp.stack_push(result)
+
     # ( -- data )
     def word_PROFILE_DATA(self, interp: IInterpreter):
         histogram = interp.word_histogram()
@@ -2473,6 +2739,50 @@ class GlobalModule(Module):
         interp.stack_push(result)
 
 
+def to_list(value):
+    """Returns the items of a lazy sequence as an array. Other values are unchanged.
+
+    Words that don't stream call this on the containers they pop so that they handle lazy sequences
+    the way they handle arrays.
+    """
+    if isinstance(value, LazySeq):
+        return value.to_list()
+    return value
+
+
+def json_default(value):
+    """Converts lazy sequences nested in values passed to `>JSON`"""
+    if isinstance(value, LazySeq):
+        return value.to_list()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def rec_at(rec, field):
+    """Returns the value of a record's field (or nested fields, if `field` is a list), or None"""
+    if not rec:
+        return None
+
+    if isinstance(field, list):
+        fields = field
+    else:
+        fields = [field]
+
+    return drill_for_value(rec, fields)
+
+
+def to_date(item):
+    """Converts a datetime, date, or date string to a date (or None if `item` is empty)"""
+    if not item:
+        return None
+    elif isinstance(item, datetime.datetime):
+        return item.date()
+    elif isinstance(item, datetime.date):
+        return item
+    else:
+        from dateutil import parser
+        return parser.parse(item).date()
+
+
 def drill_for_value(record, fields):
     """Descends into record using an array of fields, returning final value or None"""
     result = record
@@ -2484,10 +2794,10 @@ def drill_for_value(record, fields):
     return result
 
 
-def run_returning_error(interp, forthic):
+def run_returning_error(interp, compiled):
     result = None
     try:
-        interp.run(forthic)
+        compiled.execute(interp)
     except Exception as e:
         result = e
     return result
@@ -2502,26 +2812,86 @@ def foreach(interp, return_errors=False):
     if not container:
         container = []
 
-    if isinstance(container, list):
-        items = container
-        for i in range(len(items)):
-            item = items[i]
+    compiled = interp.compile_forthic(forthic)
+    if isinstance(container, (list, LazySeq)):
+        for item in container:
             interp.stack_push(item)
             if return_errors:
-                errors.append(run_returning_error(interp, forthic))
+                errors.append(run_returning_error(interp, compiled))
             else:
-                interp.run(forthic)
+                compiled.execute(interp)
     else:
         for _, item in container.items():
             interp.stack_push(item)
             if return_errors:
-                errors.append(run_returning_error(interp, forthic))
+                errors.append(run_returning_error(interp, compiled))
             else:
-                interp.run(forthic)
+                compiled.execute(interp)
 
     return errors
 
 
+def parallel_run(interp, compiled, items, return_errors=False):
+    """Helper to run PARALLEL-MAP and PARALLEL-FOREACH>ERRORS
+
+    Runs `compiled` for each item using a pool of up to `interp.parallel_workers` threads. Each run uses its
+    thread's interpreter (see `Interpreter.thread_interpreter`), starting with the item on an otherwise empty
+    stack, the caller's module stack, and forks of the caller's variable values and definitions, so variables set
+    and words defined by a run aren't seen by other runs or the caller (see `module.fork_variable_values` and
+    `Interpreter.fork_local_words`).
+
+    Returns the value each run leaves on top of the stack or, if `return_errors`, the error each run raised (or
+    None), in the order of `items`. Otherwise, the first error (in the order of `items`) is raised once running
+    items are done.
+    """
+    import concurrent.futures
+
+    module_stack = interp.module_stack[:]
+    variable_values = thread_variable_values()
+    local_words = interp.local_words
+
+    # Words run by workers are part of the caller's profiling run (except for aggregate runs, whose profiles
+    # can't be shared by threads)
+    word_profile = interp.cur_word_profile
+    is_profiling = interp.is_profiling and not isinstance(word_profile, AggregateWordProfile)
+
+    def run_compiled(thread_interp):
+        if return_errors:
+            return run_returning_error(thread_interp, compiled)
+        compiled.execute(thread_interp)
+        return thread_interp.stack_pop()
+
+    def run_item(item):
+        thread_interp = interp.thread_interpreter()
+        thread_interp.stack = [item]
+        thread_interp.module_stack = module_stack[:]
+        thread_interp.fork_local_words(local_words)
+        previous_values = fork_variable_values(variable_values)
+        try:
+            if not is_profiling:
+                return run_compiled(thread_interp)
+
+            thread_interp.join_profiling(word_profile, interp.profile_trace)
+            try:
+                return run_compiled(thread_interp)
+            finally:
+                thread_interp.stop_profiling()
+        finally:
+            set_thread_variable_values(previous_values)
+
+    num_workers = min(interp.parallel_workers, len(items))
+    if num_workers == 0:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        futures = [executor.submit(run_item, item) for item in items]
+        try:
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+
 def foreach_w_key(interp, return_errors=False):
     """Helper to run FOREACH-w/KEY and FOREACH-w/KEY>ERRORS"""
     forthic = interp.stack_pop()
@@ -2531,23 +2901,22 @@ def foreach_w_key(interp, return_errors=False):
     if not container:
         container = []
 
-    if isinstance(container, list):
-        items = container
-        for i in range(len(items)):
-            item = items[i]
+    compiled = interp.compile_forthic(forthic)
+    if isinstance(container, (list, LazySeq)):
+        for i, item in enumerate(container):
             interp.stack_push(i)
             interp.stack_push(item)
             if return_errors:
-                errors.append(run_returning_error(interp, forthic))
+                errors.append(run_returning_error(interp, compiled))
             else:
-                interp.run(forthic)
+                compiled.execute(interp)
     else:
         for k, item in container.items():
             interp.stack_push(k)
             interp.stack_push(item)
             if return_errors:
-                errors.append(run_returning_error(interp, forthic))
+                errors.append(run_returning_error(interp, compiled))
             else:
-                interp.run(forthic)
+                compiled.execute(interp)
 
     return errors
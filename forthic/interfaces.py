@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 
 class IWord:
@@ -13,6 +13,14 @@ class IWord:
         """
         pass
 
+    def clone(self, _memo: Dict[int, Any]) -> 'IWord':
+        """Returns the word to use in a cloned interpreter
+
+        Words are shared by clones unless they refer to modules or variables. `memo` maps the ids of original
+        objects to their clones.
+        """
+        return self
+
 
 class IModule:
     """Modules store Forthic words and variables"""
@@ -47,8 +55,17 @@ class IInterpreter:
         self.cur_module = None
         self.stack = None
 
+        # Names of screens being loaded, used to detect screens that load themselves
+        self.active_screens = None
+
+        # Max number of threads used by words like `PARALLEL-MAP`
+        self.parallel_workers = None
+
         # Profiling support
+        self.is_profiling = False
+        self.is_tracing = False   # True while profiling or sampling, so definitions run through the executor
         self.cur_word_profile = None
+        self.profile_trace = None
         self.profile_timestamps = None
         self.word_histogram = None
         self.dev_mode = None
@@ -57,10 +74,42 @@ class IInterpreter:
         """Runs a Forthic string in the context of the current module"""
         pass
 
+    def thread_interpreter(self) -> Any:
+        """Returns the interpreter that runs Forthic for the current thread"""
+        pass
+
+    def process_map(self, string: str, items: List[Any]) -> Any:
+        """Runs a Forthic string for each item in worker processes, returning the results in order"""
+        pass
+
+    def compile_forthic(self, string: str) -> Any:
+        """Compiles a Forthic string into a word that can be executed repeatedly in the current module"""
+        pass
+
+    def get_item_function(self, compiled: IWord) -> Optional[Callable[[Any], Any]]:
+        """Returns a Python function equivalent to executing a compiled Forthic string with an item on the stack"""
+        pass
+
     def run_in_module(self, module: IModule, string: str):
         """Runs a Forthic string in the context of the specified `module`"""
         pass
 
+    def find_module_word(self, module: IModule, name: str) -> Optional[IWord]:
+        """Returns a module's word, including words the current thread defined in it"""
+        pass
+
+    def add_definition(self, module: IModule, word: IWord) -> None:
+        """Adds a word defined in Forthic to a module"""
+        pass
+
+    def is_owner_thread(self) -> Any:
+        """Returns True if the current thread created the interpreter"""
+        pass
+
+    def execute_definition(self, definition: IWord) -> None:
+        """Executes the words of a Forthic definition in order"""
+        pass
+
     def stack_push(self, value: Any):
         """Pushes a value onto the parameter `stack`"""
         pass
@@ -81,10 +130,14 @@ class IInterpreter:
         """Searches interpreter for a module registered under `name`"""
         pass
 
-    def start_profiling(self) -> None:
+    def start_profiling(self, aggregate: bool = False, memory: bool = False) -> None:
         """Initializes interpreter profiling data to start a profiling run"""
         pass
 
+    def join_profiling(self, word_profile: Any, trace: Any) -> None:
+        """Profiles words run by the current thread as part of another thread's profiling run"""
+        pass
+
     def add_timestamp(self, label: str) -> None:
         """Adds a labeled timestamp during a profiling run"""
         pass
@@ -93,6 +146,14 @@ class IInterpreter:
         """Stops a profiling run and returns interpreter to normal mode"""
         pass
 
+    def start_sampling(self, rate: Optional[float] = None) -> None:
+        """Starts sampling the Forthic call stack of the current thread `rate` times per second"""
+        pass
+
+    def stop_sampling(self) -> Any:
+        """Stops sampling the current thread, returning its SamplingProfiler"""
+        pass
+
     def count_word(self, w: IWord) -> None:
         """Increments count of a word's execution during a profiling run"""
         pass
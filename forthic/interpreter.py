@@ -1,4 +1,7 @@
+import os
 import time
+import threading
+import tracemalloc
 import operator
 import pytz
 import collections
@@ -15,18 +18,110 @@ from .tokens import (
     EOSToken,
     Token,
 )
-from .tokenizer import Tokenizer
-
-from .module import Module, Word, PushValueWord
-from .global_module import GlobalModule
-from .profile import WordProfile
+from .tokenizer import FastTokenizer, TokenizerError
+from .code_cache import CodeCache
+
+from .module import (
+    Module,
+    Word,
+    PushValueWord,
+    ModuleWord,
+    Variable,
+    dictionary_generation,
+    set_thread_variable_values,
+    shallow_copy,
+    thread_variable_values,
+)
+from .global_module import GlobalModule, IMMUTABLE_LITERAL_TYPES, drill_for_value
+from .profile import (
+    AggregateWordProfile,
+    Profile,
+    ProfileTrace,
+    WordProfile,
+    end_memory_profile,
+    set_active_trace,
+    start_memory_profile,
+)
+from .item_functions import ItemFunction, compile_item_function
+from .word_metrics import WordMetrics
 from .interfaces import IInterpreter, IModule, IWord
-from typing import List, Any, Dict, Optional
+from typing import Callable, List, Any, Dict, Optional, Set, Tuple, Type, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .sampling_profiler import SamplingProfiler
+
+
+# Max number of compiled Forthic strings kept by an interpreter
+COMPILED_FORTHIC_CACHE_SIZE = 256
+
+# Max number of resolved words kept by an interpreter before its word cache is cleared
+WORD_CACHE_SIZE = 4096
+
+# Set FORTHIC_VM=1 to run definitions with the bytecode VM by default (e.g., to run the test suite in VM mode)
+DEFAULT_VM_MODE = os.environ.get('FORTHIC_VM') == '1'
+
+# Set FORTHIC_CODEGEN=1 to compile definitions into generated Python functions by default
+DEFAULT_CODEGEN_MODE = os.environ.get('FORTHIC_CODEGEN') == '1'
+
+# Default number of threads used by words like `PARALLEL-MAP`
+DEFAULT_PARALLEL_WORKERS = 8
+
+# Default number of samples per second taken by `PROFILE-SAMPLE-START` (see `SamplingProfiler`)
+DEFAULT_SAMPLE_RATE = 100
+
+# Opcodes for definitions compiled into flat instruction lists (see `Interpreter.execute_definition_vm`)
+OP_PUSH = 0
+OP_CALL_NATIVE = 1
+OP_CALL_DEFINITION = 2
+OP_ENTER_MODULE = 3
+OP_EXIT_MODULE = 4
+OP_BUILD_ARRAY = 5
+
+Instruction = Tuple[int, Any]
+
+# Global words whose runs are fused by `Interpreter.fuse_stack_shuffles`
+SHUFFLE_WORD_NAMES = ('SWAP', 'DUP', 'POP')
+
+# Attributes that change while Forthic runs. Each thread that runs an interpreter has its own (see
+# `ThreadInterpreter`).
+EXECUTION_STATE_ATTRIBUTES = (
+    'stack',
+    'module_stack',
+    'is_compiling',
+    'cur_definition',
+    'active_screens',
+    'compiled_forthic_cache',
+    'word_cache',
+    'word_cache_generation',
+    'local_words',
+    'token_handlers',
+    'word_counts',
+    'is_profiling',
+    'start_profile_time',
+    'timestamps',
+    'cur_word_profile',
+    'profile_trace',
+    'profile_memory',
+    'stops_tracemalloc',
+    'sampling_profiler',
+    'sampled_frames',
+    'is_tracing',
+    'definition_executor',
+)
 
 
 # ----- Errors -----------------------------------------------------------------------------------------------
 class InterpreterError(RuntimeError):
-    pass
+    def __reduce__(self):
+        # Subclasses take different arguments than their messages, so errors are unpickled (e.g., when raised in
+        # `PROCESS-MAP` workers) from their `args` rather than by calling their constructors
+        return rebuild_error, (self.__class__, self.args), self.__dict__
+
+
+def rebuild_error(error_class: Type[BaseException], args: Tuple) -> BaseException:
+    result = error_class.__new__(error_class)
+    result.args = args
+    return result
 
 
 class UnknownModuleError(InterpreterError):
@@ -54,6 +149,11 @@ class UnknownWordError(InterpreterError):
         super().__init__(f"Unknown word: '{word_name}'")
 
 
+class CompileForthicError(InterpreterError):
+    """Raised when a Forthic string can't be compiled ahead of execution"""
+    pass
+
+
 # ----- Word Types -------------------------------------------------------------------------------------------
 class EndArrayWord(Word):
     """This represents the end of an array"""
@@ -70,6 +170,67 @@ class EndArrayWord(Word):
         interp.stack_push(items)
 
 
+class ConstantWord(Word):
+    """This pushes a copy of a constant array or record that was built when a definition was optimized
+
+    Each execution pushes a fresh copy so words that modify arrays and records in place can't change the
+    constant. Copying a prebuilt value is much cheaper than rebuilding it from literals.
+    """
+    def __init__(self, value: Any):
+        super().__init__('<constant>')
+        self.value = value
+        values = value.values() if isinstance(value, dict) else value
+        self.is_flat = all(isinstance(v, IMMUTABLE_LITERAL_TYPES) for v in values)
+
+    def execute(self, interp: IInterpreter) -> None:
+        if self.is_flat:
+            interp.stack_push(self.value.copy())
+        else:
+            interp.stack_push(copy_constant(self.value))
+
+
+class RecordFieldWord(Word):
+    """This is the fusion of a constant field (or list of fields) followed by `REC@`"""
+    def __init__(self, fields: List[Any]):
+        super().__init__('<rec_field>')
+        self.fields = fields
+        self.field = fields[0] if len(fields) == 1 else None
+
+    def execute(self, interp: IInterpreter) -> None:
+        stack = interp.stack
+        rec = stack.pop()
+        if not rec:
+            stack.append(None)
+        elif self.field is not None:
+            stack.append(rec.get(self.field))
+        else:
+            stack.append(drill_for_value(rec, self.fields))
+
+
+class StackShuffleWord(Word):
+    """This is the fusion of a run of `SWAP`, `DUP`, and `POP` words
+
+    The top `depth` items of the stack are replaced by the items at `indexes` (relative to the bottom of those
+    items). Runs that cancel out (e.g., `SWAP SWAP`) only check that the stack has `depth` items, so they fail
+    on short stacks just like the words they replaced.
+    """
+    def __init__(self, depth: int, indexes: List[int]):
+        super().__init__('<stack_shuffle>')
+        self.depth = depth
+        self.indexes = indexes
+        self.is_identity = indexes == list(range(depth))
+
+    def execute(self, interp: IInterpreter) -> None:
+        stack = interp.stack
+        if len(stack) < self.depth:
+            raise IndexError('pop from empty list')
+        if self.is_identity:
+            return
+        items = stack[-self.depth:]
+        del stack[-self.depth:]
+        stack.extend([items[i] for i in self.indexes])
+
+
 class DefinitionWord(Word):
     """This represents a word that is defined from other words
 
@@ -83,16 +244,105 @@ class DefinitionWord(Word):
     def __init__(self, name: str):
         super().__init__(name)
         self.words: List[IWord] = []
+        self.instructions: Optional[List[Instruction]] = None
+
+        # Number of words before the definition was optimized (see `Interpreter.optimize_definition`)
+        self.num_unoptimized_words: Optional[int] = None
+
+        # Set by `compile_function` if the definition can be compiled into a Python function
+        self.function: Optional[Callable[[IInterpreter], None]] = None
+        self.is_function_compiled: bool = False
 
     def add_word(self, word: IWord):
         """Adds a new word to the definition"""
         self.words.append(word)
+        self.instructions = None
+        self.function = None
+        self.is_function_compiled = False
+
+    def get_instructions(self) -> List[Instruction]:
+        """Returns the definition's words compiled into instructions for the bytecode VM"""
+        if self.instructions is None:
+            self.instructions = [compile_instruction(w) for w in self.words]
+        return self.instructions
+
+    def compile_function(self) -> bool:
+        """Compiles the definition into a generated Python function that's used whenever it's executed
+
+        Returns False if the definition can't be compiled (e.g., because it changes the module stack).
+        """
+        if not self.is_function_compiled:
+            self.function = generate_function(self.name, self.words)
+            self.is_function_compiled = True
+        return self.function is not None
+
+    def clone(self, memo: Dict[int, Any]) -> IWord:
+        if id(self) in memo:
+            return memo[id(self)]
+
+        words = [w.clone(memo) for w in self.words]
+        if all(w is c for w, c in zip(self.words, words)):
+            result = self
+        else:
+            result = DefinitionWord(self.name)
+            result.words = words
+            result.num_unoptimized_words = self.num_unoptimized_words
+        memo[id(self)] = result
+        return result
+
+    def execute(self, interp: IInterpreter) -> None:
+        function = self.function
+        if function is not None and not interp.is_tracing:
+            function(interp)
+        else:
+            interp.execute_definition(self)
+
+
+class CompiledForthicWord(Word):
+    """This represents a Forthic string that has been compiled into a list of words
+
+    Words like `MAP` and `SELECT` run the same Forthic string once per item. Compiling the string up front
+    means each run only executes pre-resolved words instead of re-tokenizing the string and looking up each
+    word again.
+
+    If a string can't be compiled (e.g., it defines words, refers to words that don't exist until it runs, or
+    has literals with mutable values), `words` is None and the string is run normally. The string is also run
+    normally if any module's words or variables have changed since it was compiled, or during a profiling run so
+    word counts are unchanged.
+
+    Strings that map an item to a value using only simple global words (e.g., `'Status' REC@ 'Open' ==`) can also
+    be compiled into Python functions (see `get_item_function`).
+    """
+    def __init__(self, forthic: str, words: Optional[List[IWord]], generation: int):
+        super().__init__(forthic)
+        self.forthic = forthic
+        self.words = words
+        self.generation = generation
+
+        # (True, function) once `get_item_function` has compiled the words (function is None if it couldn't)
+        self.item_function: Tuple[bool, Optional[ItemFunction]] = (False, None)
+
+    def get_item_function(self) -> Optional[ItemFunction]:
+        """Returns a Python function that's equivalent to executing the words with an item on the stack, or None
+
+        See `item_functions.compile_item_function`.
+        """
+        if self.words is None or self.generation != dictionary_generation():
+            return None
+
+        is_compiled, result = self.item_function
+        if not is_compiled:
+            result = compile_item_function(self.words)
+            self.item_function = (True, result)
+        return result
 
     def execute(self, interp: IInterpreter) -> None:
+        if self.words is None or self.generation != dictionary_generation() or interp.is_profiling:
+            interp.run(self.forthic)
+            return
+
         for w in self.words:
-            interp.start_profile_word(w)
             w.execute(interp)
-            interp.end_profile_word()
 
 
 class StartModuleWord(Word):
@@ -103,12 +353,36 @@ class StartModuleWord(Word):
     def __init__(self, name: str):
         super().__init__(name)
 
+        # (parent module, dictionary generation, module) for the module found the last time this word was
+        # executed. This is valid until any module changes (see `dictionary_generation`). It's a single tuple so
+        # threads sharing the word never see a partially updated cache.
+        self.module_cache: Optional[Tuple[IModule, int, IModule]] = None
+
     def execute(self, interp: IInterpreter) -> None:
         # The app module is the only module with a blank name
         if self.name == '':
             interp.module_stack_push(interp.app_module)
             return
 
+        parent_module = interp.cur_module()
+        module_cache = self.module_cache
+        if module_cache and module_cache[0] is parent_module and module_cache[1] == dictionary_generation():
+            interp.module_stack_push(module_cache[2])
+            return
+
+        module = self.find_module(interp)
+        self.module_cache = (parent_module, dictionary_generation(), module)
+        interp.module_stack_push(module)
+
+    def clone(self, memo: Dict[int, Any]) -> IWord:
+        # The cached module belongs to the original interpreter
+        result = memo.get(id(self))
+        if result is None:
+            result = StartModuleWord(self.name)
+            memo[id(self)] = result
+        return result
+
+    def find_module(self, interp: IInterpreter) -> IModule:
         # If the module is used by the current module, push it onto the module stack;
         # otherwise, create a new module and push that onto the module stack.
         module = interp.cur_module().find_module(self.name)
@@ -120,8 +394,7 @@ class StartModuleWord(Word):
         if not module:
             module = Module(self.name, interp)
             interp.cur_module().register_module(module.name, module)
-
-        interp.module_stack_push(module)
+        return module
 
 
 class EndModuleWord(Word):
@@ -132,6 +405,124 @@ class EndModuleWord(Word):
         interp.module_stack_pop()
 
 
+def compile_instruction(word: IWord) -> Instruction:
+    """Converts a word into an (opcode, argument) instruction for the bytecode VM
+
+    Only words whose behavior the VM knows exactly are given special opcodes. Everything else (including
+    subclasses of those words) is called natively.
+    """
+    word_type = type(word)
+    if word_type is PushValueWord:
+        return (OP_PUSH, word.value)   # type: ignore
+    elif word_type is DefinitionWord:
+        return (OP_CALL_DEFINITION, word)
+    elif word_type is StartModuleWord:
+        return (OP_ENTER_MODULE, word)
+    elif word_type is EndModuleWord:
+        return (OP_EXIT_MODULE, None)
+    elif word_type is EndArrayWord:
+        return (OP_BUILD_ARRAY, None)
+    return (OP_CALL_NATIVE, word)
+
+
+def copy_constant(value: Any) -> Any:
+    """Returns a copy of a constant, copying any nested arrays and records"""
+    if isinstance(value, list):
+        return [copy_constant(v) for v in value]
+    elif isinstance(value, dict):
+        return {k: copy_constant(v) for k, v in value.items()}
+    return value
+
+
+def is_constant_word(word: IWord) -> bool:
+    """Returns True if a word always pushes the same immutable literal or constant"""
+    if type(word) is PushValueWord:
+        return isinstance(word.value, IMMUTABLE_LITERAL_TYPES)   # type: ignore
+    return type(word) is ConstantWord
+
+
+def is_mutable_literal(word: IWord) -> bool:
+    """Returns True if a word pushes a literal (e.g., from a custom literal handler) that words could change
+
+    Literal tokens are converted into new values each time they're run, so these words can't be reused.
+    """
+    if type(word) is not PushValueWord:
+        return False
+    return not isinstance(word.value, IMMUTABLE_LITERAL_TYPES) and not isinstance(word.value, Variable)   # type: ignore
+
+
+def shuffle_indexes(names: List[str]) -> Tuple[int, List[int]]:
+    """Returns the (depth, indexes) of a `StackShuffleWord` equivalent to a run of SWAP/DUP/POP words"""
+    # Items are represented by their position below the top of the original stack (-1 is the top)
+    items: List[int] = []
+    depth = 0
+
+    def pop() -> int:
+        nonlocal depth
+        if items:
+            return items.pop()
+        depth += 1
+        return -depth
+
+    for name in names:
+        if name == 'SWAP':
+            b = pop()
+            a = pop()
+            items += [b, a]
+        elif name == 'DUP':
+            a = pop()
+            items += [a, a]
+        elif name == 'POP':
+            pop()
+    return depth, [depth + i for i in items]
+
+
+def build_array(stack: List[Any]) -> None:
+    """Replaces the items on the stack down to the most recent start array token with a list of those items"""
+    items: List[Any] = []
+    item = stack.pop()
+    while not isinstance(item, StartArrayToken):
+        items.append(item)
+        item = stack.pop()
+    items.reverse()
+    stack.append(items)
+
+
+def generate_function(name: str, words: List[IWord]) -> Optional[Callable[[IInterpreter], None]]:
+    """Generates a Python function that executes `words` in order, or returns None if they can't be compiled
+
+    The generated function is straight-line code: values are appended directly to the interpreter stack and
+    the handlers of Python-defined words are called directly, so there are no per-word `execute` calls. Handlers
+    are looked up when they're called, since they may be replaced (e.g., by `enable_word_metrics`). Definitions
+    that change the module stack (i.e., that contain `{module ... }` blocks) aren't compiled.
+    """
+    namespace: Dict[str, Any] = {'build_array': build_array}
+    lines = [
+        'def definition(interp):',
+        '    stack = interp.stack',
+        '    push = stack.append',
+    ]
+    for i, word in enumerate(words):
+        word_type = type(word)
+        if word_type is StartModuleWord or word_type is EndModuleWord:
+            return None
+        elif word_type is PushValueWord:
+            namespace[f'v{i}'] = word.value   # type: ignore
+            lines.append(f'    push(v{i})')
+        elif word_type is ModuleWord:
+            namespace[f'w{i}'] = word
+            lines.append(f'    w{i}.handler(interp)')
+        elif word_type is EndArrayWord:
+            lines.append('    build_array(stack)')
+        else:
+            namespace[f'w{i}'] = word
+            lines.append(f'    w{i}.execute(interp)')
+
+    code = compile('\n'.join(lines), f'<forthic definition {name}>', 'exec')
+    exec(code, namespace)
+    return namespace['definition']
+
+
 class AppModule(Module):
     """The AppModule contains the words and variables of a Forthic application
 
@@ -150,53 +541,367 @@ class AppModule(Module):
         return self.screens[name]
 
 
+class InterpreterSettings:
+    """Settings that are shared by an interpreter and its thread interpreters"""
+    def __init__(self, vm_mode: bool, codegen_mode: bool):
+        self.dev_mode: bool = False
+        self.vm_mode: bool = vm_mode
+        self.codegen_mode: bool = codegen_mode
+
+        # If True, definitions are optimized when they're finished (see `Interpreter.optimize_definition`)
+        self.optimize_definitions: bool = True
+
+        # If set, module code and screens are tokenized using this cache (see `Interpreter.run_code`)
+        self.code_cache: Optional[CodeCache] = None
+
+        # Max number of threads used by words like `PARALLEL-MAP`
+        self.parallel_workers: int = DEFAULT_PARALLEL_WORKERS
+
+        # Number of worker processes used by `PROCESS-MAP` (None for one per CPU), and Forthic that workers run
+        # after registering modules (see `process_pool.WorkerSpec`)
+        self.process_workers: Optional[int] = None
+        self.process_setup: str = ''
+
+        # Latency histograms of Python words, if enabled (see `Interpreter.enable_word_metrics`)
+        self.word_metrics: Optional[WordMetrics] = None
+
+
+def thread_attribute(name: str) -> Any:
+    """Returns a property for an execution state attribute, which is stored by the current thread's interpreter"""
+    return property(
+        lambda self: getattr(self.thread_interpreter(), name),
+        lambda self, value: setattr(self.thread_interpreter(), name, value),
+    )
+
+
 class Interpreter(IInterpreter):
     """Interprets Forthic strings
 
     Modules may be registered with an Interpreter to provide more functionality.
+
+    An interpreter may be shared by many threads once its modules are registered. Its modules and settings are
+    shared, but each thread runs Forthic with its own `ThreadInterpreter`, which has its own stacks, caches, and
+    profiling state. The execution state attributes of an interpreter (e.g., `stack`) refer to those of the
+    current thread. Changing the VM or codegen mode only affects the current thread and threads that haven't used
+    the interpreter yet.
+
+    Threads see the words and variable values set up by the thread that created the interpreter, but words they
+    define and variables they set are their own (see `add_definition` and `module.Variable`). Variable values set
+    by other threads only last for a `run`.
     """
-    def __init__(self, timezone=None):
+    stack = thread_attribute('stack')
+    module_stack = thread_attribute('module_stack')
+    is_compiling = thread_attribute('is_compiling')
+    cur_definition = thread_attribute('cur_definition')
+    active_screens = thread_attribute('active_screens')
+    compiled_forthic_cache = thread_attribute('compiled_forthic_cache')
+    word_cache = thread_attribute('word_cache')
+    word_cache_generation = thread_attribute('word_cache_generation')
+    local_words = thread_attribute('local_words')
+    token_handlers = thread_attribute('token_handlers')
+    word_counts = thread_attribute('word_counts')
+    is_profiling = thread_attribute('is_profiling')
+    start_profile_time = thread_attribute('start_profile_time')
+    timestamps = thread_attribute('timestamps')
+    cur_word_profile = thread_attribute('cur_word_profile')
+    profile_trace = thread_attribute('profile_trace')
+    profile_memory = thread_attribute('profile_memory')
+    stops_tracemalloc = thread_attribute('stops_tracemalloc')
+    sampling_profiler = thread_attribute('sampling_profiler')
+    sampled_frames = thread_attribute('sampled_frames')
+    is_tracing = thread_attribute('is_tracing')
+    definition_executor = thread_attribute('definition_executor')
+
+    def __init__(self, timezone=None, vm_mode=DEFAULT_VM_MODE, codegen_mode=DEFAULT_CODEGEN_MODE):
         if not timezone:
             timezone = pytz.timezone('US/Pacific')
         self.timezone = timezone
-        self.stack: List[Any] = []
         self.global_module = GlobalModule(self, self.timezone)
         self.app_module = AppModule(self)
-        self.module_stack: List[IModule] = [self.app_module]
         self.registered_modules: Dict[str, Module] = {}
-        self.is_compiling: bool = False
-        self.cur_definition: Optional[DefinitionWord] = None
-        self._dev_mode: bool = False
+        self.settings = InterpreterSettings(vm_mode, codegen_mode)
+        self.init_execution_state()
 
-        # Profiling support
-        self.word_counts: Dict[IWord, int] = collections.defaultdict(int)
-        self.is_profiling: bool = False
-        self.start_profile_time: Optional[float] = None
-        self.timestamps: List[Any] = []
-        self.cur_word_profile: WordProfile = None
+    def init_execution_state(self) -> None:
+        """Sets up the execution state of a new (or newly cloned) interpreter
+
+        Each thread gets its own `ThreadInterpreter` the first time it uses the interpreter. Words defined by
+        threads other than this one are only seen by the threads that defined them (see `add_definition`).
+        """
+        self.thread_interpreters = threading.local()
+        self.owner_thread_id = threading.get_ident()
+
+    def is_owner_thread(self) -> bool:
+        """Returns True if the current thread created the interpreter (and so can change shared state)"""
+        return threading.get_ident() == self.owner_thread_id
+
+    def thread_interpreter(self) -> 'ThreadInterpreter':
+        """Returns the interpreter that runs Forthic for the current thread"""
+        thread_interpreters = self.thread_interpreters
+        try:
+            return thread_interpreters.interpreter
+        except AttributeError:
+            result = ThreadInterpreter(self)
+            thread_interpreters.interpreter = result
+            return result
+
+    def clone(self) -> 'Interpreter':
+        """Returns an interpreter with the same words, modules, and variable values as this one
+
+        This lets an application build and initialize an interpreter once and then hand out a clone for each
+        request. Clones share the global module and any words that don't refer to variables or modules. Each
+        clone has its own stacks and its own copies of modules and variables, so changes made by a clone
+        don't affect the original or other clones.
+        """
+        if self.is_compiling:
+            raise InterpreterError("Can't clone an interpreter while it's compiling a definition")
+
+        result = Interpreter.__new__(Interpreter)
+        result.__dict__.update(self.__dict__)
+        result.settings = shallow_copy(self.settings)
+
+        # The global module is shared, so its words are too
+        memo: Dict[int, Any] = {id(self): result, id(self.global_module): self.global_module}
+        result.app_module = self.app_module.clone(memo)
+        result.registered_modules = {name: m.clone(memo) for name, m in self.registered_modules.items()}
+        result.init_execution_state()
+        return result
 
     @property
     def dev_mode(self) -> bool:
         """This is used to indicate that things like debugging are ok"""
-        return self._dev_mode
+        return self.settings.dev_mode
 
     @dev_mode.setter
     def dev_mode(self, dev_mode: bool):
-        self._dev_mode = dev_mode
+        self.settings.dev_mode = dev_mode
+
+    @property
+    def vm_mode(self) -> bool:
+        """If True, definitions are run by a bytecode VM instead of by nested `execute` calls"""
+        return self.settings.vm_mode
+
+    @vm_mode.setter
+    def vm_mode(self, vm_mode: bool):
+        self.settings.vm_mode = vm_mode
+        self.thread_interpreter().update_definition_executor()
+
+    @property
+    def codegen_mode(self) -> bool:
+        """If True, definitions are compiled into generated Python functions the first time they're executed"""
+        return self.settings.codegen_mode
+
+    @codegen_mode.setter
+    def codegen_mode(self, codegen_mode: bool):
+        self.settings.codegen_mode = codegen_mode
+        self.thread_interpreter().update_definition_executor()
+
+    @property
+    def optimize_definitions(self) -> bool:
+        """If True, definitions are optimized when they're finished (see `optimize_definition`)"""
+        return self.settings.optimize_definitions
+
+    @optimize_definitions.setter
+    def optimize_definitions(self, optimize_definitions: bool):
+        self.settings.optimize_definitions = optimize_definitions
+
+    @property
+    def code_cache(self) -> Optional[CodeCache]:
+        """If set, module code and screens are tokenized using this cache (see `run_code`)"""
+        return self.settings.code_cache
+
+    @code_cache.setter
+    def code_cache(self, code_cache: Optional[CodeCache]):
+        self.settings.code_cache = code_cache
+
+    @property
+    def parallel_workers(self) -> int:
+        """Max number of threads used by words like `PARALLEL-MAP`"""
+        return self.settings.parallel_workers
+
+    @parallel_workers.setter
+    def parallel_workers(self, parallel_workers: int):
+        self.settings.parallel_workers = parallel_workers
+
+    @property
+    def process_workers(self) -> int:
+        """Number of worker processes used by `PROCESS-MAP` (one per CPU by default)"""
+        return self.settings.process_workers or os.cpu_count() or 1
+
+    @process_workers.setter
+    def process_workers(self, process_workers: Optional[int]):
+        self.settings.process_workers = process_workers
+
+    @property
+    def process_setup(self) -> str:
+        """Forthic run by `PROCESS-MAP` workers after registering this interpreter's modules and screens
+
+        For example, "['jira'] USE-MODULES  'helpers' LOAD-SCREEN"
+        """
+        return self.settings.process_setup
+
+    @process_setup.setter
+    def process_setup(self, process_setup: str):
+        self.settings.process_setup = process_setup
+
+    def update_definition_executor(self) -> None:
+        """Switches the definition executor when profiling or sampling starts or stops, or the VM or codegen modes
+        change
+        """
+        if self.is_profiling:
+            self.definition_executor = self.execute_definition_profiled
+        elif self.sampled_frames is not None:
+            self.definition_executor = self.execute_definition_sampled
+        else:
+            self.definition_executor = self.unprofiled_executor()
+
+        # Definitions compiled into Python functions only use the executor while profiling or sampling
+        self.is_tracing = self.is_profiling or self.sampled_frames is not None
+
+    def unprofiled_executor(self) -> Callable[[Any], None]:
+        settings = self.settings
+        if settings.codegen_mode:
+            return self.execute_definition_codegen
+        if settings.vm_mode:
+            return self.execute_definition_vm
+        return self.execute_definition_unprofiled
 
     def run(self, string: str) -> None:
-        """Interprets a Forthic string, executing words one-at-a-time until the end of the string"""
-        tokenizer = Tokenizer(string)
+        """Interprets a Forthic string, executing words one-at-a-time until the end of the string
+
+        Runs on threads other than the one that created the interpreter set their own variable values, which are
+        dropped when the run finishes (see `module.Variable`). Words that run Forthic are part of the same run.
+        """
+        thread_interp = self.thread_interpreter()
+        if thread_interp.local_words is not None and thread_variable_values() is None:
+            set_thread_variable_values({})
+            try:
+                thread_interp.run(string)
+            finally:
+                set_thread_variable_values(None)
+            return
+
+        handle_token = thread_interp.handle_token
+        tokenizer = FastTokenizer(string)
         token = tokenizer.next_token()
         while not isinstance(token, EOSToken):
-            self.handle_token(token)
+            handle_token(token)
             token = tokenizer.next_token()
 
+    def run_code(self, string: str) -> None:
+        """Runs module code or a screen, using the `code_cache` (if any) so the code isn't re-tokenized"""
+        tokens = self.code_cache.get_tokens(string) if self.code_cache else None
+        if tokens is None:
+            self.run(string)
+            return
+
+        handle_token = self.thread_interpreter().handle_token
+        for token in tokens:
+            handle_token(token)
+
+    def process_map(self, string: str, items: List[Any]) -> List[Any]:
+        """Runs a Forthic string for each item in worker processes, returning the results in order
+
+        Each worker has an interpreter with this interpreter's registered modules and screens, set up by running
+        `process_setup`. Items run in the worker's app module. See `process_pool.process_map`.
+        """
+        # NOTE: Imported here since process_pool imports this module (and concurrent.futures is slow to import)
+        from .process_pool import process_map
+        return process_map(self, string, items)
+
+    def compile_forthic(self, string: str) -> IWord:
+        """Compiles a Forthic string into a word that can be executed repeatedly in the current module
+
+        Compiled strings are cached by string and module stack until any module's words or variables change.
+        """
+        if self.is_compiling or not isinstance(string, str):
+            return CompiledForthicWord(string, None, dictionary_generation())
+
+        key = (string, tuple(self.module_stack))
+        generation = dictionary_generation()
+        cached = self.compiled_forthic_cache.get(key)
+        if cached and cached[0] == generation:
+            self.compiled_forthic_cache.move_to_end(key)
+            return cached[1]
+
+        result = CompiledForthicWord(string, self.compile_words(string), generation)
+        self.compiled_forthic_cache[key] = (generation, result)
+        self.compiled_forthic_cache.move_to_end(key)
+        if len(self.compiled_forthic_cache) > COMPILED_FORTHIC_CACHE_SIZE:
+            self.compiled_forthic_cache.popitem(last=False)
+        return result
+
+    def get_item_function(self, compiled: IWord) -> Optional[ItemFunction]:
+        """Returns a Python function equivalent to executing a compiled Forthic string with an item on the stack
+
+        The function returns the value the string would leave on the stack. Returns None if the string can't be
+        compiled into a function, or during a profiling run so word counts are unchanged.
+        """
+        if self.is_profiling or not isinstance(compiled, CompiledForthicWord):
+            return None
+        return compiled.get_item_function()
+
+    def compile_words(self, string: str) -> Optional[List[IWord]]:
+        """Returns the words a Forthic string would execute, or None if they can't be determined ahead of time"""
+        module_stack = self.module_stack[:]
+        result: List[IWord] = []
+        try:
+            tokenizer = FastTokenizer(string)
+            token = tokenizer.next_token()
+            while not isinstance(token, EOSToken):
+                word = self.compile_token(token, len(module_stack))
+                if word:
+                    result.append(word)
+                token = tokenizer.next_token()
+
+            if len(self.module_stack) != len(module_stack):
+                raise CompileForthicError('Unbalanced module')
+        except (TokenizerError, InterpreterError):
+            return None
+        finally:
+            self.module_stack[:] = module_stack
+        return result
+
+    def compile_token(self, token: Token, min_module_depth: int) -> Optional[IWord]:
+        """Converts a token into the word it would execute
+
+        Like definitions, start/end module words are executed as they're compiled so lookups work.
+        """
+        if isinstance(token, StringToken):
+            return PushValueWord('<string>', token.string)
+        elif isinstance(token, CommentToken):
+            return None
+        elif isinstance(token, StartArrayToken):
+            return PushValueWord('<start_array_token>', token)
+        elif isinstance(token, EndArrayToken):
+            return EndArrayWord()
+        elif isinstance(token, StartModuleToken):
+            word: IWord = StartModuleWord(token.name)
+            word.execute(self)
+            return word
+        elif isinstance(token, EndModuleToken):
+            if len(self.module_stack) <= min_module_depth:
+                raise CompileForthicError('Unbalanced module')
+            word = EndModuleWord()
+            word.execute(self)
+            return word
+        elif isinstance(token, WordToken):
+            found = self.find_word(token.name)
+            if found is None:
+                raise CompileForthicError(f"Can't resolve '{token.name}'")
+            if is_mutable_literal(found):
+                raise CompileForthicError(f"Can't share the literal '{token.name}'")
+            return found
+        raise CompileForthicError(f"Can't compile token: {token}")
+
     def run_in_module(self, module: IModule, string: str) -> None:
         """Runs a Forthic string in the context of a given module"""
-        self.module_stack_push(module)
-        self.run(string)
-        self.module_stack.pop()
+        interp = self.thread_interpreter()
+        interp.module_stack.append(module)
+        try:
+            interp.run_code(string)
+        finally:
+            interp.module_stack.pop()
 
     def cur_module(self) -> IModule:
         """The top of the module stack is the currently active module"""
@@ -235,41 +940,368 @@ class Interpreter(IInterpreter):
         """
         module = module_class(self)
         self.registered_modules[module.name] = module
+        if self.settings.word_metrics:
+            self.settings.word_metrics.instrument_module(module)
+
+    def enable_word_metrics(self, sample_every: int = 1, include_global: bool = False) -> WordMetrics:
+        """Starts recording latency histograms for the Python words of registered modules (see `WordMetrics`)
+
+        Only one of every `sample_every` calls of a word is timed. Modules registered later are also
+        instrumented.
+
+        If `include_global` is True, global words are timed too. This slows down every word and keeps
+        strings like `'Status' REC@` from being compiled into Python functions, so it's meant for debugging.
+
+        Returns the interpreter's `WordMetrics`. Clones share their words, so they also share word metrics,
+        and this should be called before cloning. Does nothing more if word metrics are already enabled.
+        """
+        settings = self.settings
+        if settings.word_metrics:
+            return settings.word_metrics
+
+        settings.word_metrics = WordMetrics(sample_every)
+        for module in self.registered_modules.values():
+            settings.word_metrics.instrument_module(module)
+        if include_global:
+            settings.word_metrics.instrument_module(self.global_module, prefix='')
+        return settings.word_metrics
+
+    @property
+    def word_metrics(self) -> Optional[WordMetrics]:
+        return self.settings.word_metrics
 
     def run_module_code(self, module: Module) -> None:
         """Every Module has words defined in the host language and words defined in Forthic. This runs the
         words defined in Forthic."""
-        self.module_stack_push(module)
-        self.run(module.forthic_code)
-        self.module_stack_pop()
+        interp = self.thread_interpreter()
+        interp.module_stack.append(module)
+        try:
+            interp.run_code(module.forthic_code)
+        finally:
+            interp.module_stack.pop()
 
     def find_word(self, name: str) -> Optional[IWord]:
         """Searches the interpreter for a word
 
         The module stack is searched top down. If the words cannot be found, the global module is searched.
         Note that the bottom of the module stack is always the application module.
+
+        Words are cached by module stack and name until any module's words or variables change. Literals with
+        mutable values aren't cached. The cache is bypassed during profiling runs so each literal and variable
+        lookup is counted as its own word.
         """
+        if self.is_profiling:
+            return self.find_word_uncached(name)
+
+        generation = dictionary_generation()
+        if generation != self.word_cache_generation or len(self.word_cache) >= WORD_CACHE_SIZE:
+            self.word_cache = {}
+            self.word_cache_generation = generation
+
+        key = (tuple(self.module_stack), name)
+        result = self.word_cache.get(key)
+        if result is None:
+            result = self.find_word_uncached(name)
+            if result is not None and not is_mutable_literal(result):
+                self.word_cache[key] = result
+        return result
+
+    def find_word_uncached(self, name: str) -> Optional[IWord]:
+        """Searches the module stack and then the global module for a word"""
         modules = reversed(self.module_stack)
+        local_words = self.local_words
         result = None
         for m in modules:
+            if local_words:
+                result = local_words.get((m, name))
+                if result:
+                    break
             result = m.find_word(name)
             if result:
                 break
 
-        if not result:
+        # The global module's literal cache is skipped when profiling so each literal is counted as its own word
+        if not result and self.is_profiling:
+            result = self.global_module.find_dictionary_word(name) or self.global_module.convert_literal_word(name)
+        elif not result:
             result = self.global_module.find_word(name)
         return result
 
+    def find_module_word(self, module: IModule, name: str) -> Optional[IWord]:
+        """Returns a module's word, including words the current thread defined in it (see `add_definition`)"""
+        local_words = self.local_words
+        if local_words:
+            result = local_words.get((module, name))
+            if result:
+                return result
+        return module.find_dictionary_word(name)   # type: ignore
+
+    def add_definition(self, module: IModule, word: IWord) -> None:
+        """Adds a word defined in Forthic (e.g., by `:` or `MEMO`) to a module
+
+        Words defined by the thread that created the interpreter are added to the module. Words defined by other
+        threads are only seen by those threads, so threads sharing an interpreter (e.g., loading the same
+        screens) don't change each other's words or invalidate every thread's cached words. Variables and modules
+        created by any thread are shared.
+        """
+        local_words = self.local_words
+        if local_words is None:
+            module.add_word(word)
+            return
+
+        local_words[(module, word.name)] = word
+        self.word_cache = {}
+        self.compiled_forthic_cache.clear()
+
+    def fork_local_words(self, local_words: Optional[Dict[Tuple[IModule, str], IWord]]) -> None:
+        """Starts the current thread over with a copy of another thread's `local_words`
+
+        This is used by threads that run Forthic for another thread (e.g., `PARALLEL-MAP` workers), so each run sees
+        the words the caller defined but defines its own (see `add_definition`).
+        """
+        if not local_words and not self.local_words:
+            return
+        self.local_words = dict(local_words or {})
+        self.word_cache = {}
+        self.compiled_forthic_cache.clear()
+
+    def execute_definition(self, definition: IWord) -> None:
+        """Executes the words of a definition using the current `definition_executor`
+
+        If the definition raises an exception, any modules it entered are removed from the module stack.
+        """
+        module_stack_depth = len(self.module_stack)
+        try:
+            self.definition_executor(definition)
+        except BaseException:
+            del self.module_stack[module_stack_depth:]
+            raise
+
+    def execute_definition_unprofiled(self, definition: 'DefinitionWord') -> None:
+        """Executes a definition's words in order"""
+        for w in definition.words:
+            w.execute(self)
+
+    def execute_definition_codegen(self, definition: 'DefinitionWord') -> None:
+        """Compiles a definition into a Python function and runs it
+
+        Definitions that can't be compiled are run by the bytecode VM or by executing their words in order.
+        """
+        if definition.compile_function():
+            definition.function(self)   # type: ignore
+        elif self.settings.vm_mode:
+            self.execute_definition_vm(definition)
+        else:
+            self.execute_definition_unprofiled(definition)
+
+    def execute_definition_profiled(self, definition: 'DefinitionWord') -> None:
+        """Executes a definition's words in order, recording a WordProfile for each"""
+        for w in definition.words:
+            self.start_profile_word(w)
+            w.execute(self)
+            self.end_profile_word()
+
+    def execute_definition_sampled(self, definition: 'DefinitionWord') -> None:
+        """Executes a definition's words in order, recording the word being executed for a `SamplingProfiler`"""
+        frames = self.sampled_frames
+        frame = [self.module_stack[-1], definition, None]
+        frames.append(frame)
+        try:
+            for w in definition.words:
+                frame[2] = w
+                w.execute(self)
+        finally:
+            frames.pop()
+
+    def execute_definition_vm(self, definition: 'DefinitionWord') -> None:
+        """Executes a definition's instructions in a single loop
+
+        Calls to other definitions push the current instruction iterator onto a return stack instead of recursing
+        in Python, so deeply nested definitions don't hit the Python recursion limit. While profiling or sampling
+        (e.g., after `PROFILE-START` in a running definition), called definitions are executed as words so
+        they're recorded.
+        """
+        stack = self.stack
+        return_stack: List[Any] = []
+        instructions = iter(definition.get_instructions())
+        while True:
+            for opcode, arg in instructions:
+                if opcode == OP_PUSH:
+                    stack.append(arg)
+                elif opcode == OP_CALL_NATIVE:
+                    arg.execute(self)
+                elif opcode == OP_CALL_DEFINITION:
+                    if self.is_tracing:
+                        arg.execute(self)
+                        continue
+                    return_stack.append(instructions)
+                    instructions = iter(arg.get_instructions())
+                    break
+                elif opcode == OP_ENTER_MODULE:
+                    arg.execute(self)
+                elif opcode == OP_EXIT_MODULE:
+                    self.module_stack_pop()
+                elif opcode == OP_BUILD_ARRAY:
+                    items: List[Any] = []
+                    item = stack.pop()
+                    while not isinstance(item, StartArrayToken):
+                        items.append(item)
+                        item = stack.pop()
+                    items.reverse()
+                    stack.append(items)
+            else:
+                if not return_stack:
+                    return
+                instructions = return_stack.pop()
+
+    # --------------------------------------------------------------------------
+    # Definition optimization
+
+    def optimize_definition(self, definition: DefinitionWord) -> None:
+        """Replaces common patterns in a definition's words with cheaper equivalents
+
+        * Arrays of literals (and `REC` of such arrays) are built once and pushed as a `ConstantWord`
+        * A constant field followed by `REC@` becomes a `RecordFieldWord`
+        * Runs of `SWAP`, `DUP`, and `POP` become a single `StackShuffleWord`
+        """
+        num_words = len(definition.words)
+        words = self.fold_constants(definition.words)
+        words = self.fuse_record_fields(words)
+        words = self.fuse_stack_shuffles(words)
+        definition.words = words
+        definition.instructions = None
+        definition.num_unoptimized_words = num_words
+
+    def is_global_word(self, word: IWord, name: str) -> bool:
+        """Returns True if `word` is the global module's `name` word"""
+        return word is self.global_module.word_index.get(name)
+
+    def fold_constants(self, words: List[IWord]) -> List[IWord]:
+        result: List[IWord] = []
+        starts: List[int] = []   # Positions in `result` of start array tokens that haven't been matched yet
+        for word in words:
+            if type(word) is PushValueWord and isinstance(word.value, StartArrayToken):   # type: ignore
+                starts.append(len(result))
+            elif type(word) is EndArrayWord and starts:
+                start = starts.pop()
+                items = result[start + 1:]
+                if all(is_constant_word(w) for w in items):
+                    result[start:] = [ConstantWord([w.value for w in items])]   # type: ignore
+                    continue
+            elif self.is_global_word(word, 'REC') and result and type(result[-1]) is ConstantWord:
+                # Constants REC can't convert (e.g., `[1 2] REC`) are left to fail when the definition runs
+                stack_size = len(self.stack)
+                self.stack_push(copy_constant(result[-1].value))   # type: ignore
+                try:
+                    word.execute(self)
+                    result[-1] = ConstantWord(self.stack_pop())
+                    continue
+                except Exception:
+                    del self.stack[stack_size:]
+            result.append(word)
+        return result
+
+    def fuse_record_fields(self, words: List[IWord]) -> List[IWord]:
+        result: List[IWord] = []
+        for word in words:
+            if self.is_global_word(word, 'REC@') and result:
+                prev = result[-1]
+                if type(prev) is PushValueWord and isinstance(prev.value, str):   # type: ignore
+                    result[-1] = RecordFieldWord([prev.value])   # type: ignore
+                    continue
+                if type(prev) is ConstantWord and prev.is_flat and prev.value and isinstance(prev.value, list):   # type: ignore
+                    result[-1] = RecordFieldWord(prev.value[:])   # type: ignore
+                    continue
+            result.append(word)
+        return result
+
+    def fuse_stack_shuffles(self, words: List[IWord]) -> List[IWord]:
+        result: List[IWord] = []
+        run: List[IWord] = []
+        shuffle_words = [self.global_module.word_index.get(name) for name in SHUFFLE_WORD_NAMES]
+
+        def end_run():
+            if len(run) == 1:
+                result.append(run[0])
+            elif run:
+                depth, indexes = shuffle_indexes([w.name for w in run])
+                result.append(StackShuffleWord(depth, indexes))
+            run.clear()
+
+        for word in words:
+            if word in shuffle_words:
+                run.append(word)
+                continue
+            end_run()
+            result.append(word)
+        end_run()
+        return result
+
+    def definition_sizes(self, module: Module) -> List[Dict[str, Any]]:
+        """Returns the number of words in each optimized definition of a module before and after optimization"""
+        result = []
+        for word in module.words:
+            if isinstance(word, DefinitionWord) and word.num_unoptimized_words is not None:
+                result.append({
+                    'word': word.name,
+                    'before': word.num_unoptimized_words,
+                    'after': len(word.words),
+                })
+        return result
+
     # --------------------------------------------------------------------------
     # Profiling support
 
-    def start_profiling(self) -> None:
-        """Clears word counts and starts profiling word executions"""
-        self.is_profiling = True
+    def start_profiling(self, aggregate: bool = False, memory: bool = False) -> None:
+        """Clears word counts and starts profiling word executions
+
+        By default, each word execution is recorded in a tree of WordProfiles. If `aggregate` is True, only
+        statistics for each distinct path of calls are recorded (see `AggregateWordProfile`), which keeps memory
+        use bounded for long runs.
+
+        If `memory` is True, the net and peak bytes allocated by each word are also recorded using `tracemalloc`
+        (see `profile.start_memory_profile`). Tracing allocations slows Python down considerably, so
+        tracemalloc is only running during the profiling run (unless it was already running).
+
+        NOTE: Definitions that are already executing when profiling starts are not profiled.
+        """
+        interp = self.thread_interpreter()
+        if memory:
+            if not hasattr(tracemalloc, 'reset_peak'):
+                raise InterpreterError('Memory profiling requires Python 3.9 or later')
+            interp.stops_tracemalloc = not tracemalloc.is_tracing()
+            if interp.stops_tracemalloc:
+                tracemalloc.start()
+        interp.profile_memory = memory
+
+        if aggregate:
+            interp.cur_word_profile = AggregateWordProfile(None, interp.cur_module(), None)
+        elif isinstance(interp.cur_word_profile, AggregateWordProfile):
+            interp.cur_word_profile = None
+        interp.is_profiling = True
+        interp.update_definition_executor()
         self.timestamps = []
-        self.start_profile_time = time.perf_counter()
+        start_profile_time = time.perf_counter()
+        self.start_profile_time = start_profile_time
         self.add_timestamp('START')
         self.word_counts = collections.defaultdict(int)
+        interp.profile_trace = ProfileTrace(start_profile_time)
+        set_active_trace(interp.profile_trace)
+
+    def join_profiling(self, word_profile: Optional[WordProfile], trace: ProfileTrace) -> None:
+        """Profiles words run by the current thread as part of another thread's profiling run
+
+        This is used by threads that run words for a profiled word (e.g., `PARALLEL-MAP` workers). The words
+        are profiled as calls of `word_profile` (if any) and added to the other thread's `trace`. Call
+        `stop_profiling` when they're done.
+        """
+        interp = self.thread_interpreter()
+        interp.is_profiling = True
+        interp.profile_memory = False
+        interp.cur_word_profile = word_profile
+        interp.profile_trace = trace
+        interp.update_definition_executor()
+        set_active_trace(trace)
 
     def add_timestamp(self, label: str) -> None:
         """Adds a timestamped label to a profiling run"""
@@ -292,16 +1324,28 @@ class Interpreter(IInterpreter):
         if not self.is_profiling:
             return
 
-        word_profile = WordProfile(
-            self.cur_word_profile, self.cur_module(), word
-        )
+        cur_word_profile = self.cur_word_profile
+        word_profile: Profile
+        if isinstance(cur_word_profile, AggregateWordProfile):
+            word_profile = cur_word_profile.start_word(self.cur_module(), word)
+        else:
+            word_profile = WordProfile(
+                cur_word_profile, self.cur_module(), word
+            )
+            if cur_word_profile is None and self.profile_trace:
+                self.profile_trace.word_profiles.append(word_profile)
         self.cur_word_profile = word_profile
 
+        if self.profile_memory:
+            start_memory_profile(word_profile)
+
     def end_profile_word(self) -> None:
         """Used to mark the end of a word execution during a profiling run"""
         if not self.cur_word_profile:
             return
 
+        if self.profile_memory:
+            end_memory_profile(self.cur_word_profile)
         self.cur_word_profile.end_profile()
         parent = self.cur_word_profile.get_parent()
         if parent:
@@ -311,6 +1355,35 @@ class Interpreter(IInterpreter):
         """Stops profiling"""
         self.add_timestamp('END')
         self.is_profiling = False
+        self.thread_interpreter().update_definition_executor()
+        set_active_trace(None)
+
+        if self.profile_memory and self.stops_tracemalloc:
+            tracemalloc.stop()
+        self.profile_memory = False
+
+    def start_sampling(self, rate: Optional[float] = None) -> None:
+        """Starts sampling the Forthic call stack of the current thread `rate` times per second
+
+        `rate` defaults to `DEFAULT_SAMPLE_RATE`. See `SamplingProfiler`. Any sampling already running in the
+        current thread is stopped.
+        """
+        # NOTE: Imported here since sampling_profiler imports this module
+        from .sampling_profiler import SamplingProfiler
+
+        interp = self.thread_interpreter()
+        self.stop_sampling()
+        interp.sampling_profiler = SamplingProfiler(interp, rate or DEFAULT_SAMPLE_RATE)
+        interp.sampling_profiler.start()
+
+    def stop_sampling(self) -> Optional['SamplingProfiler']:
+        """Stops sampling the current thread, returning its `SamplingProfiler` (or None if it wasn't sampled)"""
+        interp = self.thread_interpreter()
+        result = interp.sampling_profiler
+        if result:
+            result.stop()
+            interp.sampling_profiler = None
+        return result
 
     def word_histogram(self) -> List[Any]:
         """Returns a list of counts in descending order"""
@@ -328,26 +1401,19 @@ class Interpreter(IInterpreter):
 
     def handle_token(self, token: Token) -> None:
         """Called to handle each token from the Tokenizer"""
-        if isinstance(token, StringToken):
-            self.handle_string_token(token)
-        elif isinstance(token, CommentToken):
-            self.handle_comment_token(token)
-        elif isinstance(token, StartArrayToken):
-            self.handle_start_array_token(token)
-        elif isinstance(token, EndArrayToken):
-            self.handle_end_array_token(token)
-        elif isinstance(token, StartModuleToken):
-            self.handle_start_module_token(token)
-        elif isinstance(token, EndModuleToken):
-            self.handle_end_module_token(token)
-        elif isinstance(token, StartDefinitionToken):
-            self.handle_start_definition_token(token)
-        elif isinstance(token, EndDefinitionToken):
-            self.handle_end_definition_token(token)
-        elif isinstance(token, WordToken):
-            self.handle_word_token(token)
-        else:
-            raise UnknownTokenError(token)
+        handler = self.token_handlers.get(type(token))
+        if handler is None:
+            handler = self.find_token_handler(token)
+        handler(token)
+
+    def find_token_handler(self, token: Token) -> Callable[[Any], None]:
+        """Returns the handler for a token whose exact type isn't in `token_handlers` (e.g., a Token subclass)"""
+        for token_class in type(token).__mro__:
+            handler = self.token_handlers.get(token_class)
+            if handler:
+                self.token_handlers[type(token)] = handler
+                return handler
+        raise UnknownTokenError(token)
 
     def handle_string_token(self, token: StringToken) -> None:
         self.handle_word(PushValueWord('<string>', token.string))
@@ -361,7 +1427,8 @@ class Interpreter(IInterpreter):
             self.cur_definition.add_word(word)
 
         # NOTE: We execute the word within a definition so we can do lookups during compile
-        self.count_word(word)
+        if self.is_profiling:
+            self.count_word(word)
         word.execute(self)
 
     def handle_end_module_token(self, token: EndModuleToken) -> None:
@@ -372,7 +1439,8 @@ class Interpreter(IInterpreter):
             self.cur_definition.add_word(word)
 
         # NOTE: We execute the word within a definition so we can do lookups during compile
-        self.count_word(word)
+        if self.is_profiling:
+            self.count_word(word)
         word.execute(self)
 
     def handle_start_array_token(self, token: StartArrayToken) -> None:
@@ -395,7 +1463,9 @@ class Interpreter(IInterpreter):
             raise UnmatchedEndDefinitionError()
         if not self.cur_definition:
             raise InterpreterError("Cannot finish definition because no 'cur_definition'")
-        self.cur_module().add_word(self.cur_definition)
+        if self.optimize_definitions:
+            self.optimize_definition(self.cur_definition)
+        self.add_definition(self.cur_module(), self.cur_definition)
         self.is_compiling = False
 
     def handle_word_token(self, token: WordToken) -> None:
@@ -411,5 +1481,85 @@ class Interpreter(IInterpreter):
                 raise InterpreterError("Interpreter is compiling, but there is no current definition")
             self.cur_definition.add_word(word)
         else:
-            self.count_word(word)
+            if self.is_profiling:
+                self.count_word(word)
             word.execute(self)
+
+
+class ThreadInterpreter(Interpreter):
+    """Runs an interpreter's Forthic in one thread
+
+    A thread interpreter is a shallow copy of its interpreter, so its modules and settings are the interpreter's.
+    Its execution state is stored in slots, which take precedence over the interpreter's thread attributes, so
+    words that it executes (which are passed the thread interpreter) use its stacks directly.
+
+    A thread interpreter must only be used by its own thread. Code running in other threads should use
+    `thread_interpreter` to get their own.
+    """
+    __slots__ = EXECUTION_STATE_ATTRIBUTES + ('interpreter',)
+    interpreter: Interpreter
+
+    def __init__(self, interpreter: Interpreter):
+        # Threads started by words (e.g., `PARALLEL-MAP`) create their thread interpreters from the caller's
+        if isinstance(interpreter, ThreadInterpreter):
+            interpreter = interpreter.interpreter
+        self.__dict__.update(interpreter.__dict__)
+        self.interpreter = interpreter
+        self.init_execution_state()
+
+    def init_execution_state(self) -> None:
+        self.stack: List[Any] = []
+        self.module_stack: List[IModule] = [self.app_module]
+        self.is_compiling: bool = False
+        self.cur_definition: Optional[DefinitionWord] = None
+
+        # Names of screens being loaded (see `LOAD-SCREEN`)
+        self.active_screens: Set[str] = set()
+
+        # Maps (forthic, module stack) to (dictionary generation, CompiledForthicWord), least recently used first
+        self.compiled_forthic_cache: 'collections.OrderedDict[Tuple[str, Tuple[IModule, ...]], Tuple[int, CompiledForthicWord]]' = \
+            collections.OrderedDict()
+
+        # Maps (module stack, name) to words found by `find_word` during the `word_cache_generation`
+        self.word_cache: Dict[Tuple[Tuple[IModule, ...], str], IWord] = {}
+        self.word_cache_generation: int = dictionary_generation()
+
+        # Maps (module, name) to words defined by this thread, or None if this thread created the interpreter
+        # (see `add_definition`)
+        self.local_words: Optional[Dict[Tuple[IModule, str], IWord]] = \
+            None if self.is_owner_thread() else {}
+
+        # Maps token types to the methods that handle them
+        self.token_handlers: Dict[type, Callable[[Any], None]] = {
+            StringToken: self.handle_string_token,
+            CommentToken: self.handle_comment_token,
+            StartArrayToken: self.handle_start_array_token,
+            EndArrayToken: self.handle_end_array_token,
+            StartModuleToken: self.handle_start_module_token,
+            EndModuleToken: self.handle_end_module_token,
+            StartDefinitionToken: self.handle_start_definition_token,
+            EndDefinitionToken: self.handle_end_definition_token,
+            WordToken: self.handle_word_token,
+        }
+
+        # Profiling support
+        self.word_counts: Dict[IWord, int] = collections.defaultdict(int)
+        self.is_profiling: bool = False
+        self.start_profile_time: Optional[float] = None
+        self.timestamps: List[Any] = []
+        self.cur_word_profile: Optional[Profile] = None
+        self.profile_trace: Optional[ProfileTrace] = None   # Trace of the last profiling run (see `PROFILE-TRACE`)
+        self.profile_memory: bool = False   # True during memory profiling runs
+        self.stops_tracemalloc: bool = False   # True if tracemalloc was started by the memory profiling run
+
+        # Sampling support (see `SamplingProfiler`)
+        self.sampling_profiler: Optional[SamplingProfiler] = None
+        self.sampled_frames: Optional[List[List[Any]]] = None
+        self.is_tracing: bool = False
+
+        # Executes definitions. This is switched when profiling starts and stops so that normal runs don't pay
+        # for profiling hooks, and when the bytecode VM or Python codegen is turned on or off.
+        self.definition_executor: Callable[[Any], None] = self.unprofiled_executor()
+
+    def clone(self) -> Interpreter:
+        return self.interpreter.clone()
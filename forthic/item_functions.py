@@ -0,0 +1,149 @@
+import datetime
+import operator
+from .module import ModuleWord, PushValueWord
+from .global_module import GlobalModule, rec_at, to_date
+from .interfaces import IWord
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# A Python function of an item that returns the value a Forthic string would leave on the stack for the item
+ItemFunction = Callable[[Any], Any]
+
+
+def identity(item: Any) -> Any:
+    return item
+
+
+def compare(op: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """Returns a comparison that's None if either value is None (like `<`, `>`, etc.)"""
+    def result(m, n):
+        if m is None or n is None:
+            return None
+        return op(m, n)
+    return result
+
+
+def is_in(item: Any, items: Any) -> bool:
+    if not items:
+        items = []
+    return item in items
+
+
+# Global words that push a value without popping any
+NULLARY_FUNCTIONS: Dict[Callable, Callable[[], Any]] = {
+    GlobalModule.word_NULL: lambda: None,
+    GlobalModule.word_TRUE: lambda: True,
+    GlobalModule.word_FALSE: lambda: False,
+    GlobalModule.word_TODAY: datetime.date.today,
+}
+
+# Global words that pop a value and push a value computed from it
+UNARY_FUNCTIONS: Dict[Callable, Callable[[Any], Any]] = {
+    GlobalModule.word_at: operator.attrgetter('value'),
+    GlobalModule.word_to_DATE: to_date,
+    GlobalModule.word_NOT: operator.not_,
+}
+
+# Global words that pop two values and push a value computed from them
+BINARY_FUNCTIONS: Dict[Callable, Callable[[Any, Any], Any]] = {
+    GlobalModule.word_REC_at: rec_at,
+    GlobalModule.word_equal_equal: operator.eq,
+    GlobalModule.word_not_equal: operator.ne,
+    GlobalModule.word_less_than: compare(operator.lt),
+    GlobalModule.word_less_than_or_equal: compare(operator.le),
+    GlobalModule.word_greater_than: compare(operator.gt),
+    GlobalModule.word_greater_than_or_equal: compare(operator.ge),
+    GlobalModule.word_IN: is_in,
+}
+
+# A value on the stack while compiling: (True, constant) or (False, function of the item)
+StackValue = Tuple[bool, Any]
+
+
+def compile_item_function(words: List[IWord]) -> Optional[ItemFunction]:
+    """Compiles the words of a Forthic string that maps an item to a value into a Python function
+
+    This handles the strings commonly used by words like `SELECT` and `GROUP-BY`, such as
+    `'Status' REC@ status @ ==` or `'Labels' REC@ label @ SWAP IN`. The words are run on a stack of values
+    computed from the item, starting with the item itself. Literals and variables are constants, and global words
+    with no side effects (see `BINARY_FUNCTIONS`, etc.) combine values into functions of the item. Variables are
+    read each time the function is called.
+
+    Returns None if the string uses any other words, or doesn't leave exactly one value on the stack.
+    """
+    stack: List[StackValue] = [(False, identity)]
+    for word in words:
+        if type(word) is PushValueWord:
+            stack.append((True, word.value))   # type: ignore
+            continue
+
+        if type(word) is not ModuleWord:
+            return None
+        handler = getattr(word.handler, '__func__', None)   # type: ignore
+
+        if handler in NULLARY_FUNCTIONS:
+            stack.append((False, apply_nullary(NULLARY_FUNCTIONS[handler])))
+        elif handler in UNARY_FUNCTIONS:
+            if not stack:
+                return None
+            stack.append((False, apply_unary(UNARY_FUNCTIONS[handler], stack.pop())))
+        elif handler in BINARY_FUNCTIONS:
+            if len(stack) < 2:
+                return None
+            n = stack.pop()
+            m = stack.pop()
+            stack.append((False, apply_binary(BINARY_FUNCTIONS[handler], m, n)))
+        elif handler is GlobalModule.word_SWAP and len(stack) >= 2:
+            stack[-1], stack[-2] = stack[-2], stack[-1]
+        elif handler is GlobalModule.word_DUP and stack:
+            stack.append(stack[-1])
+        else:
+            return None
+
+    if len(stack) != 1:
+        return None
+    return to_function(stack[0])
+
+
+def to_function(value: StackValue) -> ItemFunction:
+    is_constant, value_or_function = value
+    if is_constant:
+        return lambda item: value_or_function
+    return value_or_function
+
+
+def apply_nullary(function: Callable[[], Any]) -> ItemFunction:
+    return lambda item: function()
+
+
+def apply_unary(function: Callable[[Any], Any], a: StackValue) -> ItemFunction:
+    is_constant, a_value = a
+    if is_constant:
+        return lambda item: function(a_value)
+    return lambda item: function(a_value(item))
+
+
+def apply_binary(function: Callable[[Any, Any], Any], m: StackValue, n: StackValue) -> ItemFunction:
+    """Returns a function of the item that applies `function` to two values
+
+    Common cases, like getting a field of the item or comparing a value to a constant, have specialized
+    functions so they make fewer calls.
+    """
+    m_is_constant, m_value = m
+    n_is_constant, n_value = n
+
+    if n_is_constant:
+        if function is rec_at and m_value is identity and not isinstance(n_value, list):
+            field = n_value
+            return lambda item: item.get(field) if item else None
+        if m_is_constant:
+            return lambda item: function(m_value, n_value)
+        if function is operator.eq:
+            return lambda item: m_value(item) == n_value
+        if function is operator.ne:
+            return lambda item: m_value(item) != n_value
+        return lambda item: function(m_value(item), n_value)
+
+    if m_is_constant:
+        return lambda item: function(m_value, n_value(item))
+    return lambda item: function(m_value(item), n_value(item))
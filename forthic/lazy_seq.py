@@ -0,0 +1,84 @@
+import itertools
+from .interfaces import IInterpreter, IWord
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+
+class LazySeq:
+    """A sequence whose items are computed as they're needed
+
+    `>LAZY` converts an array into a lazy sequence. Given a lazy sequence, words like `MAP` and `SELECT` return
+    lazy sequences without running any Forthic, so a pipeline like `records >LAZY "..." SELECT "..." MAP 10 TAKE`
+    only runs its Forthic until 10 items are found. Words that don't stream compute all items first, and `>LIST`
+    returns the items of a lazy sequence as an array.
+
+    A lazy sequence remembers the items it has computed, so it can be used more than once (e.g., after `DUP`).
+    Lazy sequences are always truthy so that checks for empty containers don't compute their items. They
+    shouldn't be shared by threads.
+    """
+    def __init__(self, iterable: Iterable[Any]):
+        self.iterator: Optional[Iterator[Any]] = iter(iterable)
+        self.items: List[Any] = []   # Items computed so far
+
+    def __bool__(self) -> bool:
+        return True
+
+    def __len__(self) -> int:
+        return len(self.to_list())
+
+    def __iter__(self) -> Iterator[Any]:
+        i = 0
+        while self.compute(i + 1) > i:
+            yield self.items[i]
+            i += 1
+
+    def compute(self, num_items: int) -> int:
+        """Computes items until there are `num_items` (or no more), returning the number of computed items"""
+        items = self.items
+        iterator = self.iterator
+        while iterator is not None and len(items) < num_items:
+            try:
+                items.append(next(iterator))
+            except StopIteration:
+                self.iterator = iterator = None
+        return len(items)
+
+    def to_list(self) -> List[Any]:
+        """Returns all items of the sequence as a new list"""
+        if self.iterator is not None:
+            iterator = self.iterator
+            self.iterator = None
+            self.items.extend(iterator)
+        return self.items[:]
+
+    def take(self, n: int) -> Tuple[List[Any], 'LazySeq']:
+        """Returns a list of the first `n` items and a lazy sequence of the rest"""
+        self.compute(n)
+        return self.items[:n], self.drop(n)
+
+    def drop(self, n: int) -> 'LazySeq':
+        return LazySeq(itertools.islice(self, n, None))
+
+    def map(self, interp: IInterpreter, compiled: IWord, with_index: bool = False) -> 'LazySeq':
+        """Returns a lazy sequence of the values `compiled` leaves on the stack for each item (and index)"""
+        def generate_values():
+            thread_interp = interp.thread_interpreter()
+            for i, item in enumerate(self):
+                if with_index:
+                    thread_interp.stack_push(i)
+                thread_interp.stack_push(item)
+                compiled.execute(thread_interp)
+                yield thread_interp.stack_pop()
+        return LazySeq(generate_values())
+
+    def select(self, interp: IInterpreter, compiled: IWord, with_index: bool = False) -> 'LazySeq':
+        """Returns a lazy sequence of the items (and indexes) for which `compiled` leaves a truthy value"""
+        def generate_items():
+            thread_interp = interp.thread_interpreter()
+            for i, item in enumerate(self):
+                if with_index:
+                    thread_interp.stack_push(i)
+                thread_interp.stack_push(item)
+                compiled.execute(thread_interp)
+                if thread_interp.stack_pop():
+                    yield item
+        return LazySeq(generate_items())
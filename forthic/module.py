@@ -1,11 +1,124 @@
+import threading
+import types
 from .interfaces import IInterpreter, IModule, IWord
 from typing import Any, Callable, List, Dict, Optional
 
 
+# Incremented whenever any module's words, variables, or submodules change. Interpreters use this to tell whether
+# previously resolved words (e.g., in compiled Forthic strings) are still valid.
+_dictionary_generation: int = 0
+
+
+def dictionary_generation() -> int:
+    """Returns the current dictionary generation"""
+    return _dictionary_generation
+
+
+def bump_dictionary_generation() -> None:
+    """Notes that some module's words or variables have changed"""
+    global _dictionary_generation
+    _dictionary_generation += 1
+
+
+def shallow_copy(obj: Any) -> Any:
+    """Returns a shallow copy of an object (a faster `copy.copy` for plain Python objects)"""
+    result = obj.__class__.__new__(obj.__class__)
+    result.__dict__.update(obj.__dict__)
+    return result
+
+
+def rebind_handler(handler: Callable[[IInterpreter], None], memo: Dict[int, Any]) -> Callable[[IInterpreter], None]:
+    """Returns a handler for a cloned interpreter (see `Interpreter.clone`)
+
+    Handlers that are methods of a module are bound to the module's clone, so they use its state. Handlers
+    that wrap other handlers (e.g., to time them) have a `__wrapped__` handler and a `rewrap` function that
+    wraps its replacement.
+    """
+    wrapped = getattr(handler, '__wrapped__', None)
+    if wrapped is not None:
+        rebound = rebind_handler(wrapped, memo)
+        return handler if rebound is wrapped else handler.rewrap(rebound)   # type: ignore
+
+    owner = getattr(handler, '__self__', None)
+    if not isinstance(owner, Module):
+        return handler
+
+    clone = owner.clone(memo)
+    if clone is owner:
+        return handler
+    return types.MethodType(handler.__func__, clone)   # type: ignore
+
+
+class ThreadState(threading.local):
+    # Values that the current thread's run has set for variables, or None to use shared values (see `Variable`)
+    variable_values: Optional[Dict['Variable', Any]] = None
+
+
+_thread_state = ThreadState()
+
+
+def thread_variable_values() -> Optional[Dict['Variable', Any]]:
+    """Returns the values that the current thread's run has set, or None if it sets shared values"""
+    return _thread_state.variable_values
+
+
+def set_thread_variable_values(values: Optional[Dict['Variable', Any]]) -> Optional[Dict['Variable', Any]]:
+    """Sets the values the current thread sees (None to use shared values), returning the previous values
+
+    `Interpreter.run` sets an empty dict for runs on threads that didn't create the interpreter and restores
+    the previous values when the run finishes, so values set by one run (e.g., for a web request) aren't seen
+    by later runs on the same thread.
+    """
+    previous = _thread_state.variable_values
+    _thread_state.variable_values = values
+    return previous
+
+
+def fork_variable_values(values: Optional[Dict['Variable', Any]]) -> Optional[Dict['Variable', Any]]:
+    """Starts the current thread over with a copy of another thread's `thread_variable_values`
+
+    This is used by threads that run Forthic for another thread (e.g., `PARALLEL-MAP` workers), so each run sees
+    the caller's values but sets its own. Returns the thread's previous values.
+    """
+    return set_thread_variable_values(dict(values or {}))
+
+
 class Variable:
-    """Represents a Forthic variable"""
+    """Represents a Forthic variable
+
+    An interpreter may be shared by threads, so each run has its own variable values. Values set while there
+    are no per-thread values (e.g., while the thread that created the interpreter sets it up) are shared.
+    Runs with per-thread values see the shared values until they set the variable, after which they see their
+    own value (see `thread_variable_values`). This doesn't depend on which thread created the variable.
+    """
     def __init__(self, value: Any = None):
-        self.value = value
+        self.shared_value = value
+
+        # The word that pushes this variable onto the stack (see `Module.find_variable`)
+        self.push_word: Optional['PushValueWord'] = None
+
+    @property
+    def value(self) -> Any:
+        values = _thread_state.variable_values
+        if values is None:
+            return self.shared_value
+        return values.get(self, self.shared_value)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        values = _thread_state.variable_values
+        if values is None:
+            self.shared_value = value
+        else:
+            values[self] = value
+
+    def clone(self, memo: Dict[int, Any]) -> 'Variable':
+        """Returns a copy of the variable with the value the current thread sees"""
+        result = memo.get(id(self))
+        if result is None:
+            result = Variable(self.value)
+            memo[id(self)] = result
+        return result
 
     def set_value(self, val):
         self.value = val
@@ -35,6 +148,19 @@ class PushValueWord(Word):
     def execute(self, interp: IInterpreter) -> None:
         interp.stack_push(self.value)
 
+    def clone(self, memo: Dict[int, Any]) -> IWord:
+        if not isinstance(self.value, Variable):
+            return self
+
+        result = memo.get(id(self))
+        if result is None:
+            variable = self.value.clone(memo)
+            result = PushValueWord(self.name, variable)
+            if variable.push_word is None:
+                variable.push_word = result
+            memo[id(self)] = result
+        return result
+
 
 class ModuleWord(Word):
     """This is used when defining Forthic words in Python
@@ -43,10 +169,24 @@ class ModuleWord(Word):
     The `handler` is a Python function that's called when the word is executed. All handlers take an interpreter
     as their only argument and return nothing. All argument passing and results are handled via the interpreter
     stack.
+    If `uses_module_stack` is False, the handler never runs Forthic or otherwise depends on the current module,
+    so imported versions of the word can skip switching modules.
     """
-    def __init__(self, name: str, handler: Callable[[IInterpreter], None]):
+    def __init__(self, name: str, handler: Callable[[IInterpreter], None], uses_module_stack: bool = True):
         super().__init__(name)
         self.handler = handler
+        self.uses_module_stack = uses_module_stack
+
+    def clone(self, memo: Dict[int, Any]) -> IWord:
+        result = memo.get(id(self))
+        if result is None:
+            handler = rebind_handler(self.handler, memo)
+            result = self
+            if handler is not self.handler:
+                result = shallow_copy(self)
+                result.handler = handler
+            memo[id(self)] = result
+        return result
 
     def execute(self, interp: IInterpreter) -> None:
         self.handler(interp)
@@ -66,10 +206,37 @@ class ImportedWord(Word):
         self.module_word = module_word
         self.imported_module = module
 
+        # Python words that don't use the module stack have their handlers called directly
+        self.direct_word: Optional[ModuleWord] = None
+        if type(module_word) is ModuleWord and not module_word.uses_module_stack:
+            self.direct_word = module_word
+
+    def clone(self, memo: Dict[int, Any]) -> IWord:
+        result = memo.get(id(self))
+        if result is None:
+            result = shallow_copy(self)
+            memo[id(self)] = result
+            result.imported_module = self.imported_module.clone(memo)
+            result.module_word = self.module_word.clone(memo)
+            if self.direct_word is not None:
+                result.direct_word = result.module_word   # type: ignore
+        return result
+
     def execute(self, interp: IInterpreter) -> None:
+        direct_word = self.direct_word
+        if direct_word is not None:
+            direct_word.handler(interp)
+            return
+
         interp.module_stack_push(self.imported_module)
-        self.module_word.execute(interp)
-        interp.module_stack_pop()
+        try:
+            self.module_word.execute(interp)
+        finally:
+            interp.module_stack_pop()
+
+
+# Attributes of modules that clones share until a word is added (see `Module.clone`)
+SHARED_WORD_ATTRIBUTES = ('_words', '_word_index')
 
 
 class Module(IModule):
@@ -79,32 +246,110 @@ class Module(IModule):
     """
     def __init__(self, name: str, interp: IInterpreter, forthic_code: str = ''):
         self.interp: IInterpreter = interp
-        self.words: List[IWord] = []
+        self._words: List[IWord] = []
+        self._word_index: Dict[str, IWord] = {}   # Maps names to the most recently added word with that name
+
+        # True if `_words` and `_word_index` are shared with clones (or the module they were cloned from), and
+        # the memo of the `clone` that created this module until its words are cloned (see `own_words`)
+        self.shares_words: bool = False
+        self.clone_memo: Optional[Dict[int, Any]] = None
+
         self.exportable: List[str] = []   # Word names
         self.variables: Dict[str, Variable] = {}
         self.modules: Dict[str, Module] = {}
         self.name: str = name
         self.forthic_code: str = forthic_code
 
+    def clone(self, memo: Dict[int, Any]) -> 'Module':
+        """Returns a copy of the module for a cloned interpreter (see `Interpreter.clone`)
+
+        The copy has its own variables and submodules. Python attributes of subclasses that are lists, dicts, or
+        sets (e.g., context stacks) are copied, so a clone's changes to them don't affect the original or other
+        clones. Other attributes are shared.
+
+        The word list is shared until either module adds a word. The copy's words are cloned when they're first
+        looked up, so words that refer to variables or modules use the copy's, and handlers that are methods of
+        this module are bound to the copy. Words that don't refer to them are shared.
+        """
+        result = memo.get(id(self))
+        if result is not None:
+            return result
+
+        # Words already shared with the module this was cloned from are cloned first
+        if self.clone_memo is not None:
+            self.own_words()
+
+        result = shallow_copy(self)
+        memo[id(self)] = result
+        for name, value in self.__dict__.items():
+            if isinstance(value, (list, dict, set)) and name not in SHARED_WORD_ATTRIBUTES:
+                setattr(result, name, value.copy())
+
+        # Modules created while running Forthic refer to the thread interpreter that created them
+        interp = getattr(self.interp, 'interpreter', self.interp)
+        result.interp = memo.get(id(interp), self.interp)
+        result.variables = {name: v.clone(memo) for name, v in self.variables.items()}
+        result.modules = {name: m.clone(memo) for name, m in self.modules.items()}
+        self.shares_words = result.shares_words = True
+        result.clone_memo = memo
+        return result
+
+    @property
+    def words(self) -> List[IWord]:
+        """The module's words in the order they were added"""
+        if self.clone_memo is not None:
+            self.own_words()
+        return self._words
+
+    @property
+    def word_index(self) -> Dict[str, IWord]:
+        if self.clone_memo is not None:
+            self.own_words()
+        return self._word_index
+
+    def own_words(self) -> None:
+        """Gives the module its own word list instead of one shared with clones (see `clone`)"""
+        memo = self.clone_memo
+        if memo is not None:
+            self._words = [w.clone(memo) for w in self._words]
+            self._word_index = {name: w.clone(memo) for name, w in self._word_index.items()}
+            self.clone_memo = None
+        elif self.shares_words:
+            self._words = self._words[:]
+            self._word_index = dict(self._word_index)
+        self.shares_words = False
+
     def find_module(self, name: str) -> Optional['Module']:
         result = self.modules.get(name)
         return result
 
     def add_word(self, word: IWord) -> None:
         """Adds a word to the module"""
-        self.words.append(word)
+        if self.shares_words:
+            self.own_words()
+        self._words.append(word)
+        self._word_index[word.name] = word
+        bump_dictionary_generation()
 
-    def add_module_word(self, word_name: str, word_func: Callable[[IInterpreter], None]) -> None:
-        """Convenience function for adding exportable module words"""
-        self.add_exportable_word(ModuleWord(word_name, word_func))
+    def add_module_word(self, word_name: str, word_func: Callable[[IInterpreter], None],
+                        uses_module_stack: bool = True) -> None:
+        """Convenience function for adding exportable module words
+
+        See `ModuleWord` for `uses_module_stack`.
+        """
+        self.add_exportable_word(ModuleWord(word_name, word_func, uses_module_stack))
 
     def add_exportable_word(self, word: ModuleWord) -> None:
         """Marks a word as exportable by the module
 
         Only exportable words can be used by other modules
         """
-        self.words.append(word)
+        if self.shares_words:
+            self.own_words()
+        self._words.append(word)
+        self._word_index[word.name] = word
         self.exportable.append(word.name)
+        bump_dictionary_generation()
 
     def add_exportable(self, names: List[str]) -> None:
         """Convenience to add a set of exportable words
@@ -121,6 +366,7 @@ class Module(IModule):
         """Adds variable to module, noop if variable exists"""
         if name not in self.variables:
             self.variables[name] = Variable(value)
+            bump_dictionary_generation()
 
     def initialize(self, interp: IInterpreter) -> None:
         """When a module is imported, its `forthic_code` must be executed in order to fully define its words"""
@@ -129,6 +375,7 @@ class Module(IModule):
     def register_module(self, module_name: str, module: 'Module') -> None:
         """Registers a module by name"""
         self.modules[module_name] = module
+        bump_dictionary_generation()
 
     def import_module(self, module_name: str, module: 'Module', interp: IInterpreter) -> None:
         """This is used to import a module for use by another module via Python
@@ -158,21 +405,21 @@ class Module(IModule):
 
     def find_dictionary_word(self, word_name: str) -> Optional[IWord]:
         """Looks up word in module, returning None if not found"""
-        indexes = list(reversed(range(len(self.words))))
-        for i in indexes:
-            w = self.words[i]
-            if w.name == word_name:
-                return w
-        return None
+        result = self._word_index.get(word_name)
+        if result is not None and self.clone_memo is not None:
+            result = result.clone(self.clone_memo)
+        return result
 
     def find_variable(self, varname: str) -> Optional[PushValueWord]:
-        """Returns variable"""
+        """Returns the word that pushes a variable, creating it the first time the variable is found"""
         variable = self.variables.get(varname)
-        result = None
-        if variable:
-            result = PushValueWord(varname, variable)
-        return result
+        if variable is None:
+            return None
+        if variable.push_word is None:
+            variable.push_word = PushValueWord(varname, variable)
+        return variable.push_word
 
     def set_variable(self, varname: str, value: Any = None) -> None:
         """Creates/sets a variable"""
         self.variables[varname] = Variable(value)
+        bump_dictionary_generation()
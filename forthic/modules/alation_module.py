@@ -1,7 +1,7 @@
-import requests
 import csv
 
 from ..module import Module
+from ..profile import HTTP_HOOKS
 from ..interfaces import IInterpreter
 from typing import List
 
@@ -55,8 +55,9 @@ class AlationModule(Module):
         access_token = self.get_access_token()
         headers = {'Token': access_token}
         url = f'https://{context.get_host()}/integration/v1/query/{query_id}/sql/'
+        import requests
         response = requests.get(
-            url, headers=headers, verify=context.get_cert_verify()
+            url, headers=headers, verify=context.get_cert_verify(), hooks=HTTP_HOOKS
         )
 
         if not response.ok:
@@ -72,8 +73,9 @@ class AlationModule(Module):
         access_token = self.get_access_token()
         headers = {'Token': access_token}
         url = f'https://{context.get_host()}/integration/v1/query/{query_id}/result/latest'
+        import requests
         response = requests.get(
-            url, headers=headers, verify=context.get_cert_verify()
+            url, headers=headers, verify=context.get_cert_verify(), hooks=HTTP_HOOKS
         )
 
         if not response.ok:
@@ -90,8 +92,9 @@ class AlationModule(Module):
         access_token = self.get_access_token()
         headers = {'Token': access_token}
         url = f'https://{context.get_host()}/integration/v1/result/{result_id}/csv'
+        import requests
         response = requests.get(
-            url, headers=headers, verify=context.get_cert_verify()
+            url, headers=headers, verify=context.get_cert_verify(), hooks=HTTP_HOOKS
         )
 
         if not response.ok:
@@ -117,10 +120,12 @@ class AlationModule(Module):
             'user_id': context.get_user_id(),
         }
 
+        import requests
         response = requests.post(
             f'https://{context.get_host()}/integration/v1/regenRefreshToken/',
             data=data,
             verify=context.get_cert_verify(),
+            hooks=HTTP_HOOKS,
         )
 
         if not response.ok:
@@ -155,8 +160,9 @@ class AlationModule(Module):
         }
 
         url = f'https://{context.get_host()}/integration/v1/createAPIAccessToken/'
+        import requests
         response = requests.post(
-            url, data=data, verify=context.get_cert_verify()
+            url, data=data, verify=context.get_cert_verify(), hooks=HTTP_HOOKS
         )
 
         if not response.ok:
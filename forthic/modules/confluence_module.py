@@ -1,7 +1,7 @@
 import re
 import urllib
-import requests
 from ..module import Module
+from ..profile import HTTP_HOOKS
 from ..interfaces import IInterpreter
 from typing import List, Optional
 
@@ -28,12 +28,12 @@ class ConfluenceModule(Module):
 
         self.add_module_word('PAGE-INFO', self.word_PAGE_INFO)
 
-        self.add_module_word('NBSP', self.word_NBSP)
-        self.add_module_word('SPACES-WIDE', self.word_SPACES_WIDE)
+        self.add_module_word('NBSP', self.word_NBSP, uses_module_stack=False)
+        self.add_module_word('SPACES-WIDE', self.word_SPACES_WIDE, uses_module_stack=False)
 
-        self.add_module_word('|ESCAPE-TABLE-CONTENT', self.word_pipe_ESCAPE_TABLE_CONTENT)
-        self.add_module_word('|ESCAPE-NEWLINES', self.word_pipe_ESCAPE_NEWLINES)
-        self.add_module_word('COLOR-BOX', self.word_COLOR_BOX)
+        self.add_module_word('|ESCAPE-TABLE-CONTENT', self.word_pipe_ESCAPE_TABLE_CONTENT, uses_module_stack=False)
+        self.add_module_word('|ESCAPE-NEWLINES', self.word_pipe_ESCAPE_NEWLINES, uses_module_stack=False)
+        self.add_module_word('COLOR-BOX', self.word_COLOR_BOX, uses_module_stack=False)
         self.add_module_word('TABLE', self.word_TABLE)
         self.add_module_word('RENDER', self.word_RENDER)
 
@@ -308,30 +308,36 @@ class ConfluenceContext:
     def requests_get(self, api_url: str):
         """Makes HTTP GET call to pull data"""
         api_url_w_host = self.get_host() + api_url
+        import requests
         result = requests.get(
             api_url_w_host,
             auth=(self.get_username(), self.get_password()),
             verify=self.get_cert_verify(),
+            hooks=HTTP_HOOKS,
         )
         return result
 
     def requests_post(self, api_url: str, json: Optional[str] = None):
         api_url_w_host = self.get_host() + api_url
+        import requests
         result = requests.post(
             api_url_w_host,
             auth=(self.get_username(), self.get_password()),
             json=json,
             verify=self.get_cert_verify(),
+            hooks=HTTP_HOOKS,
         )
         return result
 
     def requests_put(self, api_url: str, json: Optional[str] = None):
         api_url_w_host = self.get_host() + api_url
+        import requests
         result = requests.put(
             api_url_w_host,
             auth=(self.get_username(), self.get_password()),
             json=json,
             verify=self.get_cert_verify(),
+            hooks=HTTP_HOOKS,
         )
         return result
 
@@ -1,9 +1,12 @@
 import base64
 import json
-from requests_oauthlib import OAuth2Session   # type: ignore
 from ..module import Module
+from ..profile import record_http_span
 from ..interfaces import IInterpreter
-from typing import List
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from requests_oauthlib import OAuth2Session   # type: ignore
 
 
 class ExcelError(RuntimeError):
@@ -226,7 +229,9 @@ class ExcelModule(Module):
     # =================================
     # Helpers
 
-    def get_msgraph_session(self) -> OAuth2Session:
+    def get_msgraph_session(self) -> 'OAuth2Session':
+        from requests_oauthlib import OAuth2Session   # type: ignore
+
         context = self.get_context()
         app_creds = context.get_app_creds()
         token = context.get_auth_token()
@@ -244,6 +249,7 @@ class ExcelModule(Module):
             auto_refresh_url=refresh_url,
             token_updater=token_updater,
         )
+        result.hooks['response'].append(record_http_span)
         return result
 
     def get_context(self) -> 'CredsContext':
@@ -254,7 +260,7 @@ class ExcelModule(Module):
         result = self.context_stack[-1]
         return result
 
-    def get_workbook_session_id(self, drive_id: str, item_id: str, msgraph_session: OAuth2Session) -> str:
+    def get_workbook_session_id(self, drive_id: str, item_id: str, msgraph_session: 'OAuth2Session') -> str:
         api_url = f'https://graph.microsoft.com/v1.0/drives/{drive_id}/items/{item_id}/workbook/createSession'
         request_body = {'persistChanges': True}
         context = self.get_context()
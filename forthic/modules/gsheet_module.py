@@ -1,10 +1,13 @@
 import re
 import json
 import urllib.parse
-from requests_oauthlib import OAuth2Session   # type: ignore
 from ..module import Module
+from ..profile import record_http_span
 from ..interfaces import IInterpreter
-from typing import List, Any, Dict, Optional, Tuple
+from typing import List, Any, Dict, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from requests_oauthlib import OAuth2Session   # type: ignore
 
 
 class GsheetError(RuntimeError):
@@ -833,7 +836,9 @@ class GsheetModule(Module):
         result = self.context_stack[-1]
         return result
 
-    def get_gsheets_session(self) -> OAuth2Session:
+    def get_gsheets_session(self) -> 'OAuth2Session':
+        from requests_oauthlib import OAuth2Session   # type: ignore
+
         context = self.get_context()
         app_creds = context.get_app_creds()
         token = context.get_auth_token()
@@ -849,6 +854,7 @@ class GsheetModule(Module):
             auto_refresh_url=refresh_url,
             token_updater=token_updater,
         )
+        result.hooks['response'].append(record_http_span)
         return result
 
 
@@ -1,6 +1,5 @@
 import json
 import html
-import markdown
 from ..module import Module
 import random
 from ..interfaces import IInterpreter
@@ -183,6 +182,7 @@ class HtmlModule(Module):
 
     # ( markdown -- html)
     def word_MARKDOWN_to_HTML(self, interp: IInterpreter):
+        import markdown
         markdown_content = interp.stack_pop()
         result = markdown.markdown(markdown_content)
         interp.stack_push(result)
@@ -1,4 +1,3 @@
-import jinja2
 from ..module import Module
 from ..interfaces import IInterpreter
 
@@ -17,6 +16,7 @@ class JinjaModule(Module):
         kw_args = interp.stack_pop()
         template_contents = interp.stack_pop()
 
+        import jinja2
         template = jinja2.Template(template_contents)
         result = template.render(kw_args)
         interp.stack_push(result)
@@ -1,10 +1,9 @@
 import re
-import requests
 import datetime
 import pytz
-from dateutil import parser
 from ..module import Module
 from ..global_module import drill_for_value
+from ..profile import HTTP_HOOKS
 from collections import defaultdict
 from ..utils.errors import UnauthorizedError
 from ..interfaces import IInterpreter
@@ -39,13 +38,13 @@ class JiraModule(Module):
         self.add_module_word('VOTES', self.word_VOTES)
 
         self.add_module_word('CHANGELOG', self.word_CHANGELOG)
-        self.add_module_word('FIELD-AS-OF', self.word_FIELD_AS_OF)
-        self.add_module_word('FIELD-CHANGE-AS-OF', self.word_FIELD_CHANGE_AS_OF)
-        self.add_module_word('TIME-IN-STATE', self.word_TIME_IN_STATE)
+        self.add_module_word('FIELD-AS-OF', self.word_FIELD_AS_OF, uses_module_stack=False)
+        self.add_module_word('FIELD-CHANGE-AS-OF', self.word_FIELD_CHANGE_AS_OF, uses_module_stack=False)
+        self.add_module_word('TIME-IN-STATE', self.word_TIME_IN_STATE, uses_module_stack=False)
 
-        self.add_module_word('FIELD-TAG', self.word_FIELD_TAG)
-        self.add_module_word('REMOVE-FIELD-TAGS', self.word_REMOVE_FIELD_TAGS)
-        self.add_module_word('<FIELD-TAG!', self.word_l_FIELD_TAG_bang)
+        self.add_module_word('FIELD-TAG', self.word_FIELD_TAG, uses_module_stack=False)
+        self.add_module_word('REMOVE-FIELD-TAGS', self.word_REMOVE_FIELD_TAGS, uses_module_stack=False)
+        self.add_module_word('<FIELD-TAG!', self.word_l_FIELD_TAG_bang, uses_module_stack=False)
 
     # ( context -- )
     def word_PUSH_CONTEXT_bang(self, interp: IInterpreter):
@@ -391,6 +390,7 @@ class JiraModule(Module):
             )
 
         ticket = res.json()
+        from dateutil import parser
 
         # NOTE: Changelog response uses field names instead of IDs. This may lead to a bug if there are duplicate
         #       custom field names
@@ -580,6 +580,8 @@ class JiraModule(Module):
         normalized_fields = [self.normalize_field(f) for f in fields]
         batch_size = 200
 
+        import requests
+
         def run_batch(start_at, session):
             req_data = {
                 'jql': jql,
@@ -701,12 +703,15 @@ class JiraContext:
                 api_url_w_host,
                 auth=(self.get_username(), self.get_password()),
                 verify=self.get_cert_verify(),
+                hooks=HTTP_HOOKS,
             )
         else:
+            import requests
             result = requests.get(
                 api_url_w_host,
                 auth=(self.get_username(), self.get_password()),
                 verify=self.get_cert_verify(),
+                hooks=HTTP_HOOKS,
             )
         return result
 
@@ -718,13 +723,16 @@ class JiraContext:
                 auth=(self.get_username(), self.get_password()),
                 json=json,
                 verify=self.get_cert_verify(),
+                hooks=HTTP_HOOKS,
             )
         else:
+            import requests
             result = requests.post(
                 api_url_w_host,
                 auth=(self.get_username(), self.get_password()),
                 json=json,
                 verify=self.get_cert_verify(),
+                hooks=HTTP_HOOKS,
             )
         return result
 
@@ -736,13 +744,16 @@ class JiraContext:
                 auth=(self.get_username(), self.get_password()),
                 json=json,
                 verify=self.get_cert_verify(),
+                hooks=HTTP_HOOKS,
             )
         else:
+            import requests
             result = requests.put(
                 api_url_w_host,
                 auth=(self.get_username(), self.get_password()),
                 json=json,
                 verify=self.get_cert_verify(),
+                hooks=HTTP_HOOKS,
             )
         return result
 
@@ -0,0 +1,198 @@
+import math
+import time
+import threading
+import collections
+import concurrent.futures
+from .interpreter import Interpreter
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Chunks of items should take about this long to run, so the cost of sending chunks to workers and results back is
+# small compared to the time spent running Forthic
+TARGET_CHUNK_SECONDS = 0.02
+
+# Items are split into at least this many chunks per worker, so workers that finish early can pick up more chunks
+CHUNKS_PER_WORKER = 4
+
+# Max number of process pools kept at a time (see `get_process_pool`)
+MAX_PROCESS_POOLS = 4
+
+
+class WorkerSpec:
+    """Describes how worker processes set up their interpreters
+
+    Workers register the same module classes as the original interpreter, copy its screens, and then run its
+    `process_setup` Forthic (e.g., to use modules or load screens). Module classes must be importable by the
+    workers (i.e., defined at the top level of a module).
+    """
+    def __init__(self, timezone: Any, module_classes: List[type], screens: Dict[str, str], setup_forthic: str,
+                 vm_mode: bool, codegen_mode: bool):
+        self.timezone = timezone
+        self.module_classes = module_classes
+        self.screens = screens
+        self.setup_forthic = setup_forthic
+        self.vm_mode = vm_mode
+        self.codegen_mode = codegen_mode
+
+    @staticmethod
+    def from_interpreter(interp: Interpreter) -> 'WorkerSpec':
+        return WorkerSpec(
+            interp.timezone,
+            [type(module) for module in interp.registered_modules.values()],
+            dict(interp.app_module.screens),   # type: ignore
+            interp.process_setup,
+            interp.vm_mode,
+            interp.codegen_mode,
+        )
+
+    def key(self) -> Tuple:
+        """Returns a key that's equal for specs that set up workers the same way"""
+        return (
+            str(self.timezone),
+            tuple(self.module_classes),
+            tuple(sorted(self.screens.items())),
+            self.setup_forthic,
+            self.vm_mode,
+            self.codegen_mode,
+        )
+
+    def create_interpreter(self) -> Interpreter:
+        result = Interpreter(self.timezone, vm_mode=self.vm_mode, codegen_mode=self.codegen_mode)
+        for module_class in self.module_classes:
+            result.register_module(module_class)
+        for name, content in self.screens.items():
+            result.app_module.set_screen(name, content)   # type: ignore
+        if self.setup_forthic:
+            result.run(self.setup_forthic)
+        return result
+
+
+# The interpreter of a worker process
+_worker_interp: Optional[Interpreter] = None
+
+
+def init_worker(spec: WorkerSpec) -> None:
+    global _worker_interp
+    _worker_interp = spec.create_interpreter()
+
+
+def run_chunk(forthic: str, items: List[Any]) -> Tuple[List[Any], float]:
+    """Runs `forthic` for each item in a worker process, returning the results and the time taken
+
+    Each item starts with an empty stack in the app module, even if the previous item raised an error.
+    """
+    start = time.perf_counter()
+    interp = _worker_interp.thread_interpreter()   # type: ignore
+    interp.stack = []
+    interp.module_stack = [interp.app_module]
+    compiled = interp.compile_forthic(forthic)
+
+    result = []
+    for item in items:
+        interp.stack_push(item)
+        try:
+            compiled.execute(interp)
+            result.append(interp.stack_pop())
+        finally:
+            interp.stack.clear()
+            del interp.module_stack[1:]
+    return result, time.perf_counter() - start
+
+
+class ProcessPool:
+    """A pool of worker processes with interpreters set up according to a `WorkerSpec`
+
+    Items are sent to workers in chunks. The chunk size is tuned using the time per item of previous runs of the
+    same Forthic string (see `get_chunk_size`).
+    """
+    def __init__(self, spec: WorkerSpec, num_workers: int):
+        self.spec = spec
+        self.num_workers = num_workers
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers, initializer=init_worker, initargs=(spec,)
+        )
+
+        # Maps Forthic strings to the average time in seconds that workers took to run them for an item
+        self.seconds_per_item: Dict[str, float] = {}
+
+    def get_chunk_size(self, forthic: str, num_items: int) -> int:
+        """Returns the number of items to send to a worker at a time
+
+        If the time per item is known, chunks take about `TARGET_CHUNK_SECONDS` to run. Chunks are never bigger
+        than needed to give each worker `CHUNKS_PER_WORKER` chunks.
+        """
+        max_size = max(1, math.ceil(num_items / (self.num_workers * CHUNKS_PER_WORKER)))
+        seconds_per_item = self.seconds_per_item.get(forthic)
+        if not seconds_per_item:
+            return max_size
+        return max(1, min(max_size, int(TARGET_CHUNK_SECONDS / seconds_per_item)))
+
+    def submit(self, forthic: str, items: List[Any]) -> List[concurrent.futures.Future]:
+        """Sends chunks of items to workers, returning a future for each chunk"""
+        chunk_size = self.get_chunk_size(forthic, len(items))
+        return [
+            self.executor.submit(run_chunk, forthic, items[i:i + chunk_size])
+            for i in range(0, len(items), chunk_size)
+        ]
+
+    def get_results(self, forthic: str, futures: List[concurrent.futures.Future], num_items: int) -> List[Any]:
+        """Returns the results of submitted chunks in order, noting the time per item for later runs"""
+        result: List[Any] = []
+        seconds = 0.0
+        try:
+            for future in futures:
+                chunk_result, chunk_seconds = future.result()
+                result.extend(chunk_result)
+                seconds += chunk_seconds
+        finally:
+            for future in futures:
+                future.cancel()
+
+        self.seconds_per_item[forthic] = seconds / num_items
+        return result
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False)
+
+
+# Process pools by worker spec key and number of workers, least recently used first
+_process_pools: 'collections.OrderedDict[Tuple, ProcessPool]' = collections.OrderedDict()
+_process_pools_lock = threading.Lock()
+
+
+def process_map(interp: Interpreter, forthic: str, items: List[Any]) -> List[Any]:
+    """Runs `forthic` for each item in worker processes, returning the results in order
+
+    Workers are shared by interpreters that set them up the same way (see `WorkerSpec`). If an item raises an
+    error, the error is raised here.
+    """
+    if not items:
+        return []
+
+    spec = WorkerSpec.from_interpreter(interp)
+    num_workers = interp.process_workers
+    key = (spec.key(), num_workers)
+
+    # Chunks are submitted while holding the lock so a pool isn't shut down (see `MAX_PROCESS_POOLS`) before its
+    # chunks are queued
+    with _process_pools_lock:
+        pool = _process_pools.get(key)
+        if pool is None:
+            pool = ProcessPool(spec, num_workers)
+            _process_pools[key] = pool
+            while len(_process_pools) > MAX_PROCESS_POOLS:
+                _, old_pool = _process_pools.popitem(last=False)
+                old_pool.shutdown()
+        else:
+            _process_pools.move_to_end(key)
+        futures = pool.submit(forthic, items)
+
+    return pool.get_results(forthic, futures, len(items))
+
+
+def shutdown_process_pools() -> None:
+    """Shuts down all worker processes"""
+    with _process_pools_lock:
+        for pool in _process_pools.values():
+            pool.shutdown()
+        _process_pools.clear()
@@ -1,7 +1,13 @@
+import os
 import time
-from typing import List, Optional
+import threading
+import tracemalloc
+from typing import Any, Dict, List, Optional, Union
 from .interfaces import IModule, IWord
 
+# The `ProfileTrace` of the profiling run in the current thread, if any (see `get_active_trace`)
+active_trace = threading.local()
+
 
 class WordProfile:
     """Stores information about a word's execution time
@@ -17,6 +23,13 @@ class WordProfile:
         self.end_time: Optional[float] = None
         self.word_profiles: List['WordProfile'] = []
         self.index: int = -1
+        self.thread_id = threading.get_ident()
+
+        # Memory profiling support (see `start_memory_profile`)
+        self.net_bytes: Optional[int] = None
+        self.peak_bytes: Optional[int] = None
+        self.start_bytes = 0
+        self.max_bytes = 0
 
         if self.parent:
             self.parent.add_word_profile(self)
@@ -41,6 +54,286 @@ class WordProfile:
         result = self.end_time - self.start_time
         return result
 
+    def add_memory(self, net_bytes: int, peak_bytes: int) -> None:
+        self.net_bytes = net_bytes
+        self.peak_bytes = peak_bytes
+
+    def get_details(self) -> str:
+        return memory_details(self)
+
+
+class AggregateWordProfile:
+    """Stores execution time statistics for all calls of a word along one path of calls
+
+    Aggregate profiling runs (see `Interpreter.start_profiling`) record one AggregateWordProfile per distinct
+    path of calls instead of a WordProfile per word execution, so their memory use is proportional to the
+    number of paths rather than the number of executions. The root profile has no word and covers the run.
+
+    Words called along a path are stored in `word_profiles` in the order they were first called, so a
+    ProfileAnalyzer can navigate an aggregate profile like a WordProfile.
+    """
+    __slots__ = (
+        'parent', 'module', 'word', 'children', 'word_profiles', 'index',
+        'count', 'total_time', 'min_time', 'max_time', 'start_time',
+        'net_bytes', 'peak_bytes', 'start_bytes', 'max_bytes',
+    )
+
+    def __init__(self, parent: Optional['AggregateWordProfile'], module: IModule, word: Optional[IWord]):
+        self.parent = parent
+        self.module = module
+        self.word = word
+        self.children: Dict[IWord, 'AggregateWordProfile'] = {}
+        self.word_profiles: List['AggregateWordProfile'] = []
+        self.index: int = -1
+
+        self.count = 0
+        self.total_time = 0.0
+        self.min_time = float('inf')
+        self.max_time = 0.0
+        self.start_time = 0.0   # Start of the call in progress (a path can't be executing more than once)
+
+        # Memory profiling support: total net bytes and the largest peak of all calls (see `start_memory_profile`)
+        self.net_bytes: Optional[int] = None
+        self.peak_bytes: Optional[int] = None
+        self.start_bytes = 0
+        self.max_bytes = 0
+
+    def start_word(self, module: IModule, word: IWord) -> 'AggregateWordProfile':
+        """Returns the profile of a call of `word` from this path, marking the start of the call"""
+        result = self.children.get(word)
+        if result is None:
+            result = AggregateWordProfile(self, module, word)
+            self.children[word] = result
+            self.word_profiles.append(result)
+        result.start_time = time.perf_counter()
+        return result
+
+    def end_profile(self) -> None:
+        if self.word is None:
+            return   # The root isn't a call
+
+        duration = time.perf_counter() - self.start_time
+        self.count += 1
+        self.total_time += duration
+        if duration < self.min_time:
+            self.min_time = duration
+        if duration > self.max_time:
+            self.max_time = duration
+
+    def get_key(self) -> str:
+        if self.word is None:
+            return 'PROFILE'
+        return f'{self.module.name}:{self.word.name}'
+
+    def get_parent(self) -> Optional['AggregateWordProfile']:
+        return self.parent
+
+    def get_root(self) -> 'AggregateWordProfile':
+        result = self
+        while result.parent:
+            result = result.parent
+        return result
+
+    def get_duration_s(self) -> Optional[float]:
+        """Returns the total time of all calls along this path (or of all calls made during the run, for the root)"""
+        if self.word is None:
+            return sum(p.total_time for p in self.word_profiles)
+        if not self.count:
+            return None
+        return self.total_time
+
+    def get_self_time_s(self) -> float:
+        """Returns the total time of calls along this path, minus the time spent in the words they called"""
+        duration = self.get_duration_s() or 0.0
+        return duration - sum(p.total_time for p in self.word_profiles)
+
+    def add_memory(self, net_bytes: int, peak_bytes: int) -> None:
+        self.net_bytes = (self.net_bytes or 0) + net_bytes
+        self.peak_bytes = max(self.peak_bytes or 0, peak_bytes)
+
+    def get_details(self) -> str:
+        if not self.count:
+            return ''
+        return ' (%d calls, self %.3f s, min %.3f s, max %.3f s)%s' % (
+            self.count, self.get_self_time_s(), self.min_time, self.max_time, memory_details(self)
+        )
+
+
+Profile = Union[WordProfile, AggregateWordProfile]
+
+
+def start_memory_profile(profile: Profile) -> None:
+    """Notes the memory allocated by Python at the start of a word's execution during a memory profiling run
+
+    Words are measured with `tracemalloc`'s traced memory, whose peak is reset at each word boundary, so a
+    word's peak includes the peaks of the words it calls. Since tracemalloc traces the whole process, memory
+    allocated by other threads at the same time is also attributed to the word.
+    """
+    current, peak = tracemalloc.get_traced_memory()
+    parent = profile.parent
+    if parent is not None and peak > parent.max_bytes:
+        parent.max_bytes = peak
+    tracemalloc.reset_peak()
+    profile.start_bytes = current
+    profile.max_bytes = current
+
+
+def end_memory_profile(profile: Profile) -> None:
+    """Records the net and peak bytes allocated by a word's execution during a memory profiling run"""
+    if profile.word is None:
+        return   # Aggregate roots aren't calls
+
+    current, peak = tracemalloc.get_traced_memory()
+    max_bytes = max(profile.max_bytes, peak)
+    profile.add_memory(current - profile.start_bytes, max_bytes - profile.start_bytes)
+    parent = profile.parent
+    if parent is not None and max_bytes > parent.max_bytes:
+        parent.max_bytes = max_bytes
+    tracemalloc.reset_peak()
+
+
+def memory_details(profile: Profile) -> str:
+    if profile.peak_bytes is None:
+        return ''
+    return ' [net %s, peak %s]' % (format_bytes(profile.net_bytes or 0), format_bytes(profile.peak_bytes))
+
+
+def format_bytes(num_bytes: int) -> str:
+    if abs(num_bytes) < 1024:
+        return f'{num_bytes} B'
+    if abs(num_bytes) < 1024 ** 2:
+        return f'{num_bytes / 1024:.1f} KB'
+    if abs(num_bytes) < 1024 ** 3:
+        return f'{num_bytes / 1024 ** 2:.1f} MB'
+    return f'{num_bytes / 1024 ** 3:.1f} GB'
+
+
+class ProfileTrace:
+    """Records the word profiles of a profiling run, along with spans like HTTP requests, for `PROFILE-TRACE`
+
+    Threads that run words for a profiled word (e.g., `PARALLEL-MAP` workers) add their word profiles and
+    spans to the caller's trace, so a trace can cover several threads. Traces are exported in the Chrome Trace
+    Event format, which can be loaded into Perfetto (https://ui.perfetto.dev) or chrome://tracing.
+
+    Aggregate profiling runs don't record word profiles, so their traces only have timestamps and spans.
+    """
+    def __init__(self, start_time: float):
+        self.start_time = start_time
+        self.word_profiles: List[WordProfile] = []   # Profiles of words that weren't called by profiled words
+        self.spans: List[Dict[str, Any]] = []
+        self.thread_names: Dict[int, str] = {}
+
+    def add_thread(self) -> None:
+        """Notes the name of the current thread, which runs words for this trace"""
+        self.thread_names[threading.get_ident()] = threading.current_thread().name
+
+    def add_span(self, name: str, category: str, start_time: float, end_time: float,
+                 args: Optional[Dict[str, Any]] = None) -> None:
+        """Adds a span of time in the current thread (e.g., an HTTP request) to the trace"""
+        self.spans.append({
+            'name': name,
+            'category': category,
+            'start_time': start_time,
+            'end_time': end_time,
+            'thread_id': threading.get_ident(),
+            'args': args or {},
+        })
+
+    def get_chrome_trace(self, timestamps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Returns the trace as Chrome Trace Event JSON data
+
+        Word profiles and spans are complete events, and the `timestamps` of the profiling run (see
+        `PROFILE-TIMESTAMP`) are instant events.
+        """
+        pid = os.getpid()
+
+        def to_us(t: float) -> float:
+            return round((t - self.start_time) * 1e6, 3)
+
+        events: List[Dict[str, Any]] = []
+        for thread_id, thread_name in self.thread_names.items():
+            events.append({
+                'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': thread_name},
+            })
+
+        profiles = list(reversed(self.word_profiles))
+        while profiles:
+            profile = profiles.pop()
+            profiles.extend(reversed(profile.word_profiles))
+            if profile.end_time is None:
+                continue
+            events.append({
+                'name': profile.word.name,
+                'cat': 'word',
+                'ph': 'X',
+                'ts': to_us(profile.start_time),
+                'dur': to_us(profile.end_time) - to_us(profile.start_time),
+                'pid': pid,
+                'tid': profile.thread_id,
+                'args': {'module': profile.module.name},
+            })
+
+        for span in self.spans:
+            events.append({
+                'name': span['name'],
+                'cat': span['category'],
+                'ph': 'X',
+                'ts': to_us(span['start_time']),
+                'dur': to_us(span['end_time']) - to_us(span['start_time']),
+                'pid': pid,
+                'tid': span['thread_id'],
+                'args': span['args'],
+            })
+
+        thread_id = threading.get_ident()
+        for t in timestamps:
+            events.append({
+                'name': t['label'],
+                'cat': 'timestamp',
+                'ph': 'i',
+                's': 'p',
+                'ts': round(t['time'] * 1e6, 3),
+                'pid': pid,
+                'tid': thread_id,
+            })
+
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def get_active_trace() -> Optional[ProfileTrace]:
+    """Returns the trace of the profiling run in the current thread, or None if the thread isn't profiling"""
+    return getattr(active_trace, 'trace', None)
+
+
+def set_active_trace(trace: Optional[ProfileTrace]) -> None:
+    active_trace.trace = trace
+    if trace:
+        trace.add_thread()
+
+
+def record_http_span(response: Any, *args, **kwargs) -> None:
+    """A `requests` response hook that adds requests made while profiling to the profiling run's trace
+
+    Integration modules pass this in `hooks` (see `HTTP_HOOKS`). The span covers the time from sending the
+    request until its response headers were parsed (`response.elapsed`).
+    """
+    trace = get_active_trace()
+    if trace is None:
+        return
+
+    end_time = time.perf_counter()
+    trace.add_span(
+        f'{response.request.method} {response.url}',
+        'http',
+        end_time - response.elapsed.total_seconds(),
+        end_time,
+        {'status': response.status_code},
+    )
+
+
+# Passed as the `hooks` of `requests` calls so profiling runs include HTTP requests
+HTTP_HOOKS = {'response': record_http_span}
+
 
 class ProfileAnalyzer:
     """Prints a report for a WordProfile and allows navigation through the call tree
@@ -52,12 +345,15 @@ class ProfileAnalyzer:
                         by an index which represent the order in which the words were called.
         * up()          This drills up to the current word's parent and calls print()
         * down(index)   This drills down to a word at the specified index (see print()) and calls print()
+        * sort(by)      This sorts called words by 'time' or, for memory profiling runs, by 'memory' (peak
+                        bytes) and calls print()
     """
 
-    def __init__(self, word_profile: WordProfile):
-        self.word_profile: WordProfile = word_profile
-        self.cur_profile: WordProfile = word_profile
+    def __init__(self, word_profile: Profile):
+        self.word_profile = word_profile
+        self.cur_profile: Any = word_profile
         self.num_called: int = 10   # Limits number of called words to display
+        self.sort_by: str = 'time'
 
     def down(self, index: int) -> None:
         self.cur_profile = self.cur_profile.word_profiles[index]
@@ -67,6 +363,12 @@ class ProfileAnalyzer:
         self.cur_profile = self.cur_profile.get_parent()
         self.print()
 
+    def sort(self, by: str) -> None:
+        if by not in ('time', 'memory'):
+            raise ValueError(f"Can't sort by {by!r}: use 'time' or 'memory'")
+        self.sort_by = by
+        self.print()
+
     def print(self) -> None:
         duration = self.cur_profile.get_duration_s()
         if not duration:
@@ -74,8 +376,8 @@ class ProfileAnalyzer:
             return
 
         print(
-            '%s: %.3f s'
-            % (self.cur_profile.get_key(), duration)
+            '%s: %.3f s%s'
+            % (self.cur_profile.get_key(), duration, self.cur_profile.get_details())
         )
         for i, p in enumerate(self.cur_profile.word_profiles):
             p.index = i
@@ -94,12 +396,15 @@ class ProfileAnalyzer:
                     res = len(key)
             return res
 
+        def get_peak_bytes(profile):
+            return profile.peak_bytes or 0
+
         sorted_profiles = sorted(
-            self.cur_profile.word_profiles, key=get_duration
+            self.cur_profile.word_profiles, key=get_peak_bytes if self.sort_by == 'memory' else get_duration
         )
         sorted_profiles.reverse()
         format_string = (
-            f'    [%d] %{get_max_key_len(sorted_profiles) + 1}s: %.3f s'
+            f'    [%d] %{get_max_key_len(sorted_profiles) + 1}s: %.3f s%s'
         )
         for p in sorted_profiles[: self.num_called]:
-            print(format_string % (p.index, p.get_key(), get_duration(p)))
+            print(format_string % (p.index, p.get_key(), get_duration(p), p.get_details()))
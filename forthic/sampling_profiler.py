@@ -0,0 +1,149 @@
+import collections
+import threading
+import time
+from .interfaces import IModule, IWord
+from .interpreter import DEFAULT_SAMPLE_RATE, DefinitionWord, ThreadInterpreter
+from typing import Any, Dict, List, Optional, Tuple
+
+# The definitions a thread interpreter is executing while it's sampled, outermost first. Each frame is a list of
+# [module, definition, word being executed], updated by `Interpreter.execute_definition_sampled`.
+Frame = List[Any]
+
+# Labels of the definitions and words being executed when a sample was taken, outermost first
+Stack = Tuple[str, ...]
+
+
+class SamplingProfiler:
+    """Periodically records the Forthic call stack of a thread interpreter from a background thread
+
+    Unlike `PROFILE-START`, which records the time of every word, sampling only adds a list append and pop to
+    each definition call, so it can be left on for long runs. A stack is a list of the definitions being
+    executed (labeled with their module, e.g., `jira.SEARCH-ISSUES`) followed by the words they were executing
+    (e.g., `MAP`). Samples are only taken while definitions are running.
+
+    While sampling, definitions are executed word by word (even in VM or codegen mode) so their words can be
+    recorded. Definitions that are already executing when sampling starts aren't included in stacks.
+
+    The collected stacks can be returned in the `folded` format used by flamegraph tools (see `folded`) or as
+    a speedscope profile (see `speedscope`).
+    """
+    def __init__(self, interp: ThreadInterpreter, rate: float = DEFAULT_SAMPLE_RATE):
+        if rate <= 0:
+            raise ValueError(f'Sample rate must be positive: {rate}')
+        self.interp = interp
+        self.interval = 1.0 / rate
+
+        self.frames: List[Frame] = []
+        self.counts: Dict[Stack, int] = collections.defaultdict(int)
+
+        # Seconds between samples, attributed to the stack of the later sample
+        self.times: Dict[Stack, float] = collections.defaultdict(float)
+
+        self.thread: Optional[threading.Thread] = None
+        self.stop_event = threading.Event()
+
+    def start(self) -> None:
+        """Starts sampling in a daemon thread"""
+        if self.thread:
+            return
+        interp = self.interp
+        interp.sampled_frames = self.frames
+        interp.update_definition_executor()
+
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name='forthic-sampling-profiler', daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stops sampling. Must be called from the thread being sampled."""
+        if not self.thread:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+        interp = self.interp
+        interp.sampled_frames = None
+        interp.update_definition_executor()
+
+    def run(self) -> None:
+        prev_time = time.perf_counter()
+        while not self.stop_event.wait(self.interval):
+            now = time.perf_counter()
+            self.add_sample(now - prev_time)
+            prev_time = now
+
+    def add_sample(self, seconds: float) -> None:
+        stack = self.get_stack()
+        if stack:
+            self.counts[stack] += 1
+            self.times[stack] += seconds
+
+    def get_stack(self) -> Stack:
+        """Returns the labels of the definitions and words that are being executed"""
+        # NOTE: Frames are changed by the sampled thread, so they're copied first
+        frames = [tuple(f) for f in list(self.frames)]
+        result = []
+        for module, definition, word in frames:
+            result.append(definition_label(module, definition))
+
+            # Words that call definitions (e.g., `MAP`) appear between the definitions
+            if word is not None and not is_definition(word):
+                result.append(word.name)
+        return tuple(result)
+
+    @property
+    def num_samples(self) -> int:
+        return sum(self.counts.values())
+
+    def folded(self) -> str:
+        """Returns the samples as collapsed stacks, one per line (e.g., `MAIN;REPORT;MAP;ROW 12`)
+
+        This is the input format of `flamegraph.pl` and similar tools.
+        """
+        lines = [f"{';'.join(stack)} {count}" for stack, count in sorted(self.counts.items())]
+        return '\n'.join(lines)
+
+    def speedscope(self, name: str = 'Forthic') -> Dict[str, Any]:
+        """Returns the samples as a speedscope profile (https://www.speedscope.app/file-format-schema.json)
+
+        Each distinct stack is one sample, weighted by the seconds spent in it. This should be saved with
+        `json.dump`.
+        """
+        frame_indexes: Dict[str, int] = {}
+        samples = []
+        weights = []
+        for stack, seconds in sorted(self.times.items()):
+            samples.append([frame_indexes.setdefault(label, len(frame_indexes)) for label in stack])
+            weights.append(seconds)
+
+        return {
+            '$schema': 'https://www.speedscope.app/file-format-schema.json',
+            'name': name,
+            'exporter': 'forthic',
+            'activeProfileIndex': 0,
+            'shared': {
+                'frames': [{'name': label} for label in frame_indexes],
+            },
+            'profiles': [
+                {
+                    'type': 'sampled',
+                    'name': name,
+                    'unit': 'seconds',
+                    'startValue': 0,
+                    'endValue': sum(weights),
+                    'samples': samples,
+                    'weights': weights,
+                }
+            ],
+        }
+
+
+def definition_label(module: IModule, definition: IWord) -> str:
+    if module.name:
+        return f'{module.name}.{definition.name}'
+    return definition.name
+
+
+def is_definition(word: IWord) -> bool:
+    return isinstance(word, DefinitionWord) or isinstance(getattr(word, 'module_word', None), DefinitionWord)
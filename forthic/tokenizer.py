@@ -1,3 +1,4 @@
+import re
 from .tokens import StartArrayToken, EndArrayToken, StartDefinitionToken, EndDefinitionToken,\
     CommentToken, StartModuleToken, EndModuleToken, StringToken, WordToken, EOSToken, Token
 from typing import List
@@ -169,3 +170,119 @@ class Tokenizer:
             else:
                 self.token_string += char
         return WordToken(self.token_string)
+
+
+# Patterns used by the FastTokenizer. Whitespace includes parens so they can be used to group words visually.
+WHITESPACE_CHARS = ' \t\n\r()'
+QUOTE_CHARS = '"\'^' + DLE
+WHITESPACE_RE = re.compile(r'[ \t\n\r()]*')
+WORD_RE = re.compile(r'[^ \t\n\r();\[\]}]*')
+MODULE_NAME_RE = re.compile(r'[^ \t\n\r()}]*')
+DEFINITION_NAME_RE = re.compile(r'[^ \t\n\r()]*')
+INVALID_DEFINITION_CHAR_RE = re.compile('[' + re.escape(QUOTE_CHARS + '[]{}') + ']')
+
+
+class FastTokenizer:
+    """A FastTokenizer returns exactly the same tokens as a Tokenizer, but scans its input with compiled regexes
+    and `str.find`, slicing tokens out of the input string instead of gathering them one char at a time.
+    """
+    def __init__(self, string: str):
+        self.input_string: str = string
+        self.position: int = 0
+
+    def next_token(self) -> Token:
+        string = self.input_string
+        position = self.skip_whitespace(self.position)
+        if position >= len(string):
+            self.position = position
+            return EOSToken()
+
+        char = string[position]
+        self.position = position + 1
+        if char == '#':
+            return self.gather_comment()
+        elif char == ':':
+            return self.gather_definition_name()
+        elif char == ';':
+            return EndDefinitionToken()
+        elif char == '[':
+            return StartArrayToken()
+        elif char == ']':
+            return EndArrayToken()
+        elif char == '{':
+            return self.gather_module_name()
+        elif char == '}':
+            return EndModuleToken()
+        elif char in QUOTE_CHARS:
+            if string.startswith(char * 3, position):
+                self.position = position + 3
+                return self.gather_triple_quote_string(char)
+            return self.gather_string(char)
+        else:
+            self.position = position
+            return WordToken(self.gather(WORD_RE))
+
+    # =======
+    # Internal functions
+
+    def skip_whitespace(self, position: int) -> int:
+        """Returns the position of the first non-whitespace char at or after `position`"""
+        match = WHITESPACE_RE.match(self.input_string, position)
+        return match.end() if match else position
+
+    def gather(self, pattern) -> str:
+        """Returns the text matching `pattern` at the current position, skipping one trailing whitespace char"""
+        string = self.input_string
+        end = pattern.match(string, self.position).end()
+        result = string[self.position:end]
+        if end < len(string) and string[end] in WHITESPACE_CHARS:
+            end += 1
+        self.position = end
+        return result
+
+    def gather_comment(self) -> CommentToken:
+        string = self.input_string
+        end = string.find('\n', self.position)
+        end = len(string) if end == -1 else end + 1
+        result = CommentToken(string[self.position:end])
+        self.position = end
+        return result
+
+    def gather_definition_name(self) -> StartDefinitionToken:
+        string = self.input_string
+        self.position = self.skip_whitespace(self.position)
+        if self.position >= len(string):
+            raise InvalidDefinitionError("Got EOS in START_DEFINITION")
+
+        name = self.gather(DEFINITION_NAME_RE)
+        invalid_char = INVALID_DEFINITION_CHAR_RE.search(name)
+        if invalid_char:
+            char = invalid_char.group()
+            if char in QUOTE_CHARS:
+                raise InvalidDefinitionError("Definitions can't have quotes in them")
+            raise InvalidDefinitionError(f"Definitions can't have '{char}' in them")
+        return StartDefinitionToken(name)
+
+    def gather_module_name(self) -> StartModuleToken:
+        return StartModuleToken(self.gather(MODULE_NAME_RE))
+
+    def gather_triple_quote_string(self, string_delimiter: str) -> StringToken:
+        string = self.input_string
+        end = string.find(string_delimiter * 3, self.position)
+        if end == -1:
+            self.position = len(string)
+            raise UnterminatedStringError(f"Unterminated triple quoted string ({string_delimiter*3})")
+        result = StringToken(string[self.position:end])
+        self.position = end + 3
+        return result
+
+    def gather_string(self, string_delimiter: str) -> StringToken:
+        string = self.input_string
+        end = string.find(string_delimiter, self.position)
+        if end == -1:
+            rest = string[self.position:]
+            self.position = len(string)
+            raise UnterminatedStringError(f"Unterminated string ({string_delimiter}), {rest}")
+        result = StringToken(string[self.position:end])
+        self.position = end + 1
+        return result
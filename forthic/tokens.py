@@ -1,47 +1,57 @@
 class Token:
-    pass
+    __slots__ = ()
 
 
 class StringToken(Token):
+    __slots__ = ('string',)
+
     def __init__(self, string: str):
         self.string: str = string
 
 
 class CommentToken(Token):
+    __slots__ = ('string',)
+
     def __init__(self, string: str):
         self.string: str = string
 
 
 class StartArrayToken(Token):
-    pass
+    __slots__ = ()
 
 
 class EndArrayToken(Token):
-    pass
+    __slots__ = ()
 
 
 class StartModuleToken(Token):
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name: str = name
 
 
 class EndModuleToken(Token):
-    pass
+    __slots__ = ()
 
 
 class StartDefinitionToken(Token):
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name: str = name
 
 
 class EndDefinitionToken(Token):
-    pass
+    __slots__ = ()
 
 
 class WordToken(Token):
+    __slots__ = ('name',)
+
     def __init__(self, name: str):
         self.name: str = name
 
 
 class EOSToken(Token):
-    pass
+    __slots__ = ()
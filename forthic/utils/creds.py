@@ -1,6 +1,5 @@
 import os
 import json
-from cryptography.fernet import Fernet
 
 
 class MissingSecretsFile(RuntimeError):
@@ -164,6 +163,7 @@ class Creds:
 
     def ensure_key(self):
         if not self.does_key_file_exist():
+            from cryptography.fernet import Fernet
             key = Fernet.generate_key()
             with open(self.get_key_filepath(), 'wb') as f:
                 f.write(key)
@@ -182,6 +182,7 @@ class Creds:
         return result
 
     def encrypt_string(self, string):
+        from cryptography.fernet import Fernet
         key = self.get_key()
         fernet = Fernet(key)
         message = string.encode()
@@ -192,6 +193,7 @@ class Creds:
         key = self.get_key()
         if not string:
             return string
+        from cryptography.fernet import Fernet
         fernet = Fernet(key)
         message = string.encode()
         result = fernet.decrypt(message).decode()
@@ -0,0 +1,201 @@
+import math
+import os
+import threading
+import time
+from .module import Module, ModuleWord, bump_dictionary_generation
+from .interfaces import IInterpreter
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Each power of 2 is split into this many buckets, so recorded latencies are within about 3% of their values
+SUB_BUCKETS = 32
+
+# Latencies are recorded as at least this many seconds
+MIN_LATENCY = 1e-9
+
+# Upper bounds (in seconds) of the buckets of Prometheus histograms
+PROMETHEUS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Quantiles included in snapshots
+SNAPSHOT_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def bucket_index(seconds: float, frexp=math.frexp) -> int:
+    """Returns the index of the log-scaled bucket that a latency falls into"""
+    if seconds < MIN_LATENCY:
+        seconds = MIN_LATENCY
+    mantissa, exponent = frexp(seconds)   # 0.5 <= mantissa < 1
+    return (exponent - 1) * SUB_BUCKETS + int(mantissa * (2 * SUB_BUCKETS))
+
+
+def bucket_upper_bound(index: int) -> float:
+    exponent, sub_bucket = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub_bucket + 1) / (2 * SUB_BUCKETS), exponent)
+
+
+class LatencyHistogram:
+    """Counts latencies in log-scaled buckets, like an HDR histogram
+
+    Each power of 2 is split into `SUB_BUCKETS` buckets, so a histogram has the same relative precision for
+    microsecond and minute latencies and only stores counts for the buckets that have been used.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = 0   # All calls, including ones that weren't timed
+        self.count = 0   # Timed calls
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets: Dict[int, int] = {}
+
+    def count_call(self) -> int:
+        """Counts a call, returning the number of calls so far"""
+        with self.lock:
+            self.calls += 1
+            return self.calls
+
+    def record(self, seconds: float) -> None:
+        index = bucket_index(seconds)
+        buckets = self.buckets
+        with self.lock:
+            self.count += 1
+            self.total += seconds
+            if seconds < self.min:
+                self.min = seconds
+            if seconds > self.max:
+                self.max = seconds
+            buckets[index] = buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Returns the latency that `q` of the timed calls were at most (within the precision of a bucket)"""
+        with self.lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            num_calls = 0
+            for index in sorted(self.buckets):
+                num_calls += self.buckets[index]
+                if num_calls >= rank:
+                    return min(bucket_upper_bound(index), self.max)
+            return self.max
+
+    def count_at_most(self, seconds: float) -> int:
+        """Returns the number of timed calls in buckets whose latencies are at most `seconds`"""
+        with self.lock:
+            return sum(n for index, n in self.buckets.items() if bucket_upper_bound(index) <= seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            result: Dict[str, Any] = {
+                'calls': self.calls,
+                'count': self.count,
+                'sum': self.total,
+                'min': self.min if self.count else None,
+                'max': self.max if self.count else None,
+                'mean': self.total / self.count if self.count else None,
+            }
+        for q in SNAPSHOT_QUANTILES:
+            result[f'p{round(q * 100)}'] = self.quantile(q)
+        return result
+
+
+class WordMetrics:
+    """Records latency histograms for the Python words of an interpreter's modules
+
+    This is enabled with `Interpreter.enable_word_metrics`, which replaces the handlers of the modules'
+    `ModuleWord`s with handlers that time them. Words that aren't instrumented (including definitions) don't
+    pay anything. To keep the cost low for cheap words, only one of every `sample_every` calls is timed (calls
+    are always counted).
+
+    Histograms are labeled by module and word (e.g., `jira.SEARCH`) and can be read with `snapshot` or written
+    in the Prometheus text format with `write_prometheus`.
+    """
+    def __init__(self, sample_every: int = 1):
+        if sample_every < 1:
+            raise ValueError(f'sample_every must be at least 1: {sample_every}')
+        self.sample_every = sample_every
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.instrumented_words: Set[ModuleWord] = set()
+
+    def instrument_module(self, module: Module, prefix: Optional[str] = None) -> None:
+        """Times the module's Python words, labeling them with `prefix` (the module name by default)"""
+        if prefix is None:
+            prefix = module.name
+        for word in module.words:
+            if type(word) is not ModuleWord or word in self.instrumented_words:
+                continue
+            label = f'{prefix}.{word.name}' if prefix else word.name
+            histogram = self.histograms.setdefault(label, LatencyHistogram())
+            word.handler = self.timed_handler(word.handler, histogram)
+            self.instrumented_words.add(word)
+
+        # Strings compiled into Python functions may refer to the old handlers
+        bump_dictionary_generation()
+
+    def timed_handler(self, handler: Callable[[IInterpreter], None],
+                      histogram: LatencyHistogram) -> Callable[[IInterpreter], None]:
+        """Returns a handler that times `handler`, recording its latencies in `histogram`
+
+        The timed handler's `__wrapped__` is `handler`, and its `rewrap` returns a timed version of another
+        handler that records to the same histogram (e.g., for a cloned module; see `module.rebind_handler`).
+        """
+        sample_every = self.sample_every
+        perf_counter = time.perf_counter
+        count_call = histogram.count_call
+
+        def result(interp: IInterpreter) -> None:
+            if count_call() % sample_every:
+                handler(interp)
+                return
+
+            start = perf_counter()
+            try:
+                handler(interp)
+            finally:
+                histogram.record(perf_counter() - start)
+        result.__wrapped__ = handler   # type: ignore
+        result.rewrap = lambda h: self.timed_handler(h, histogram)   # type: ignore
+        return result
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the stats of each word that has been called
+
+        Stats include the number of `calls`, and the `count`, `sum`, `min`, `max`, `mean`, and quantiles (`p50`,
+        `p90`, `p99`) of the timed calls in seconds.
+        """
+        return {label: h.snapshot() for label, h in sorted(self.histograms.items()) if h.calls}
+
+    def prometheus_text(self) -> str:
+        """Returns the histograms in the Prometheus text exposition format"""
+        histograms = [(label, h) for label, h in sorted(self.histograms.items()) if h.calls]
+        lines: List[str] = [
+            '# HELP forthic_word_duration_seconds Latency of Forthic words implemented in Python',
+            '# TYPE forthic_word_duration_seconds histogram',
+        ]
+        for label, h in histograms:
+            word = prometheus_label(label)
+            for bound in PROMETHEUS_BUCKETS:
+                lines.append(f'forthic_word_duration_seconds_bucket{{word="{word}",le="{bound}"}} '
+                             f'{h.count_at_most(bound)}')
+            lines.append(f'forthic_word_duration_seconds_bucket{{word="{word}",le="+Inf"}} {h.count}')
+            lines.append(f'forthic_word_duration_seconds_sum{{word="{word}"}} {h.total}')
+            lines.append(f'forthic_word_duration_seconds_count{{word="{word}"}} {h.count}')
+
+        lines.append('# HELP forthic_word_calls_total Calls of Forthic words implemented in Python')
+        lines.append('# TYPE forthic_word_calls_total counter')
+        for label, h in histograms:
+            lines.append(f'forthic_word_calls_total{{word="{prometheus_label(label)}"}} {h.calls}')
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        """Writes the histograms in the Prometheus text format, replacing the file atomically
+
+        This is meant for the node exporter's textfile collector, which may read the file at any time.
+        """
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(self.prometheus_text())
+        os.replace(tmp_path, path)
+
+
+def prometheus_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
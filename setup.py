@@ -19,7 +19,6 @@ setup(
     url='https://forthic.readthedocs.io',
     download_url="https://github.com/linkedin/forthic",
     packages=find_namespace_packages(where='.', exclude=['test*', 'docs', 'forthic-js', 'apps']),
-    namespace_packages=['forthic'],
     package_data={
         "forthic": ["py.typed"],
     },
@@ -0,0 +1,49 @@
+"""Compares setting up an interpreter for each request with cloning a fully initialized interpreter
+
+The setup mirrors `get_interp` in `apps/examples/run.py`.
+
+Run with: python -m tests.benchmarks.bench_clone
+"""
+from forthic.interpreter import Interpreter
+import forthic.modules.jira_module as jira_module
+import forthic.modules.gsheet_module as gsheet_module
+import forthic.modules.excel_module as excel_module
+from forthic.modules.cache_module import CacheModule
+from forthic.modules.jinja_module import JinjaModule
+from forthic.modules.html_module import HtmlModule
+from forthic.modules.org_module import OrgModule
+from forthic.modules.confluence_module import ConfluenceModule
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 50
+
+
+def get_interp():
+    interp = Interpreter()
+    interp.dev_mode = True
+    interp.register_module(HtmlModule)
+    interp.run("['html'] USE-MODULES '/static/forthic/forthic-js' html.JS-PATH!")
+    interp.register_module(CacheModule)
+    interp.run("['cache'] USE-MODULES '.' cache.CWD!")
+
+    interp.register_module(gsheet_module.GsheetModule)
+    interp.register_module(excel_module.ExcelModule)
+    interp.register_module(jira_module.JiraModule)
+    interp.register_module(JinjaModule)
+    interp.register_module(ConfluenceModule)
+    interp.register_module(OrgModule)
+
+    # Examples typically use most of the registered modules
+    interp.run("['gsheet' 'excel' 'jira' 'jinja' 'confluence' 'org'] USE-MODULES")
+    return interp
+
+
+def main():
+    base_interp = get_interp()
+    print_result('new interpreter per request', time_per_call(get_interp, NUM_CALLS))
+    print_result('clone per request', time_per_call(base_interp.clone, NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
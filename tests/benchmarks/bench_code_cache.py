@@ -0,0 +1,59 @@
+"""Compares interpreter startup with a cold and a warm code cache, with every module in `forthic/modules`
+
+Run with: python -m tests.benchmarks.bench_code_cache
+"""
+import tempfile
+from forthic.interpreter import Interpreter
+from forthic.code_cache import CodeCache
+from forthic.modules.alation_module import AlationModule
+from forthic.modules.cache_module import CacheModule
+from forthic.modules.confluence_module import ConfluenceModule
+from forthic.modules.datasets_module import DatasetsModule
+from forthic.modules.excel_module import ExcelModule
+from forthic.modules.gsheet_module import GsheetModule
+from forthic.modules.html_module import HtmlModule
+from forthic.modules.jinja_module import JinjaModule
+from forthic.modules.jira_module import JiraModule
+from forthic.modules.org_module import OrgModule
+from forthic.modules.wiki_status_module import WikiStatusModule
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 50
+
+MODULES = [
+    AlationModule, CacheModule, ConfluenceModule, DatasetsModule, ExcelModule, GsheetModule, HtmlModule,
+    JinjaModule, JiraModule, OrgModule, WikiStatusModule,
+]
+
+
+def start_interp(directory=None):
+    interp = Interpreter()
+    if directory:
+        # A new CodeCache simulates a new process
+        interp.code_cache = CodeCache(directory)
+    for module in MODULES:
+        interp.register_module(module)
+    interp.run("""[
+        'alation' 'cache' 'confluence' 'datasets' 'excel' 'gsheet' 'html' 'jinja' 'jira' 'org' 'wiki-status'
+    ] USE-MODULES""")
+    return interp
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        def cold_start():
+            CodeCache(directory).clear()
+            start_interp(directory)
+
+        def warm_start():
+            start_interp(directory)
+
+        print_result('no code cache', time_per_call(start_interp, NUM_CALLS))
+        print_result('cold code cache', time_per_call(cold_start, NUM_CALLS))
+        start_interp(directory)
+        print_result('warm code cache', time_per_call(warm_start, NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Compares SELECT and MAP over 100k records with and without definitions compiled into Python functions
+
+Run with: python -m tests.benchmarks.bench_codegen
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_RECORDS = 100000
+NUM_CALLS = 3
+
+DEFINITIONS = """
+: ADULT?      'age' REC@ 18 >= ;
+: BIRTH-YEAR  'age' REC@ 2024 SWAP - ;
+"""
+
+
+def main():
+    records = [{'name': f'Person {i}', 'age': i % 90} for i in range(NUM_RECORDS)]
+    for codegen_mode in [False, True]:
+        interp = Interpreter(codegen_mode=codegen_mode)
+        interp.run(DEFINITIONS)
+
+        def run_select():
+            interp.stack_push(records)
+            interp.run('"ADULT?" SELECT')
+            interp.stack_pop()
+
+        def run_map():
+            interp.stack_push(records)
+            interp.run('"BIRTH-YEAR" MAP')
+            interp.stack_pop()
+
+        label = 'codegen' if codegen_mode else 'no codegen'
+        print_result(f'SELECT {NUM_RECORDS} records ({label})', time_per_call(run_select, NUM_CALLS))
+        print_result(f'MAP {NUM_RECORDS} records ({label})', time_per_call(run_map, NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
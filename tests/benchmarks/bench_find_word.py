@@ -0,0 +1,42 @@
+"""Measures the cost of running a screen whose words have already been resolved
+
+Run with: python -m tests.benchmarks.bench_find_word
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_RUNS = 2000
+
+DEFINITIONS = """
+{report
+    : TITLE   'Status' ;
+    : ROWS    [1 2 3 4 5] ;
+}
+"""
+
+SCREEN = """
+{report TITLE POP ROWS POP }
+2021-03-04 POP 10:30 POP 3.14 POP TRUE POP [1 2 3] LENGTH POP
+"""
+
+
+def main():
+    interp = Interpreter()
+    interp.run(DEFINITIONS)
+    interp.app_module.set_screen('REPORT', SCREEN)
+    interp.run("'REPORT' LOAD-SCREEN")
+
+    def run_screen():
+        interp.run("'REPORT' LOAD-SCREEN")
+
+    def run_screen_uncached():
+        interp.word_cache = {}
+        interp.run("'REPORT' LOAD-SCREEN")
+
+    print_result('LOAD-SCREEN (cold word cache)', time_per_call(run_screen_uncached, NUM_RUNS))
+    print_result('LOAD-SCREEN (warm word cache)', time_per_call(run_screen, NUM_RUNS))
+
+
+if __name__ == '__main__':
+    main()
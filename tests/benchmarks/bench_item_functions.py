@@ -0,0 +1,58 @@
+"""Compares SELECT and GROUP-BY over 100k records with Forthic strings compiled into Python functions and run
+normally
+
+Run with: python -m tests.benchmarks.bench_item_functions
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 5
+NUM_RECORDS = 100000
+
+FORTHIC = [
+    """ "'Status' REC@ status @ ==" SELECT """,
+    """ "'Labels' REC@ label @ SWAP IN" SELECT """,
+    """ "'Due Date' REC@ >DATE NULL !=" SELECT """,
+    """ "'Owner' REC@" GROUP-BY """,
+]
+
+
+def make_records():
+    statuses = ['Open', 'In Progress', 'Blocked', 'Closed']
+    owners = ['ana', 'bo', 'cy', 'di', 'ed']
+    return [
+        {
+            'key': f'PROJ-{i}',
+            'Status': statuses[i % len(statuses)],
+            'Owner': owners[i % len(owners)],
+            'Labels': ['risk'] if i % 7 == 0 else [],
+            'Due Date': None if i % 2 else f'2021-{i % 12 + 1:02d}-01',
+        }
+        for i in range(NUM_RECORDS)
+    ]
+
+
+def main():
+    interp = Interpreter()
+    interp.run("['status' 'label'] VARIABLES  'Blocked' status !  'risk' label !")
+    records = make_records()
+
+    def run(forthic):
+        interp.stack_push(records)
+        interp.run(forthic)
+        interp.stack_pop()
+
+    for forthic in FORTHIC:
+        print(forthic.strip())
+        print_result('Python function', time_per_call(lambda: run(forthic), NUM_CALLS))
+
+        # Words check the thread interpreter for item functions
+        thread_interp = interp.thread_interpreter()
+        thread_interp.get_item_function = lambda compiled: None
+        print_result('run normally', time_per_call(lambda: run(forthic), NUM_CALLS))
+        del thread_interp.get_item_function
+
+
+if __name__ == '__main__':
+    main()
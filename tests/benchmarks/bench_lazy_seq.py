@@ -0,0 +1,29 @@
+"""Compares an early-terminating SELECT/MAP/TAKE pipeline over arrays and over lazy sequences
+
+Run with: python -m tests.benchmarks.bench_lazy_seq
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 20
+NUM_RECORDS = 100000
+
+PIPELINE = """ "'status' REC@ 'Open' ==" SELECT  "'key' REC@" MAP  10 TAKE  SWAP POP """
+
+
+def main():
+    interp = Interpreter()
+    records = [{'key': f'PROJ-{i}', 'status': 'Open' if i % 3 == 0 else 'Closed'} for i in range(NUM_RECORDS)]
+
+    def run(forthic):
+        interp.stack_push(records)
+        interp.run(forthic)
+        interp.stack_pop()
+
+    print_result('arrays', time_per_call(lambda: run(PIPELINE), NUM_CALLS))
+    print_result('lazy sequence', time_per_call(lambda: run('>LAZY ' + PIPELINE), NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""Shows that `Module.find_dictionary_word` cost does not grow with the number of words in a module
+
+Run with: python -m tests.benchmarks.bench_module_lookup
+"""
+from forthic.interpreter import Interpreter
+from forthic.module import Module
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_LOOKUPS = 100000
+
+
+def make_module(interp: Interpreter, num_words: int) -> Module:
+    result = Module('bench', interp)
+    for i in range(num_words):
+        result.add_module_word(f'WORD-{i}', lambda interp: None)
+    return result
+
+
+def main():
+    interp = Interpreter()
+    for num_words in [10, 100, 1000, 10000]:
+        module = make_module(interp, num_words)
+        print_result(f'{num_words} words, first word', time_per_call(
+            lambda: module.find_dictionary_word('WORD-0'), NUM_LOOKUPS))
+        print_result(f'{num_words} words, missing word', time_per_call(
+            lambda: module.find_dictionary_word('MISSING'), NUM_LOOKUPS))
+
+    global_module = interp.global_module
+    print_result(f'global module ({len(global_module.words)} words), miss', time_per_call(
+        lambda: global_module.find_dictionary_word('MISSING'), NUM_LOOKUPS))
+
+
+if __name__ == '__main__':
+    main()
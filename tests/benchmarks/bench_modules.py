@@ -0,0 +1,45 @@
+"""Measures calling imported words and entering modules once per record
+
+Run with: python -m tests.benchmarks.bench_modules
+"""
+from forthic.interpreter import Interpreter
+from forthic.module import Module
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_RECORDS = 10000
+NUM_CALLS = 10
+
+
+class FieldModule(Module):
+    def __init__(self, interp):
+        super().__init__('field', interp, ': KEY   "key" REC@ ;')
+        self.add_module_word('NAME', self.word_NAME)
+        self.add_module_word('FAST-NAME', self.word_NAME, uses_module_stack=False)
+
+    # ( rec -- name )
+    def word_NAME(self, interp):
+        rec = interp.stack_pop()
+        interp.stack_push(rec['name'])
+
+
+def main():
+    records = [{'key': f'PROJ-{i}', 'name': f'Item {i}'} for i in range(NUM_RECORDS)]
+    interp = Interpreter()
+    interp.register_module(FieldModule)
+    interp.run("['field'] USE-MODULES")
+
+    def run_forthic(forthic):
+        def run():
+            interp.stack_push(records)
+            interp.run(forthic)
+            interp.stack_pop()
+        return run
+
+    print_result('field.NAME MAP', time_per_call(run_forthic('"field.NAME" MAP'), NUM_CALLS))
+    print_result('field.FAST-NAME MAP', time_per_call(run_forthic('"field.FAST-NAME" MAP'), NUM_CALLS))
+    print_result('{field KEY} MAP', time_per_call(run_forthic('"{field KEY}" MAP'), NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
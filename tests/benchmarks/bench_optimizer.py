@@ -0,0 +1,62 @@
+"""Compares running definitions with and without optimization, reporting word counts before and after
+
+The definitions are taken from the `wiki-status` module.
+
+Run with: python -m tests.benchmarks.bench_optimizer
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 20000
+
+DEFINITIONS = """
+: COLOR-VALUES   [
+   [ "red"   1 ]
+   [ "yellow" 2 ]
+   [ "green"  3 ]
+] REC;
+
+: COLOR>VALUE   COLOR-VALUES SWAP |LOWER REC@  100 DEFAULT;
+
+: STATUS>COLOR   [
+   [ "Blocked"       "Red" ]
+   [ "Resolved"      "Blue" ]
+   [ "Closed"        "Blue" ]
+] REC SWAP REC@ "Gray" DEFAULT ;
+
+: TICKET-COLOR   'status' REC@ STATUS>COLOR ;
+"""
+
+
+def main():
+    interp = Interpreter()
+    interp.run(DEFINITIONS)
+    for item in interp.definition_sizes(interp.app_module):
+        print('%40s: %4d -> %d words' % (item['word'], item['before'], item['after']))
+
+    ticket = {'key': 'PROJ-1', 'status': 'Blocked'}
+    for optimize in [False, True]:
+        interp = Interpreter()
+        interp.optimize_definitions = optimize
+        interp.run(DEFINITIONS)
+        color_to_value = interp.find_word('COLOR>VALUE')
+        ticket_color = interp.find_word('TICKET-COLOR')
+
+        def run_color_to_value():
+            interp.stack_push('Yellow')
+            color_to_value.execute(interp)
+            interp.stack_pop()
+
+        def run_ticket_color():
+            interp.stack_push(ticket)
+            ticket_color.execute(interp)
+            interp.stack_pop()
+
+        label = 'optimized' if optimize else 'unoptimized'
+        print_result(f'COLOR>VALUE ({label})', time_per_call(run_color_to_value, NUM_CALLS))
+        print_result(f'TICKET-COLOR ({label})', time_per_call(run_ticket_color, NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Compares MAP with PROCESS-MAP using 1 to `os.cpu_count()` worker processes on a CPU-bound, regex-heavy workload
+
+Each worker count is timed after a warm-up run, so times don't include starting workers.
+
+Run with: python -m tests.benchmarks.bench_process_map
+"""
+import os
+import random
+from forthic.interpreter import Interpreter
+from forthic.process_pool import shutdown_process_pools
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 5
+NUM_ITEMS = 2000
+
+SCREEN = """
+: TICKET-PROJECTS   "([A-Z]+)-\\d+" RE-MATCH-ALL ;
+: NUM-PROJECTS      TICKET-PROJECTS UNIQUE LENGTH ;
+"""
+
+
+def make_descriptions():
+    rng = random.Random(0)
+    words = ['fix', 'the', 'login', 'bug', 'see', 'also', 'for', 'details']
+    projects = ['PROJ', 'OPS', 'WEB', 'DATA']
+    result = []
+    for _ in range(NUM_ITEMS):
+        tokens = [rng.choice(words) if rng.random() < 0.8 else f'{rng.choice(projects)}-{rng.randint(1, 999)}'
+                  for _ in range(400)]
+        result.append(' '.join(tokens))
+    return result
+
+
+def main():
+    interp = Interpreter()
+    interp.app_module.set_screen('tickets', SCREEN)
+    interp.process_setup = "'tickets' LOAD-SCREEN"
+    interp.run("'tickets' LOAD-SCREEN")
+    descriptions = make_descriptions()
+
+    def run(word):
+        interp.stack_push(descriptions)
+        interp.run(f"'NUM-PROJECTS' {word} POP")
+
+    print_result('MAP', time_per_call(lambda: run('MAP'), NUM_CALLS))
+    for num_workers in range(1, (os.cpu_count() or 1) + 1):
+        interp.process_workers = num_workers
+        run('PROCESS-MAP')
+        print_result(f'PROCESS-MAP ({num_workers} workers)', time_per_call(lambda: run('PROCESS-MAP'), NUM_CALLS))
+    shutdown_process_pools()
+
+
+if __name__ == '__main__':
+    main()
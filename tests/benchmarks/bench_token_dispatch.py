@@ -0,0 +1,52 @@
+"""Measures how many tokens per second the interpreter handles over a large synthetic screen
+
+Run with: python -m tests.benchmarks.bench_token_dispatch
+"""
+import time
+from forthic.interpreter import Interpreter
+from forthic.tokenizer import FastTokenizer
+from forthic.tokens import EOSToken
+
+
+NUM_COPIES = 5000
+
+SCREEN = """
+# Synthetic screen
+: ADD-ONE   1 + ;
+['x'] VARIABLES
+{stats 'Title' POP }
+[1 2 3] LENGTH ADD-ONE x !   x @ POP
+"Done" POP
+"""
+
+
+def get_tokens(string):
+    tokenizer = FastTokenizer(string)
+    result = []
+    token = tokenizer.next_token()
+    while not isinstance(token, EOSToken):
+        result.append(token)
+        token = tokenizer.next_token()
+    return result
+
+
+def main():
+    screen = SCREEN * NUM_COPIES
+    tokens = get_tokens(screen)
+
+    interp = Interpreter()
+    start = time.perf_counter()
+    for token in tokens:
+        interp.handle_token(token)
+    duration = time.perf_counter() - start
+    print('%30s: %10.0f tokens/s' % ('handle_token', len(tokens) / duration))
+
+    interp = Interpreter()
+    start = time.perf_counter()
+    interp.run(screen)
+    duration = time.perf_counter() - start
+    print('%30s: %10.0f tokens/s' % ('run (tokenize + handle)', len(tokens) / duration))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""Measures Tokenizer and FastTokenizer throughput over the Forthic code of the bundled modules
+
+Run with: python -m tests.benchmarks.bench_tokenizer
+"""
+import time
+from forthic.tokenizer import Tokenizer, FastTokenizer
+from forthic.tokens import EOSToken
+from forthic.modules import html_module, jira_module, gsheet_module, confluence_module
+
+
+NUM_COPIES = 200
+
+
+def tokenize(tokenizer_class, string: str) -> int:
+    tokenizer = tokenizer_class(string)
+    result = 0
+    while not isinstance(tokenizer.next_token(), EOSToken):
+        result += 1
+    return result
+
+
+def main():
+    forthic = '\n'.join([
+        html_module.HTML_FORTHIC,
+        jira_module.JIRA_FORTHIC,
+        gsheet_module.FORTHIC,
+        confluence_module.CONFLUENCE_FORTHIC,
+    ]) * NUM_COPIES
+    num_mb = len(forthic.encode('utf-8')) / 1e6
+
+    for tokenizer_class in [Tokenizer, FastTokenizer]:
+        start = time.perf_counter()
+        num_tokens = tokenize(tokenizer_class, forthic)
+        duration = time.perf_counter() - start
+        print('%20s: %8.2f MB/s (%d tokens in %.3f s)' % (
+            tokenizer_class.__name__, num_mb / duration, num_tokens, duration))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Measures reading variables and memoized words in a tight loop
+
+Run with: python -m tests.benchmarks.bench_variables
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 100000
+
+
+def main():
+    interp = Interpreter()
+    interp.run("""
+    ['x'] VARIABLES
+    42 x !
+    : READ-X   x @ ;
+    'ANSWER' '42' MEMO
+    ANSWER POP
+    """)
+    read_x = interp.find_word('READ-X')
+    answer = interp.find_word('ANSWER')
+
+    def run_find_variable():
+        interp.app_module.find_variable('x')
+
+    def run_read_x():
+        read_x.execute(interp)
+        interp.stack_pop()
+
+    def run_answer():
+        answer.execute(interp)
+        interp.stack_pop()
+
+    print_result('find_variable', time_per_call(run_find_variable, NUM_CALLS))
+    print_result('READ-X (x @)', time_per_call(run_read_x, NUM_CALLS))
+    print_result('ANSWER (memo)', time_per_call(run_answer, NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Compares running definitions with nested `execute` calls against running them with the bytecode VM
+
+Run with: python -m tests.benchmarks.bench_vm
+"""
+from forthic.interpreter import Interpreter
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 2000
+
+DEFINITIONS = """
+: SQUARE   DUP * ;
+: POLY     DUP SQUARE SWAP 2 * + 1 + ;
+: PAIR     [3 POLY 4 POLY] POP ;
+: STEP     PAIR PAIR ;
+: STEPS    STEP STEP STEP STEP STEP STEP STEP STEP STEP STEP ;
+"""
+
+
+def main():
+    for vm_mode in [False, True]:
+        interp = Interpreter(vm_mode=vm_mode)
+        interp.run(DEFINITIONS)
+        steps = interp.find_word('STEPS')
+
+        def run_steps():
+            steps.execute(interp)
+
+        label = 'bytecode VM' if vm_mode else 'tree-walking'
+        print_result(f'STEPS ({label})', time_per_call(run_steps, NUM_CALLS))
+
+
+if __name__ == '__main__':
+    main()
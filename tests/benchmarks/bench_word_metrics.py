@@ -0,0 +1,54 @@
+"""Compares calling Python words without word metrics, timing every call, and timing 1 of every 10 calls
+
+Run with: python -m tests.benchmarks.bench_word_metrics
+"""
+from forthic.interpreter import Interpreter
+from forthic.module import Module
+from tests.benchmarks.utils import time_per_call, print_result
+
+
+NUM_CALLS = 20
+NUM_ITEMS = 10000
+
+
+class SampleModule(Module):
+    def __init__(self, interp):
+        super().__init__('sample', interp)
+        self.add_module_word('FIELD', self.word_FIELD)
+        self.add_module_word('PARSE', self.word_PARSE)
+
+    # ( item -- value )
+    def word_FIELD(self, interp):
+        interp.stack_push(interp.stack_pop()['key'])
+
+    # ( item -- value )
+    def word_PARSE(self, interp):
+        item = interp.stack_pop()
+        interp.stack_push(sorted(str(i * item['value']) for i in range(50)))
+
+
+def make_interp(sample_every=None):
+    interp = Interpreter()
+    interp.register_module(SampleModule)
+    if sample_every:
+        interp.enable_word_metrics(sample_every)
+    interp.run("['sample'] USE-MODULES")
+    return interp
+
+
+def main():
+    items = [{'key': f'PROJ-{i}', 'value': i} for i in range(NUM_ITEMS)]
+    for word in ['sample.FIELD', 'sample.PARSE']:
+        print(f'{word} (per call)')
+        for label, sample_every in [('no metrics', None), ('every call', 1), ('1 of every 10 calls', 10)]:
+            interp = make_interp(sample_every)
+
+            def run():
+                interp.stack_push(items)
+                interp.run(f"'{word}' MAP")
+                interp.stack_pop()
+            print_result(label, time_per_call(run, NUM_CALLS) / NUM_ITEMS)
+
+
+if __name__ == '__main__':
+    main()
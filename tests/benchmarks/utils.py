@@ -0,0 +1,15 @@
+import time
+from typing import Callable
+
+
+def time_per_call(func: Callable[[], None], num_calls: int) -> float:
+    """Returns the average time in seconds of calling `func`"""
+    start = time.perf_counter()
+    for _ in range(num_calls):
+        func()
+    result = (time.perf_counter() - start) / num_calls
+    return result
+
+
+def print_result(label: str, seconds: float) -> None:
+    print('%40s: %10.3f us' % (label, seconds * 1e6))
@@ -0,0 +1,79 @@
+import os
+import unittest
+import tempfile
+from forthic.interpreter import Interpreter
+from forthic.module import Module
+from forthic.code_cache import CodeCache, tokenize
+from forthic.tokens import StartDefinitionToken, WordToken
+
+
+class SampleModule(Module):
+    def __init__(self, interp):
+        super().__init__('sample', interp, """
+        # Sample module code
+        ['greeting'] VARIABLES
+        'Hello' greeting !
+        : GREETING   greeting @ ;
+        : GREETINGS  [GREETING "^World^"] ;
+        ['GREETINGS'] EXPORT
+        """)
+
+
+class TestCodeCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp_dir.name, 'forthic-cache')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def make_interp(self):
+        interp = Interpreter()
+        interp.code_cache = CodeCache(self.directory)
+        interp.register_module(SampleModule)
+        interp.run("['sample'] USE-MODULES  sample.GREETINGS")
+        return interp
+
+    def test_cold_and_warm_start(self):
+        interp = self.make_interp()
+        self.assertEqual([['Hello', '^World^']], interp.stack)
+        self.assertEqual((0, 1), (interp.code_cache.num_hits, interp.code_cache.num_misses))
+        self.assertEqual(1, len(os.listdir(self.directory)))
+
+        interp = self.make_interp()
+        self.assertEqual([['Hello', '^World^']], interp.stack)
+        self.assertEqual((1, 0), (interp.code_cache.num_hits, interp.code_cache.num_misses))
+
+    def test_screens(self):
+        interp = Interpreter()
+        interp.code_cache = CodeCache(self.directory)
+        interp.run("': DOUBLE   2 * ;' 'math' SCREEN!  'math' LOAD-SCREEN  'math' LOAD-SCREEN  3 DOUBLE")
+        self.assertEqual([6], interp.stack)
+        self.assertEqual(1, interp.code_cache.num_misses)
+
+    def test_bad_cache_files(self):
+        cache = CodeCache(self.directory)
+        self.assertIsNone(cache.get_tokens("'Unterminated"))
+
+        string = ': WORD   1 2 ;'
+        os.makedirs(self.directory)
+        with open(cache.get_path(string), 'w') as f:
+            f.write('Not a cache file')
+        tokens = cache.get_tokens(string)
+        self.assertIsInstance(tokens[0], StartDefinitionToken)
+        self.assertEqual(0, cache.num_hits)
+
+        # The cache file is rewritten
+        tokens = CodeCache(self.directory).get_tokens(string)
+        self.assertIsInstance(tokens[1], WordToken)
+
+        cache.clear()
+        self.assertEqual([], os.listdir(self.directory))
+
+    def test_tokenize(self):
+        tokens = tokenize("# Comment\n: WORD   'string' ;")
+        self.assertEqual(3, len(tokens))
+
+
+if __name__ == '__main__':
+    unittest.main()
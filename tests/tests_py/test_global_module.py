@@ -1,9 +1,17 @@
+import io
+import json
+import time
+import types
+import tracemalloc
 import unittest
+import contextlib
 import datetime
+import threading
 import pytz
-from forthic.interpreter import Interpreter
+from forthic.interpreter import Interpreter, UnknownWordError
 from forthic.tokenizer import DLE
 from forthic.global_module import GlobalModuleError
+from forthic.profile import ProfileAnalyzer, WordProfile, record_http_span
 
 class TestGlobalModule(unittest.TestCase):
     def test_literal(self):
@@ -17,6 +25,28 @@ class TestGlobalModule(unittest.TestCase):
         self.assertEqual(interp.stack[5], datetime.time(23, 30))
         self.assertEqual(interp.stack[6], datetime.time(10, 15))
 
+    def test_literal_cache(self):
+        interp = Interpreter()
+        global_module = interp.global_module
+        word = global_module.find_literal_word("2020-06-05")
+        self.assertEqual(datetime.date(2020, 6, 5), word.value)
+        self.assertIs(word, global_module.find_literal_word("2020-06-05"))
+        self.assertIsNone(global_module.find_literal_word("25:00"))
+        self.assertEqual(float("inf"), global_module.find_literal_word("inf").value)
+
+    def test_custom_literal_handler(self):
+        interp = Interpreter()
+        interp.run("2")
+        self.assertEqual(2, interp.stack[-1])
+
+        def to_tens(str_val):
+            if str_val.isdigit():
+                return int(str_val) * 10
+            return None
+
+        interp.global_module.literal_handlers.insert(0, to_tens)
+        self.assertEqual(20, interp.global_module.find_literal_word("2").value)
+
     def test_variables(self):
         interp = Interpreter()
         interp.run("['x' 'y']  VARIABLES")
@@ -35,6 +65,14 @@ class TestGlobalModule(unittest.TestCase):
         interp.run("x @")
         self.assertEqual(interp.stack[-1], 24)
 
+    def test_variable_push_word(self):
+        interp = Interpreter()
+        interp.run("['x']  VARIABLES")
+        word = interp.app_module.find_variable('x')
+        self.assertIs(word, interp.app_module.find_variable('x'))
+        self.assertIs(interp.app_module.variables['x'], word.value)
+        self.assertIsNone(interp.app_module.find_variable('y'))
+
     def test_bang_at(self):
         interp = Interpreter()
         interp.run("['x']  VARIABLES")
@@ -75,6 +113,26 @@ class TestGlobalModule(unittest.TestCase):
         interp.run("COUNT!@")
         self.assertEqual(interp.stack[-1] , 3)
 
+        # Redefining the refresh word changes how the memo is refreshed
+        interp.run("""
+        : COUNT!   100 <memo_var_COUNT> ! ;
+        NULL <memo_var_COUNT> !  COUNT
+        """)
+        self.assertEqual(interp.stack[-1], 100)
+
+    def test_memo_in_module(self):
+        interp = Interpreter()
+        interp.run("""
+        {mymodule
+            ['count'] VARIABLES
+            0 count !
+            'COUNT' 'count @ 1 +  count !  count @'   MEMO
+        }
+        : COUNT   {mymodule COUNT} ;
+        COUNT COUNT
+        """)
+        self.assertEqual([1, 1], interp.stack)
+
     def test_rec(self):
         interp = Interpreter()
         interp.run("""
@@ -511,6 +569,106 @@ class TestGlobalModule(unittest.TestCase):
         res = interp.stack[-2]
         self.assertEqual(res, 5)
 
+    def test_parallel_map(self):
+        interp = Interpreter()
+        interp.run("""
+        {math : DOUBLE   2 * ; }
+        {math [1 2 3 4 5] 'DOUBLE' PARALLEL-MAP }
+        [['a' 1] ['b' 2]] REC "DUP *" PARALLEL-MAP
+        [] "DUP *" PARALLEL-MAP
+        """)
+        self.assertEqual([[2, 4, 6, 8, 10], {'a': 1, 'b': 4}, []], interp.stack)
+
+        # The first error is raised
+        with self.assertRaises(UnknownWordError) as context:
+            interp.run("['1' 'GARBAGE' 'MORE-GARBAGE'] 'INTERPRET' PARALLEL-MAP")
+        self.assertEqual("Unknown word: 'GARBAGE'", str(context.exception))
+
+    def test_parallel_map_variables(self):
+        interp = Interpreter()
+        interp.run("""
+        ['x'] VARIABLES  10 x !
+        : RUN   [1 2 3 4 5 6 7 8 9 10 11 12 13 14 15 16] "x @ +  x !  [1 2 3] 'POP x @' MAP" PARALLEL-MAP ;
+        RUN
+        """)
+
+        # Each run starts with the caller's values, and the variables it sets are its own
+        interp.run("x @")
+        self.assertEqual([[[10 + i] * 3 for i in range(1, 17)], 10], interp.stack)
+
+        # Runs started by other threads start with their values
+        def worker():
+            interp.run("20 x !  RUN")
+            results.append(interp.stack.pop())
+
+        results = []
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual([[[20 + i] * 3 for i in range(1, 17)]], results)
+
+        # Runs see the words defined by the caller's thread
+        def define_worker():
+            interp.run(": DOUBLE   2 * ;  : ROW   [1 2] 'DOUBLE' MAP ;  [1 2 3] 'ROW' PARALLEL-MAP")
+            results.append(interp.stack.pop())
+
+        results = []
+        thread = threading.Thread(target=define_worker)
+        thread.start()
+        thread.join()
+        self.assertEqual([[[2, 4]] * 3], results)
+
+    def test_parallel_map_workers(self):
+        interp = Interpreter()
+        lock = threading.Lock()
+        running = [0]
+        max_running = [0]
+
+        def word_WAIT(interp):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        interp.app_module.add_module_word('WAIT', word_WAIT)
+        interp.run("3 PARALLEL-WORKERS!  [1 2 3 4 5 6] 'WAIT' PARALLEL-MAP")
+        self.assertEqual([[1, 2, 3, 4, 5, 6]], interp.stack)
+        self.assertEqual(3, interp.parallel_workers)
+        self.assertGreater(max_running[0], 1)
+        self.assertLessEqual(max_running[0], 3)
+
+        with self.assertRaises(GlobalModuleError):
+            interp.run("0 PARALLEL-WORKERS!")
+
+        # Other threads can't change the shared setting
+        errors = []
+
+        def worker():
+            try:
+                interp.run("5 PARALLEL-WORKERS!")
+            except GlobalModuleError as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(1, len(errors))
+        self.assertEqual(3, interp.parallel_workers)
+
+    def test_parallel_foreach_to_errors(self):
+        interp = Interpreter()
+        interp.run("""
+        ['2' '3' 'GARBAGE' '+'] 'INTERPRET' PARALLEL-FOREACH>ERRORS
+        """)
+        errors = interp.stack[-1]
+        self.assertEqual(1, len(interp.stack))
+        self.assertIsNone(errors[0])
+        self.assertIsNone(errors[1])
+        self.assertIsInstance(errors[2], UnknownWordError)
+        self.assertIsNotNone(errors[3])
+
     def test_zip(self):
         interp = Interpreter()
         interp.run("""
@@ -958,6 +1116,57 @@ class TestGlobalModule(unittest.TestCase):
         stack = interp.stack
         self.assertEqual(stack[0], 3)
 
+    def test_lazy_seq(self):
+        interp = Interpreter()
+        seen = []
+
+        def word_SEE(interp):
+            seen.append(interp.stack[-1])
+
+        interp.app_module.add_module_word('SEE', word_SEE)
+        interp.run("""
+        [1 2 3 4 5 6 7 8 9 10] >LAZY "SEE 2 MOD 0 ==" SELECT "10 *" MAP  2 TAKE
+        """)
+        self.assertEqual([20, 40], interp.stack[-1])
+        self.assertEqual([1, 2, 3, 4], seen)
+
+        # The rest is computed when needed
+        interp.run("POP 1 DROP >LIST")
+        self.assertEqual([80, 100], interp.stack[-1])
+        self.assertEqual(list(range(1, 11)), seen)
+
+        # Lazy sequences can be used more than once
+        interp.run("""
+        [1 2 3] >LAZY "SEE 2 *" MAP  DUP LENGTH  SWAP 0 "+" REDUCE  [4 5] >LIST
+        """)
+        self.assertEqual([3, 12, [4, 5]], interp.stack[-3:])
+        self.assertEqual([1, 2, 3], seen[-3:])
+
+        interp.run("""
+        ["a" "b" "c"] >LAZY "SWAP 1 >" SELECT-w/KEY "CONCAT" MAP-w/KEY >LIST
+        [1 2] >LAZY "3 *" FOREACH
+        [1 2] >LAZY "DUP *" PARALLEL-MAP
+        """)
+        self.assertEqual([['0c'], 3, 6, [1, 4]], interp.stack[-4:])
+
+        with self.assertRaises(GlobalModuleError):
+            interp.run("[['a' 1]] REC >LAZY")
+
+        # Words that don't stream use the items of a lazy sequence
+        interp = Interpreter()
+        interp.run("""
+        [3 1 2 1] >LAZY "2 *" MAP  DUP 1 NTH  SWAP DUP LAST  SWAP DUP SORT  SWAP UNIQUE SORT
+        [1 2 3] >LAZY "2 MOD" GROUP-BY
+        ['a' 'b'] >LAZY [1 2] >LAZY ZIP
+        [] REC [1 2] >LAZY "2 *" MAP 'r' <REC! >JSON
+        """)
+        self.assertEqual([
+            2, 2, [2, 2, 4, 6], [2, 4, 6],
+            {1: [1, 3], 0: [2]},
+            [['a', 1], ['b', 2]],
+            '{"r": [2, 4]}',
+        ], interp.stack)
+
     def test_reduce(self):
         interp = Interpreter()
         interp.run("""
@@ -1447,6 +1656,191 @@ class TestGlobalModule(unittest.TestCase):
         self.assertEqual(profile_data["word_counts"][0]["word"], "+")
         self.assertEqual(profile_data["word_counts"][0]["count"], 6)
 
+    def test_profile_word_tree(self):
+        interp = Interpreter()
+        interp.run(": ADD-ONE   1 + ;   : ADD-TWO   ADD-ONE ADD-ONE ;")
+
+        # Definitions aren't profiled unless profiling is on
+        interp.run("0 ADD-TWO")
+        self.assertIsNone(interp.cur_word_profile)
+
+        interp.run("""
+        PROFILE-START
+        : MAIN   ADD-TWO ;
+        0 MAIN
+        """)
+        profile = interp.cur_word_profile
+        self.assertEqual(":ADD-TWO", profile.get_key())
+        self.assertEqual([":ADD-ONE", ":ADD-ONE"], [p.get_key() for p in profile.word_profiles])
+        self.assertEqual([":1", ":+"], [p.get_key() for p in profile.word_profiles[0].word_profiles])
+
+        # Definitions aren't profiled after profiling stops
+        interp.stop_profiling()
+        interp.run("0 ADD-TWO")
+        self.assertIs(profile, interp.cur_word_profile)
+        self.assertEqual(2, len(profile.word_profiles))
+
+    def test_profile_in_definition(self):
+        interp = Interpreter()
+        interp.run("""
+        : WORK   1 2 + POP ;
+        : MAIN   PROFILE-START WORK WORK PROFILE-END ;
+        MAIN
+        """)
+        analyzer = interp.stack_pop()
+        self.assertIsNotNone(analyzer.cur_profile)
+        self.assertIsNotNone(analyzer.cur_profile.get_duration_s())
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            analyzer.print()
+        self.assertTrue(output.getvalue())
+
+    def test_profile_aggregate(self):
+        interp = Interpreter()
+        interp.run(': ADD-ONE   1 + ;   : ADD-TWO   ADD-ONE ADD-ONE ;   : MAIN   "ADD-TWO" MAP ;')
+
+        def profile(items):
+            interp.stack_push(items)
+            interp.run("PROFILE-AGGREGATE-START  MAIN  PROFILE-END")
+            analyzer = interp.stack_pop()
+            self.assertEqual([i + 2 for i in items], interp.stack_pop())
+            return analyzer.word_profile
+
+        root = profile([1, 2, 3])
+        self.assertEqual('PROFILE', root.get_key())
+        self.assertEqual([':<string>', ':MAP'], [p.get_key() for p in root.word_profiles])
+        add_one = root.word_profiles[1].word_profiles[0]
+        self.assertEqual(':ADD-ONE', add_one.get_key())
+        self.assertEqual(6, add_one.count)
+        self.assertEqual([6, 6], [p.count for p in add_one.word_profiles])
+        self.assertLessEqual(add_one.min_time, add_one.max_time)
+        self.assertAlmostEqual(add_one.total_time, add_one.get_self_time_s() + sum(
+            p.total_time for p in add_one.word_profiles
+        ))
+
+        # Profiles are kept per call path, not per execution
+        def num_profiles(p):
+            return 1 + sum(num_profiles(c) for c in p.word_profiles)
+        self.assertEqual(num_profiles(root), num_profiles(profile(list(range(1000)))))
+
+        # Aggregate profiles can be navigated like profile trees
+        analyzer = ProfileAnalyzer(root)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            analyzer.down(1)
+            analyzer.down(0)
+            analyzer.up()
+        self.assertIn(':ADD-ONE: ', output.getvalue())
+        self.assertIn('(6 calls, self ', output.getvalue())
+        self.assertIs(root.word_profiles[1], analyzer.cur_profile)
+
+        # Profiling without aggregation records each execution again
+        interp.run("PROFILE-START  [1] MAIN POP")
+        self.assertIsInstance(interp.cur_word_profile, WordProfile)
+        interp.stop_profiling()
+
+    @unittest.skipUnless(hasattr(tracemalloc, 'reset_peak'), 'requires Python 3.9+')
+    def test_profile_memory(self):
+        interp = Interpreter()
+        interp.global_module.add_module_word('ALLOCATE', lambda interp: interp.stack_push(list(range(interp.stack_pop()))))
+        interp.run("""
+        : KEEP   100000 ALLOCATE ;
+        : TEMP   200000 ALLOCATE POP ;
+        : MAIN   KEEP TEMP ;
+        : RUN    MAIN ;
+        """)
+        self.assertFalse(tracemalloc.is_tracing())
+        interp.run("PROFILE-MEMORY-START  RUN")
+        self.assertTrue(tracemalloc.is_tracing())
+        interp.stop_profiling()
+        self.assertFalse(tracemalloc.is_tracing())
+
+        main = interp.cur_word_profile
+        keep, temp = main.word_profiles
+        self.assertEqual([':KEEP', ':TEMP'], [keep.get_key(), temp.get_key()])
+        self.assertGreater(keep.net_bytes, 3000000)
+        self.assertLess(abs(temp.net_bytes), 100000)
+        self.assertGreater(temp.peak_bytes, 6000000)
+        self.assertGreaterEqual(main.peak_bytes, keep.net_bytes + temp.peak_bytes)
+
+        # Words that allocate the most memory can be found by sorting by peak bytes
+        analyzer = ProfileAnalyzer(main)
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            analyzer.sort('memory')
+        lines = output.getvalue().splitlines()
+        self.assertIn('[net ', lines[0])
+        self.assertIn('[1]', lines[1])
+        with self.assertRaises(ValueError):
+            analyzer.sort('calls')
+
+        # Aggregate runs record the total net bytes and largest peak of each path
+        interp.start_profiling(aggregate=True, memory=True)
+        interp.run("RUN RUN")
+        interp.stop_profiling()
+        main = interp.cur_word_profile.get_root().word_profiles[0]
+        keep, temp = main.word_profiles
+        self.assertEqual(2, temp.count)
+        self.assertGreater(keep.net_bytes, 6000000)
+        self.assertGreater(temp.peak_bytes, 6000000)
+        self.assertLess(temp.peak_bytes, 12000000)
+
+    def test_profile_trace(self):
+        interp = Interpreter()
+        interp.run("PROFILE-TRACE")
+        self.assertIsNone(interp.stack_pop())
+
+        interp.run("""
+        : ADD-ONE   1 + ;
+        : MAIN      ADD-ONE  [1 2] "ADD-ONE" PARALLEL-MAP  ;
+        PROFILE-START
+        0 MAIN  'main' PROFILE-TIMESTAMP
+        PROFILE-END POP
+        PROFILE-TRACE
+        """)
+        trace = json.loads(interp.stack_pop())
+        events = trace['traceEvents']
+        main_tid = threading.get_ident()
+
+        words = [e for e in events if e.get('cat') == 'word']
+        self.assertEqual('ADD-ONE', words[0]['name'])
+        self.assertEqual(main_tid, words[0]['tid'])
+        self.assertEqual({'X'}, {e['ph'] for e in words})
+        self.assertTrue(all(e['dur'] >= 0 for e in words))
+
+        # Words run by PARALLEL-MAP workers are traced in their threads, under PARALLEL-MAP
+        parallel_map = [e for e in words if e['name'] == 'PARALLEL-MAP'][0]
+        worker_words = [e for e in words if e['tid'] != main_tid]
+        self.assertEqual(4, len(worker_words))
+        for e in worker_words:
+            self.assertGreaterEqual(e['ts'], parallel_map['ts'])
+        thread_names = {e['tid'] for e in events if e['ph'] == 'M'}
+        self.assertEqual({main_tid} | {e['tid'] for e in worker_words}, thread_names)
+
+        timestamps = [e['name'] for e in events if e.get('cat') == 'timestamp']
+        self.assertEqual(['START', 'main', 'END'], timestamps)
+
+    def test_profile_http_spans(self):
+        response = types.SimpleNamespace(
+            request=types.SimpleNamespace(method='GET'),
+            url='https://jira.example.com/rest/api/2/search',
+            elapsed=datetime.timedelta(milliseconds=250),
+            status_code=200,
+        )
+
+        # Requests are only recorded during profiling runs
+        record_http_span(response)
+        interp = Interpreter()
+        interp.start_profiling()
+        record_http_span(response)
+        interp.stop_profiling()
+        record_http_span(response)
+
+        interp.run("PROFILE-TRACE")
+        events = json.loads(interp.stack_pop())['traceEvents']
+        spans = [e for e in events if e.get('cat') == 'http']
+        self.assertEqual(1, len(spans))
+        self.assertEqual('GET https://jira.example.com/rest/api/2/search', spans[0]['name'])
+        self.assertAlmostEqual(250000, spans[0]['dur'], delta=1)
+        self.assertEqual({'status': 200}, spans[0]['args'])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
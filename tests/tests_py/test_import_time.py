@@ -0,0 +1,81 @@
+import os
+import sys
+import subprocess
+import unittest
+
+
+# Importing the interpreter and every module should not pull in the dependencies of integration words. These
+# are imported by the words that need them.
+DEFERRED_IMPORTS = [
+    'requests',
+    'requests_oauthlib',
+    'jinja2',
+    'markdown',
+    'dateutil',
+    'cryptography',
+    'pkg_resources',
+]
+
+# Prints the names of the modules it imports, which excludes anything imported at startup (e.g., by .pth files)
+IMPORT_CODE = """
+import sys
+startup_modules = set(sys.modules)
+
+from forthic.interpreter import Interpreter
+import forthic.modules.alation_module
+import forthic.modules.cache_module
+import forthic.modules.confluence_module
+import forthic.modules.datasets_module
+import forthic.modules.excel_module
+import forthic.modules.gsheet_module
+import forthic.modules.html_module
+import forthic.modules.jinja_module
+import forthic.modules.jira_module
+import forthic.modules.org_module
+import forthic.utils.creds
+
+print(' '.join(sorted(set(sys.modules) - startup_modules)))
+"""
+
+# Cumulative import time budget for forthic packages. This is generous (without bytecode caching, imports take
+# ~70ms) so it only catches regressions like heavy dependencies being imported eagerly again.
+IMPORT_BUDGET_MS = float(os.environ.get('FORTHIC_IMPORT_BUDGET_MS', 250))
+
+
+def run_import_code():
+    """Runs `IMPORT_CODE` with `-X importtime`, returning the imported module names and the import times (in ms)
+    of modules imported directly by the code"""
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', IMPORT_CODE],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=True
+    )
+    modules = set(process.stdout.split())
+
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+
+        # Nested imports are indented
+        if not name.startswith('  '):
+            import_times[name.strip()] = int(cumulative) / 1000
+    return modules, import_times
+
+
+class TestImportTime(unittest.TestCase):
+    def setUp(self):
+        self.modules, self.import_times = run_import_code()
+
+    def test_deferred_imports(self):
+        self.assertIn('forthic.modules.jira_module', self.modules)
+        for name in DEFERRED_IMPORTS:
+            self.assertNotIn(name, self.modules)
+
+    def test_import_budget(self):
+        total_ms = sum(ms for name, ms in self.import_times.items() if name.startswith('forthic'))
+        self.assertLess(total_ms, IMPORT_BUDGET_MS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,10 @@
 import unittest
 import datetime
-from forthic.interpreter import Interpreter
+from forthic.interpreter import Interpreter, UnknownTokenError
+from forthic.tokens import Token, WordToken
 from forthic.module import Module, ModuleWord
+from forthic.modules.html_module import HtmlModule
+from forthic.modules.jira_module import JiraModule
 from tests.tests_py.sample_date_module import SampleDateModule
 
 class TestInterpreter(unittest.TestCase):
@@ -124,6 +127,264 @@ class TestInterpreter(unittest.TestCase):
         interp.run("{module-A {module-B   MESSAGE}}")
         self.assertEqual("In module-B", interp.stack[0])
 
+    def test_redefine_word(self):
+        # Later definitions shadow earlier ones
+        interp = Interpreter()
+        interp.run(": MESSAGE   'First' ;")
+        interp.run(": MESSAGE   'Second' ;")
+        interp.run("MESSAGE")
+        self.assertEqual("Second", interp.stack[0])
+        self.assertEqual(2, len(interp.app_module.words))
+
+    def test_find_word_cache(self):
+        interp = Interpreter()
+        interp.run(": MESSAGE   'First' ;")
+        word = interp.find_word("MESSAGE")
+        self.assertIs(word, interp.find_word("MESSAGE"))
+
+        # Redefining a word invalidates cached lookups
+        interp.run(": MESSAGE   'Second' ;")
+        self.assertIsNot(word, interp.find_word("MESSAGE"))
+        interp.run("MESSAGE")
+        self.assertEqual("Second", interp.stack[-1])
+
+        # Lookups depend on the module stack
+        interp.run("{module-A   : MESSAGE   'In module-A' ;   MESSAGE }  MESSAGE")
+        self.assertEqual(["Second", "In module-A", "Second"], interp.stack)
+
+        # Replacing a variable invalidates cached lookups
+        interp.app_module.set_variable("x", 1)
+        interp.run("x @")
+        interp.app_module.set_variable("x", 2)
+        interp.run("x @")
+        self.assertEqual([1, 2], interp.stack[-2:])
+
+        # Literals with mutable values aren't cached, so each use gets a new value
+        interp.global_module.literal_handlers.append(lambda s: [0] if s == 'ZERO-LIST' else None)
+        for _ in range(3):
+            interp.run("ZERO-LIST 'a' APPEND POP")
+        interp.run("ZERO-LIST")
+        self.assertEqual([0], interp.stack[-1])
+
+    def test_handle_token(self):
+        class MyWordToken(WordToken):
+            __slots__ = ()
+
+        interp = Interpreter()
+        interp.handle_token(MyWordToken("1"))
+        self.assertEqual(1, interp.stack[-1])
+        self.assertRaises(UnknownTokenError, interp.handle_token, Token())
+
+    def test_vm_mode(self):
+        interp = Interpreter(vm_mode=True, codegen_mode=False)
+        interp.run("""
+        {mymodule
+           : MESSAGE   "Hello (from mymodule)";
+        }
+        : ADD-ONE   1 + ;
+        : MAIN   [1 2 ADD-ONE] {mymodule MESSAGE} ;
+        MAIN
+        """)
+        self.assertEqual([[1, 3], "Hello (from mymodule)"], interp.stack)
+        self.assertEqual(1, len(interp.module_stack))
+
+        # Profiling runs use the profiled executor
+        interp.start_profiling()
+        self.assertEqual(interp.thread_interpreter().execute_definition_profiled, interp.definition_executor)
+        interp.stop_profiling()
+        self.assertEqual(interp.thread_interpreter().execute_definition_vm, interp.definition_executor)
+
+        interp.vm_mode = False
+        self.assertEqual(interp.thread_interpreter().execute_definition_unprofiled, interp.definition_executor)
+
+    def test_vm_deep_definitions(self):
+        interp = Interpreter(vm_mode=True, codegen_mode=False)
+        interp.run(": LEVEL-0   1 ;")
+        for i in range(1, 5000):
+            interp.run(f": LEVEL-{i}   LEVEL-{i - 1} 1 + ;")
+        interp.run("LEVEL-4999")
+        self.assertEqual(5000, interp.stack[-1])
+
+    def test_codegen_mode(self):
+        interp = Interpreter(codegen_mode=True)
+        interp.run("""
+        {mymodule
+           : MESSAGE   "Hello (from mymodule)";
+        }
+        : ADD-ONE   1 + ;
+        : MAIN   [1 2 ADD-ONE] {mymodule MESSAGE} ;
+        : PAIR   ADD-ONE [SWAP 'x'] ;
+        [1 2] "PAIR" MAP
+        MAIN
+        """)
+        self.assertEqual([[[2, 'x'], [3, 'x']], [1, 3], "Hello (from mymodule)"], interp.stack)
+        self.assertEqual(1, len(interp.module_stack))
+
+        # Definitions that change the module stack fall back to the normal executor
+        self.assertIsNotNone(interp.find_word('ADD-ONE').function)
+        self.assertIsNone(interp.find_word('MAIN').function)
+        self.assertTrue(interp.find_word('MAIN').is_function_compiled)
+
+        interp.start_profiling()
+        self.assertEqual(interp.thread_interpreter().execute_definition_profiled, interp.definition_executor)
+        interp.stop_profiling()
+        self.assertEqual(interp.thread_interpreter().execute_definition_codegen, interp.definition_executor)
+
+    def test_compile_function(self):
+        interp = Interpreter()
+        interp.run(": DOUBLE   2 * ;  : QUAD   DOUBLE DOUBLE ;")
+        quad = interp.find_word('QUAD')
+        self.assertTrue(quad.compile_function())
+        interp.run("3 QUAD")
+        self.assertEqual([12], interp.stack)
+
+        # Profiling runs use the profiled executor instead of the generated function
+        executed = []
+        interp.thread_interpreter().execute_definition_profiled = lambda definition: executed.append(definition.name)
+        interp.start_profiling()
+        interp.run("QUAD")
+        interp.stop_profiling()
+        self.assertEqual(['QUAD'], executed)
+
+    def test_optimize_constants(self):
+        interp = Interpreter()
+        interp.run("""
+        : COLORS   [ [ "red" 1 ] [ "green" [2 3] ] ] REC ;
+        : ITEMS    [ 1 "two" [] ] ;
+        : MIXED    [ 1 2 + 4 ] ;
+        """)
+        sizes = {item['word']: (item['before'], item['after']) for item in interp.definition_sizes(interp.app_module)}
+        self.assertEqual({'COLORS': (14, 1), 'ITEMS': (6, 1), 'MIXED': (6, 6)}, sizes)
+
+        interp.run("COLORS ITEMS MIXED")
+        self.assertEqual([{"red": 1, "green": [2, 3]}, [1, "two", []], [3, 4]], interp.stack)
+
+        # Changing a constant doesn't change later results
+        interp.stack.clear()
+        interp.run("COLORS 5 'red' <REC! 'green' REC@ 4 APPEND  ITEMS 'three' APPEND  COLORS ITEMS")
+        self.assertEqual([[2, 3, 4], [1, "two", [], "three"], {"red": 1, "green": [2, 3]}, [1, "two", []]], interp.stack)
+
+        # Records that can't be built when a word is defined fail when it runs
+        interp.stack.clear()
+        interp.run(": BAD-REC   [1 2] REC ;  'ok'")
+        self.assertEqual(['ok'], interp.stack)
+        self.assertFalse(interp.is_compiling)
+        with self.assertRaises(TypeError):
+            interp.run("BAD-REC")
+
+    def test_optimize_record_fields(self):
+        interp = Interpreter()
+        interp.run("""
+        : NAME    'name' REC@ ;
+        : CITY    ['address' 'city'] REC@ ;
+        """)
+        self.assertEqual(1, len(interp.find_word('NAME').words))
+        self.assertEqual(1, len(interp.find_word('CITY').words))
+
+        interp.run("""
+        [['name' 'Ann'] ['address' [['city' 'Oslo']] REC]] REC  DUP NAME  SWAP CITY
+        NULL NAME  NULL CITY
+        """)
+        self.assertEqual(['Ann', 'Oslo', None, None], interp.stack)
+
+    def test_optimize_stack_shuffles(self):
+        interp = Interpreter()
+        interp.run("""
+        : ROT    SWAP POP DUP ;
+        : NOOP   SWAP SWAP DUP POP ;
+        : SHUFFLE   DUP 1 SWAP POP SWAP ;
+        """)
+        self.assertEqual(1, len(interp.find_word('ROT').words))
+        self.assertEqual(1, len(interp.find_word('NOOP').words))
+
+        interp.run("1 2 3 ROT NOOP")
+        self.assertEqual([1, 3, 3], interp.stack)
+        interp.run("SHUFFLE")
+        self.assertEqual([1, 3, 1, 3], interp.stack)
+        interp.stack.clear()
+        self.assertRaises(IndexError, interp.run, "1 ROT")
+
+        # Runs that cancel out still fail on short stacks
+        interp.stack.clear()
+        self.assertRaises(IndexError, interp.run, "0 NOOP")
+
+        # Optimization can be turned off
+        interp.optimize_definitions = False
+        interp.run(": NOOP   SWAP SWAP ;")
+        self.assertEqual(2, len(interp.find_word('NOOP').words))
+
+    def test_clone(self):
+        interp = Interpreter()
+        interp.register_module(SampleDateModule)
+        interp.run("""
+        ['date'] USE-MODULES
+        ['count'] VARIABLES
+        0 count !
+        : COUNT+   count @ 1 +  count ! ;
+        : TODAY    date.TODAY ;
+        : DOUBLE   2 * ;
+        {mymodule
+           ['message'] VARIABLES
+           'Hello' message !
+           : MESSAGE   message @ ;
+        }
+        : MESSAGE   {mymodule MESSAGE} ;
+        'COUNT-MEMO' 'COUNT+ count @' MEMO
+        """)
+        interp.app_module.set_screen('main', 'MESSAGE')
+
+        clone = interp.clone()
+        self.assertEqual([], clone.stack)
+        self.assertEqual([clone.app_module], clone.module_stack)
+
+        # Words that don't refer to variables or modules are shared
+        self.assertIs(interp.find_word('DOUBLE'), clone.find_word('DOUBLE'))
+        self.assertIsNot(interp.find_word('COUNT+'), clone.find_word('COUNT+'))
+
+        # Variables are copied
+        clone.run("COUNT+ COUNT+ count @  COUNT-MEMO  'Bye' {mymodule message !}  MESSAGE  TODAY")
+        self.assertEqual([2, 3, 'Bye', datetime.date.today()], clone.stack)
+        interp.run("count @  COUNT-MEMO  MESSAGE  'main' LOAD-SCREEN")
+        self.assertEqual([0, 1, 'Hello', 'Hello'], interp.stack)
+
+        # New words in a clone aren't added to the original
+        clone.run(": NEW-WORD   1 ;  'other' '2' SCREEN!")
+        self.assertIsNone(interp.find_word('NEW-WORD'))
+        self.assertEqual('', interp.app_module.get_screen('other'))
+
+        # Word lists are shared until a word is added, and words are cloned when they're looked up
+        clone2 = interp.clone()
+        self.assertIs(interp.app_module._words, clone2.app_module._words)
+        interp.run(": ORIGINAL-WORD   2 ;")
+        self.assertIsNot(interp.app_module._words, clone2.app_module._words)
+        self.assertIsNone(clone2.find_word('ORIGINAL-WORD'))
+        self.assertEqual(len(interp.app_module.words) - 1, len(clone2.app_module.words))
+        self.assertIs(clone2.find_word('COUNT+'), clone2.app_module.word_index['COUNT+'])
+        clone2.run("COUNT+ count @")
+        self.assertEqual([2], clone2.stack)
+        interp.stack.clear()
+        interp.run("count @")
+        self.assertEqual([1], interp.stack)
+
+    def test_clone_module_state(self):
+        interp = Interpreter()
+        interp.register_module(JiraModule)
+        interp.register_module(HtmlModule)
+        interp.run("['jira' 'html'] USE-MODULES")
+        clone1 = interp.clone()
+        clone2 = interp.clone()
+
+        # Handlers use their clone's module, so contexts pushed by one clone aren't seen by others
+        clone1.run("'ctx-A' jira.PUSH-CONTEXT!")
+        self.assertEqual(['ctx-A'], clone1.find_module('jira').context_stack)
+        self.assertEqual([], clone2.find_module('jira').context_stack)
+        self.assertEqual([], interp.find_module('jira').context_stack)
+
+        clone2.run("'/js/' html.JS-PATH!")
+        self.assertEqual('/js/', clone2.find_module('html').js_path)
+        self.assertNotEqual('/js/', interp.find_module('html').js_path)
+        self.assertIs(clone2, clone2.find_module('html').interp)
+
     def test_search_global_module(self):
         interp = Interpreter()
         interp.run("'Hi'")
@@ -150,6 +411,48 @@ class TestInterpreter(unittest.TestCase):
         interp.run("TODAY")
         self.assertEqual(today, interp.stack[2])
 
+    def test_imported_word_module_stack(self):
+        class ModuleA(Module):
+            def __init__(self, interp):
+                super().__init__("module-a", interp)
+                self.add_module_word("DEPTH", self.word_DEPTH)
+                self.add_module_word("FAST-DEPTH", self.word_DEPTH, uses_module_stack=False)
+                self.add_module_word("FAIL", self.word_FAIL)
+
+            def word_DEPTH(self, interp):
+                interp.stack_push(len(interp.module_stack))
+
+            def word_FAIL(self, interp):
+                raise RuntimeError("Failed")
+
+        interp = Interpreter()
+        interp.register_module(ModuleA)
+        interp.run("['module-a'] USE-MODULES")
+        interp.run("module-a.DEPTH module-a.FAST-DEPTH")
+        self.assertEqual([2, 1], interp.stack)
+
+        # Module stacks are restored if a word fails
+        interp.run(": FAIL-IN-MODULE   {module-a module-a.FAIL} ;")
+        self.assertRaises(RuntimeError, interp.run, "module-a.FAIL")
+        self.assertRaises(RuntimeError, interp.run, "FAIL-IN-MODULE")
+        self.assertEqual(1, len(interp.module_stack))
+
+    def test_start_module_word_cache(self):
+        interp = Interpreter()
+        interp.run(": MESSAGE   {module-A   'Hello' } ;")
+        start_module_word = interp.find_word("MESSAGE").words[0]
+        module_A = interp.app_module.modules["module-A"]
+        self.assertIs(module_A, start_module_word.module_cache[2])
+
+        interp.run("MESSAGE")
+        self.assertEqual(["Hello"], interp.stack)
+
+        # Registering a new module with the same name invalidates the cached module
+        new_module_A = Module("module-A", interp)
+        interp.app_module.register_module("module-A", new_module_A)
+        interp.run("MESSAGE")
+        self.assertIs(new_module_A, start_module_word.module_cache[2])
+
     def test_builtin_import_builtin(self):
         class ModuleA(Module):
             def __init__(self, interp):
@@ -173,6 +476,67 @@ class TestInterpreter(unittest.TestCase):
         self.assertEqual("module-a.MY-TODAY", interp.app_module.words[0].name)
         self.assertEqual("date1.TODAY", interp.app_module.modules['module-a'].words[-1].name)
 
+    def test_compile_forthic(self):
+        interp = Interpreter()
+        interp.run(": DOUBLE   2 * ;")
+        compiled = interp.compile_forthic("DOUBLE 1 +")
+        self.assertIsNotNone(compiled.words)
+        self.assertIs(compiled, interp.compile_forthic("DOUBLE 1 +"))
+
+        interp.stack_push(5)
+        compiled.execute(interp)
+        self.assertEqual(11, interp.stack[-1])
+
+        # Compiled strings are specific to the module stack
+        interp.run("{module-A")
+        self.assertIsNot(compiled, interp.compile_forthic("DOUBLE 1 +"))
+        interp.run("}")
+
+        # Redefining a word invalidates compiled strings
+        interp.run(": DOUBLE   3 * ;")
+        recompiled = interp.compile_forthic("DOUBLE 1 +")
+        self.assertIsNot(compiled, recompiled)
+        interp.stack_push(5)
+        recompiled.execute(interp)
+        self.assertEqual(16, interp.stack[-1])
+
+    def test_compile_forthic_fallback(self):
+        interp = Interpreter()
+
+        # Strings with definitions or words that don't exist yet are run normally
+        compiled = interp.compile_forthic(": NEW-WORD 'new' ; NEW-WORD")
+        self.assertIsNone(compiled.words)
+        compiled.execute(interp)
+        self.assertEqual("new", interp.stack[-1])
+
+        compiled = interp.compile_forthic("['x'] VARIABLES 3 x ! x @")
+        self.assertIsNone(compiled.words)
+        compiled.execute(interp)
+        self.assertEqual(3, interp.stack[-1])
+
+        # Unbalanced modules are run normally
+        compiled = interp.compile_forthic("{module-A")
+        self.assertIsNone(compiled.words)
+        self.assertEqual(1, len(interp.module_stack))
+
+        # Literals with mutable values are converted each time they're run
+        interp.global_module.literal_handlers.append(lambda s: [0] if s == 'ZERO-LIST' else None)
+        compiled = interp.compile_forthic("POP ZERO-LIST 'a' APPEND")
+        self.assertIsNone(compiled.words)
+        interp.run("[1 2 3] \"POP ZERO-LIST 'a' APPEND\" MAP")
+        self.assertEqual([[0, 'a'], [0, 'a'], [0, 'a']], interp.stack[-1])
+
+    def test_compile_forthic_modules(self):
+        interp = Interpreter()
+        interp.run("""
+        {mymodule
+           : MESSAGE   "Hello (from mymodule)";
+        }
+        [1 2 3] "POP {mymodule MESSAGE}" MAP
+        """)
+        self.assertEqual(["Hello (from mymodule)"] * 3, interp.stack[-1])
+        self.assertEqual(1, len(interp.module_stack))
+
 
 if __name__ == '__main__':
     unittest.main()
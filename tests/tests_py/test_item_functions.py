@@ -0,0 +1,101 @@
+import datetime
+import unittest
+from forthic.interpreter import Interpreter
+
+
+RECORDS = [
+    {'Status': 'Open', 'Owner': 'ana', 'Labels': ['risk', 'ui'], 'Due Date': '2020-06-05', 'Points': 3},
+    {'Status': 'Closed', 'Owner': 'Closed', 'Labels': [], 'Due Date': None, 'Points': None},
+    {'Status': 'Blocked', 'Owner': 'bo', 'Labels': ['risk'], 'Due Date': datetime.date(2999, 1, 1), 'Points': 8},
+    {'Status': 'Open', 'Labels': None, 'Due Date': datetime.datetime(2021, 3, 4, 5, 6)},
+    {},
+    None,
+]
+
+# Forthic strings that are compiled into Python functions
+COMPILED_FORTHIC = [
+    "'Status' REC@",
+    "'Status' REC@ 'Open' ==",
+    "'Status' REC@ status @ ==",
+    "'Status' REC@ status @ !=",
+    "'Status' REC@ 'Open' == NOT",
+    "'Labels' REC@ label @ SWAP IN",
+    "'Due Date' REC@ >DATE NULL !=",
+    "'Due Date' REC@ >DATE TODAY <",
+    "'Points' REC@ 3 >=",
+    "'Points' REC@ 5 <",
+    "'Points' REC@ 3 <=",
+    "'Points' REC@ 5 SWAP >",
+    "DUP 'Status' REC@ SWAP 'Owner' REC@ ==",
+    "'Status' REC@ status @ == TRUE FALSE == ==",
+    "'Missing' REC@ NULL ==",
+]
+
+# Forthic strings that are run normally
+UNCOMPILED_FORTHIC = [
+    "'Status' REC@ |LOWER",
+    "['Labels'] REC@",
+    "'Status' REC@ 'open' ==",   # == is redefined in the app module
+    "'Status' REC@ 'Open' == 1",
+    "POP POP",
+    "'Status' REC@ status !  TRUE",
+]
+
+
+class TestItemFunctions(unittest.TestCase):
+    def setUp(self):
+        self.interp = Interpreter()
+        self.interp.run("['status' 'label'] VARIABLES  'Open' status !  'risk' label !")
+
+    def get_item_function(self, forthic):
+        interp = self.interp
+        return interp.get_item_function(interp.compile_forthic(forthic))
+
+    def run_forthic(self, forthic, item):
+        self.interp.stack_push(item)
+        self.interp.compile_forthic(forthic).execute(self.interp)
+        return self.interp.stack_pop()
+
+    def test_equivalence(self):
+        for forthic in COMPILED_FORTHIC:
+            item_function = self.get_item_function(forthic)
+            self.assertIsNotNone(item_function, forthic)
+            for record in RECORDS[:-1]:
+                self.assertEqual(self.run_forthic(forthic, record), item_function(record), forthic)
+
+        # Records are checked with REC@
+        self.assertIsNone(self.get_item_function("'Status' REC@")(None))
+
+    def test_uncompiled(self):
+        self.interp.run(": ==   'open' SWAP REC@ ;")
+        for forthic in UNCOMPILED_FORTHIC:
+            self.assertIsNone(self.get_item_function(forthic), forthic)
+
+    def test_variables(self):
+        interp = self.interp
+        item_function = self.get_item_function("'Status' REC@ status @ ==")
+        self.assertEqual([True, False, False, True], [item_function(r) for r in RECORDS[:4]])
+        interp.run("'Closed' status !")
+        self.assertEqual([False, True, False, False], [item_function(r) for r in RECORDS[:4]])
+
+    def test_words(self):
+        interp = self.interp
+        interp.stack_push(RECORDS[:4])
+        interp.run("""
+        DUP "'Status' REC@ status @ ==" SELECT "'Owner' REC@" MAP
+        SWAP "'Status' REC@" GROUP-BY  "LENGTH" MAP
+        """)
+        self.assertEqual([['ana', None], {'Open': 2, 'Closed': 1, 'Blocked': 1}], interp.stack)
+
+        # Profiling runs count the words of compiled strings
+        interp.stack = []
+        interp.start_profiling()
+        interp.stack_push(RECORDS[:4])
+        interp.run("\"'Status' REC@ 'Open' ==\" SELECT")
+        interp.stop_profiling()
+        counts = {item['word']: item['count'] for item in interp.word_histogram()}
+        self.assertEqual(4, counts['=='])
+
+
+if __name__ == '__main__':
+    unittest.main()
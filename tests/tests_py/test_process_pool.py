@@ -0,0 +1,81 @@
+import unittest
+from forthic.interpreter import Interpreter, UnknownWordError
+from forthic.module import Module
+from forthic import process_pool
+from forthic.process_pool import ProcessPool, WorkerSpec, shutdown_process_pools
+
+
+class SampleModule(Module):
+    def __init__(self, interp):
+        super().__init__('sample', interp, """
+        : TRIPLE   3 * ;
+        ['TRIPLE'] EXPORT
+        """)
+
+
+def make_interp():
+    interp = Interpreter()
+    interp.register_module(SampleModule)
+    interp.app_module.set_screen('helpers', ': SQUARE   DUP * ;')
+    interp.process_workers = 2
+    interp.process_setup = "['sample'] USE-MODULES  'helpers' LOAD-SCREEN"
+    return interp
+
+
+class TestProcessPool(unittest.TestCase):
+    def tearDown(self):
+        shutdown_process_pools()
+
+    def test_process_map(self):
+        interp = make_interp()
+        interp.run("""
+        [1 2 3 4 5 6 7 8 9 10] "SQUARE sample.TRIPLE" PROCESS-MAP
+        [["a" 1] ["b" 2]] REC "SQUARE" PROCESS-MAP
+        [] "SQUARE" PROCESS-MAP
+        """)
+        self.assertEqual([[3, 12, 27, 48, 75, 108, 147, 192, 243, 300], {'a': 1, 'b': 4}, []], interp.stack)
+
+        # Workers are shared by interpreters set up the same way
+        make_interp().run("[1 2] 'SQUARE' PROCESS-MAP")
+        self.assertEqual(1, len(process_pool._process_pools))
+
+    def test_process_map_error(self):
+        interp = make_interp()
+        with self.assertRaises(UnknownWordError) as context:
+            interp.run("['1' '2' 'GARBAGE'] 'INTERPRET' PROCESS-MAP")
+        self.assertEqual("Unknown word: 'GARBAGE'", str(context.exception))
+
+    def test_run_chunk_error(self):
+        process_pool.init_worker(WorkerSpec.from_interpreter(make_interp()))
+        self.addCleanup(setattr, process_pool, '_worker_interp', None)
+        worker_interp = process_pool._worker_interp
+        with self.assertRaises(UnknownWordError):
+            process_pool.run_chunk("{sample 'x' SWAP GARBAGE}", [1, 2])
+
+        # The next chunk starts with an empty stack in the app module
+        self.assertEqual([], worker_interp.stack)
+        self.assertEqual([worker_interp.app_module], worker_interp.module_stack)
+        self.assertEqual([3, 6], process_pool.run_chunk("sample.TRIPLE", [1, 2])[0])
+
+    def test_chunk_size(self):
+        interp = make_interp()
+        pool = ProcessPool(WorkerSpec.from_interpreter(interp), 2)
+        try:
+            # Without timings, each worker gets 4 chunks
+            self.assertEqual(125, pool.get_chunk_size('SQUARE', 1000))
+            self.assertEqual(1, pool.get_chunk_size('SQUARE', 3))
+
+            # Slow items are sent in smaller chunks
+            pool.seconds_per_item['SQUARE'] = 0.001
+            self.assertEqual(20, pool.get_chunk_size('SQUARE', 1000))
+            pool.seconds_per_item['SQUARE'] = 1e-6
+            self.assertEqual(125, pool.get_chunk_size('SQUARE', 1000))
+
+            self.assertEqual([1, 4, 9], pool.get_results('SQUARE', pool.submit('SQUARE', [1, 2, 3]), 3))
+            self.assertIn('SQUARE', pool.seconds_per_item)
+        finally:
+            pool.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
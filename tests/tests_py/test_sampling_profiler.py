@@ -0,0 +1,87 @@
+import json
+import unittest
+from forthic.interpreter import Interpreter
+from forthic.module import ModuleWord
+
+
+SCREEN = """
+{helpers
+    : INNER   SAMPLE ;
+    : OUTER   [1 2] "INNER" MAP POP ;
+}
+: MAIN   {helpers OUTER}  SAMPLE ;
+"""
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def make_interp(self, **kwargs):
+        interp = Interpreter(**kwargs)
+
+        # Takes a sample from the thread being sampled, so stacks are known
+        def word_SAMPLE(interp):
+            interp.sampling_profiler.add_sample(0.01)
+        interp.app_module.add_word(ModuleWord('SAMPLE', word_SAMPLE))
+        interp.run(SCREEN)
+        return interp
+
+    def test_stacks(self):
+        for kwargs in [{}, {'vm_mode': True}, {'codegen_mode': True}]:
+            interp = self.make_interp(**kwargs)
+            interp.run("1 PROFILE-SAMPLE-START  MAIN  PROFILE-SAMPLE-END")
+            profiler = interp.stack_pop()
+            self.assertEqual({
+                ('MAIN', 'helpers.OUTER', 'MAP', 'helpers.INNER', 'SAMPLE'): 2,
+                ('MAIN', 'SAMPLE'): 1,
+            }, profiler.counts, kwargs)
+            self.assertEqual('MAIN;SAMPLE 1\nMAIN;helpers.OUTER;MAP;helpers.INNER;SAMPLE 2', profiler.folded())
+
+            # Sampling stops
+            thread_interp = interp.thread_interpreter()
+            self.assertFalse(thread_interp.is_tracing)
+            self.assertEqual(thread_interp.unprofiled_executor(), thread_interp.definition_executor)
+
+    def test_speedscope(self):
+        interp = self.make_interp()
+        interp.run("1 PROFILE-SAMPLE-START  MAIN  PROFILE-SAMPLE-END  PROFILE-SPEEDSCOPE")
+        result = json.loads(interp.stack_pop())
+        frames = [f['name'] for f in result['shared']['frames']]
+        self.assertEqual(['MAIN', 'SAMPLE', 'helpers.OUTER', 'MAP', 'helpers.INNER'], frames)
+
+        profile = result['profiles'][0]
+        self.assertEqual('sampled', profile['type'])
+        self.assertEqual([[0, 1], [0, 2, 3, 4, 1]], profile['samples'])
+        self.assertEqual([0.01, 0.02], profile['weights'])
+        self.assertAlmostEqual(0.03, profile['endValue'])
+
+    def test_sampling_thread(self):
+        interp = Interpreter()
+        interp.run(': BUSY   "DUP * 1 +" MAP POP ;  : MAIN   BUSY ;')
+        interp.start_sampling(1000)
+        interp.stack_push(list(range(200000)))
+        interp.run("MAIN")
+        profiler = interp.stop_sampling()
+        self.assertGreater(profiler.num_samples, 0)
+        for stack in profiler.counts:
+            self.assertEqual(('MAIN', 'BUSY'), stack[:2])
+
+        # There is nothing to stop once sampling has stopped
+        self.assertIsNone(interp.stop_sampling())
+        interp.run("PROFILE-SAMPLE-END PROFILE-FOLDED")
+        self.assertEqual('', interp.stack_pop())
+
+    def test_profiling(self):
+        interp = self.make_interp()
+        thread_interp = interp.thread_interpreter()
+        interp.start_sampling()
+        interp.start_profiling()
+        self.assertEqual(thread_interp.execute_definition_profiled, thread_interp.definition_executor)
+        interp.stop_profiling()
+        self.assertEqual(thread_interp.execute_definition_sampled, thread_interp.definition_executor)
+        self.assertTrue(thread_interp.is_tracing)
+        interp.stop_sampling()
+        self.assertEqual(thread_interp.unprofiled_executor(), thread_interp.definition_executor)
+        self.assertFalse(thread_interp.is_tracing)
+
+
+if __name__ == '__main__':
+    unittest.main()
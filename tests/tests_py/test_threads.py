@@ -0,0 +1,245 @@
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from forthic.interpreter import Interpreter, UnknownWordError
+from forthic.module import dictionary_generation
+
+
+SCREENS = {
+    'helpers': """
+    : SQUARE   DUP * ;
+    {stats
+        : SUM    0 "+" REDUCE ;
+        : MEAN   DUP SUM SWAP LENGTH / ;
+    }
+    """,
+
+    'numbers': """
+    'helpers' LOAD-SCREEN
+    : EVEN-SQUARES   "SQUARE" MAP "2 MOD 0 ==" SELECT ;
+    [1 2 3 4 5 6 7 8 9 10] EVEN-SQUARES  DUP {stats SUM}  SWAP {stats MEAN}
+    """,
+
+    'records': """
+    : TASK     ["name" "owner" "points"] SWAP ZIP REC ;
+    : POINTS   "'points' REC@" MAP  0 "+" REDUCE ;
+    [
+        ["A" "ana" 3] ["B" "bo" 5] ["C" "ana" 8] ["D" "cy" 1] ["E" "bo" 2]
+    ] "TASK" MAP
+    "owner" GROUP-BY-FIELD  "POINTS" MAP
+    DUP KEYS SORT  SWAP >JSON
+    """,
+
+    'strings': """
+    ["alpha" "beta" "gamma"] "|UPPER" MAP "-" JOIN
+    "a,b,,c" "," SPLIT  ["x" "y"] ["y" "z"] UNION SORT
+    """,
+
+    'variables': """
+    ['total' 'factor'] VARIABLES
+    'SCALED' 'total @ factor @ *' MEMO
+    : ADD   total @ +  total ! ;
+    0 total !  3 factor !
+    [1 2 3 4 5 6 7 8 9 10] "ADD" FOREACH  total @  SCALED
+    """,
+
+    'nested': """
+    'numbers' LOAD-SCREEN  +  'strings' LOAD-SCREEN  POP POP  LENGTH
+    """,
+
+    'failing': """
+    1 2 UNKNOWN-WORD 3
+    """,
+}
+
+NUM_THREADS = 8
+NUM_ITERATIONS = 25
+
+
+def make_interp():
+    interp = Interpreter()
+    for name, content in SCREENS.items():
+        interp.app_module.set_screen(name, content)
+    return interp
+
+
+def run_screen(interp, name):
+    """Runs a screen, returning its stack and whether it raised an UnknownWordError"""
+    failed = False
+    try:
+        interp.run(f"'{name}' LOAD-SCREEN")
+    except UnknownWordError:
+        failed = True
+    result = interp.stack
+    interp.stack = []
+    return result, failed
+
+
+class TestThreads(unittest.TestCase):
+    def setUp(self):
+        # Switch threads often so runs interleave within words
+        self.switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+
+    def tearDown(self):
+        sys.setswitchinterval(self.switch_interval)
+
+    def test_concurrent_screens(self):
+        interp = make_interp()
+        expected = {name: run_screen(interp, name) for name in SCREENS}
+        self.assertEqual(([220, 44], False), expected['numbers'])
+        self.assertEqual((['ALPHA-BETA-GAMMA', ['a', 'b', '', 'c'], ['x', 'y', 'z']], False), expected['strings'])
+        self.assertEqual(([['ana', 'bo', 'cy'], '{"ana": 11, "bo": 7, "cy": 1}'], False), expected['records'])
+        self.assertEqual(([264, 16], False), expected['nested'])
+        self.assertEqual(([55, 165], False), expected['variables'])
+        self.assertEqual(([1, 2], True), expected['failing'])
+
+        # Words defined by other threads aren't added to the shared modules
+        num_words = len(interp.app_module.words)
+        generation = dictionary_generation()
+
+        interp.run("'untouched'")
+        barrier = threading.Barrier(NUM_THREADS)
+        results = [[] for _ in range(NUM_THREADS)]
+
+        def worker(index):
+            barrier.wait()
+            names = list(SCREENS)
+            for i in range(NUM_ITERATIONS):
+                # Each thread runs the screens in a different order
+                name = names[(index + i) % len(names)]
+                results[index].append((name, run_screen(interp, name), interp.cur_module() is interp.app_module))
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(NUM_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for thread_results in results:
+            self.assertEqual(NUM_ITERATIONS, len(thread_results))
+            for name, result, is_app_module in thread_results:
+                self.assertEqual(expected[name], result, name)
+                self.assertTrue(is_app_module)
+        self.assertEqual(['untouched'], interp.stack)
+        self.assertEqual(num_words, len(interp.app_module.words))
+        self.assertEqual(generation, dictionary_generation())
+
+    def test_concurrent_variables(self):
+        interp = make_interp()
+        interp.run("""
+        ['x'] VARIABLES
+        'X-MEMO' 'x @' MEMO
+        : DOUBLE-X   x @ 2 * ;
+        -1 x !
+        """)
+        barrier = threading.Barrier(NUM_THREADS)
+        results = [[] for _ in range(NUM_THREADS)]
+
+        def worker(index):
+            barrier.wait()
+            for i in range(NUM_ITERATIONS * 10):
+                interp.run(f"{index} x !  [1 2 3] 'POP x @' MAP  DOUBLE-X  X-MEMO  x @")
+                results[index].append(interp.stack)
+                interp.stack = []
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(NUM_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Each thread sees its own values, and other threads' values don't change the creating thread's
+        for index, thread_results in enumerate(results):
+            for result in thread_results:
+                self.assertEqual([[index] * 3, index * 2, index, index], result)
+        interp.run("x @")
+        self.assertEqual([-1], interp.stack)
+
+    def test_variables_created_by_threads(self):
+        # The variables and memo are first created by the worker threads, not the thread that created interp
+        interp = make_interp()
+        interp.app_module.set_screen('seeded', """
+        ['seed'] VARIABLES  seed !
+        'SEED-MEMO' 'seed @ 10 *' MEMO
+        SEED-MEMO  seed @
+        """)
+        barrier = threading.Barrier(NUM_THREADS)
+        results = [[] for _ in range(NUM_THREADS)]
+
+        def worker(index):
+            barrier.wait()
+            for i in range(NUM_ITERATIONS):
+                interp.run(f"{index} 'seeded' LOAD-SCREEN")
+                results[index].append(interp.stack)
+                interp.stack = []
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(NUM_THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for index, thread_results in enumerate(results):
+            self.assertEqual([[index * 10, index]] * NUM_ITERATIONS, thread_results)
+
+        # Values set by the worker threads weren't shared
+        interp.run("seed @")
+        self.assertEqual([None], interp.stack)
+
+    def test_thread_reused_by_runs(self):
+        interp = make_interp()
+        interp.run("['y'] VARIABLES  'set-up' y !")
+
+        def run(string):
+            interp.run(string)
+            result = interp.stack
+            interp.stack = []
+            return result
+
+        # Values set by a run on a pool thread aren't seen by later runs on that thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual([42], executor.submit(run, "42 y !  y @").result())
+            self.assertEqual(['set-up'], executor.submit(run, "y @").result())
+
+            # Values set by variables and memos a run creates aren't seen either
+            self.assertEqual([[1]], executor.submit(run, "['z'] VARIABLES  'M' '[z @]' MEMO  1 z !  M").result())
+            self.assertEqual([None], executor.submit(run, "z @").result())
+
+        # A thread that didn't create the variable doesn't set the value others see
+        thread = threading.Thread(target=run, args=("['w'] VARIABLES  'W-MEMO' 'w @' MEMO  1 w !  W-MEMO",))
+        thread.start()
+        thread.join()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual([2], executor.submit(run, "['w'] VARIABLES  'W-MEMO' 'w @' MEMO  2 w !  W-MEMO").result())
+        self.assertEqual([None], run("w @"))
+
+    def test_thread_state(self):
+        interp = make_interp()
+        interp.run('1 2')
+
+        results = {}
+
+        def worker():
+            results['initial_stack'] = interp.stack[:]
+            interp.run('3')
+            results['thread_interp'] = interp.thread_interpreter()
+
+        thread_interp_main = interp.thread_interpreter()
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual([], results['initial_stack'])
+        self.assertEqual([3], results['thread_interp'].stack)
+        self.assertIsNot(thread_interp_main, results['thread_interp'])
+        self.assertEqual([1, 2], interp.stack)
+        self.assertIs(thread_interp_main, interp.thread_interpreter())
+
+        # Clones have their own execution state
+        clone = interp.clone()
+        self.assertEqual([], clone.stack)
+
+
+if __name__ == '__main__':
+    unittest.main()
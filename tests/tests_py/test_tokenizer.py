@@ -1,5 +1,5 @@
 import unittest
-from forthic.tokenizer import Tokenizer, DLE
+from forthic.tokenizer import Tokenizer, FastTokenizer, DLE
 from forthic.tokens import StringToken, StartArrayToken, EndArrayToken, StartModuleToken,\
     EndModuleToken, StartDefinitionToken, EndDefinitionToken, WordToken, EOSToken
 
@@ -37,10 +37,12 @@ def is_start_module_token(token, name):
 
 
 class TestTokenizer(unittest.TestCase):
+    tokenizer_class = Tokenizer
+
     def test_basic(self):
         """Checks to see that all basic tokens are recognized
         """
-        tokenizer = Tokenizer("[ ] : DEFINITION ; { } '' WORD")
+        tokenizer = self.tokenizer_class("[ ] : DEFINITION ; { } '' WORD")
         tokens = get_tokens(tokenizer)
         expected = [StartArrayToken, EndArrayToken, StartDefinitionToken, EndDefinitionToken,
                     StartModuleToken, EndModuleToken, StringToken, WordToken, EOSToken]
@@ -53,7 +55,7 @@ class TestTokenizer(unittest.TestCase):
     def test_end_definition(self):
         """Checks that end definition (;) is recognized even at end of word
         """
-        tokenizer = Tokenizer("WORD; WORD2")
+        tokenizer = self.tokenizer_class("WORD; WORD2")
         tokens = get_tokens(tokenizer)
 
         self.assertTrue(is_word_token(tokens[0], "WORD"))
@@ -62,7 +64,7 @@ class TestTokenizer(unittest.TestCase):
 
 
     def test_start_module(self):
-        tokenizer = Tokenizer("{ {my-mod")
+        tokenizer = self.tokenizer_class("{ {my-mod")
         tokens = get_tokens(tokenizer)
 
         self.assertTrue(is_start_module_token(tokens[0], ""))
@@ -70,7 +72,7 @@ class TestTokenizer(unittest.TestCase):
 
     def test_strings(self):
 
-        tokenizer = Tokenizer(f"'Single' ^Caret^ '''Triple Single''' ^^^Triple Caret^^^ {DLE}Single DLE{DLE}")
+        tokenizer = self.tokenizer_class(f"'Single' ^Caret^ '''Triple Single''' ^^^Triple Caret^^^ {DLE}Single DLE{DLE}")
         tokens = get_tokens(tokenizer)
 
         self.assertTrue(is_string_token(tokens[0], "Single"))
@@ -79,14 +81,14 @@ class TestTokenizer(unittest.TestCase):
         self.assertTrue(is_string_token(tokens[3], "Triple Caret"))
         self.assertTrue(is_string_token(tokens[4], "Single DLE"))
 
-        tokenizer = Tokenizer('"Double" """Triple Double"""')
+        tokenizer = self.tokenizer_class('"Double" """Triple Double"""')
         tokens = get_tokens(tokenizer)
 
         self.assertTrue(is_string_token(tokens[0], "Double"))
         self.assertTrue(is_string_token(tokens[1], "Triple Double"))
 
     def test_arrays(self):
-        tokenizer = Tokenizer("[1 2] [3[4]]")
+        tokenizer = self.tokenizer_class("[1 2] [3[4]]")
 
         tokens = get_tokens(tokenizer)
 
@@ -102,7 +104,7 @@ class TestTokenizer(unittest.TestCase):
         self.assertTrue(isinstance(tokens[9], EndArrayToken))
 
     def test_end_module(self):
-        tokenizer = Tokenizer("WORD1}WORD2")
+        tokenizer = self.tokenizer_class("WORD1}WORD2")
         tokens = get_tokens(tokenizer)
 
         self.assertTrue(is_word_token(tokens[0], "WORD1"))
@@ -110,5 +112,28 @@ class TestTokenizer(unittest.TestCase):
         self.assertTrue(is_word_token(tokens[2], "WORD2"))
 
 
+class TestFastTokenizer(TestTokenizer):
+    """Runs the same tests against the FastTokenizer
+    """
+    tokenizer_class = FastTokenizer
+
+    def test_same_tokens(self):
+        """Checks that the FastTokenizer returns the same tokens as the Tokenizer
+        """
+        string = f"""
+        # A comment
+        : DEFINITION   [1 2] {{my-mod WORD}} 'Single' ^Caret^ "Double" {DLE}DLE{DLE};
+        ^^^Triple "Caret"^^^ ^^ WORD1}}WORD2;WORD3[(paren)] {{mod}} :(NAME);
+        #No newline"""
+        expected = get_tokens(Tokenizer(string))
+        tokens = get_tokens(FastTokenizer(string))
+
+        self.assertEqual(len(expected), len(tokens))
+        for i in range(len(tokens)):
+            self.assertIsInstance(tokens[i], type(expected[i]))
+            for field in type(tokens[i]).__slots__:
+                self.assertEqual(getattr(expected[i], field), getattr(tokens[i], field))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,18 +1,20 @@
 import unittest
-from forthic.tokenizer import Tokenizer, UnterminatedStringError, InvalidDefinitionError
+from forthic.tokenizer import Tokenizer, FastTokenizer, UnterminatedStringError, InvalidDefinitionError
 
 class TestTokenizerErrors(unittest.TestCase):
+    tokenizer_class = Tokenizer
+
     def test_unterminated_string(self):
         """Raise exception if strings are unterminated
         """
-        tokenizer = Tokenizer("'Unterminated")
+        tokenizer = self.tokenizer_class("'Unterminated")
         self.assertRaises(UnterminatedStringError, tokenizer.next_token)
 
 
     def test_start_definition_eos(self):
         """Can't have an empty definition
         """
-        tokenizer = Tokenizer(":")
+        tokenizer = self.tokenizer_class(":")
         self.assertRaises(InvalidDefinitionError, tokenizer.next_token)
 
 
@@ -20,7 +22,7 @@ class TestTokenizerErrors(unittest.TestCase):
         """Can't have definition with Forthic special chars
         """
         def check_for_exception(input):
-            tokenizer = Tokenizer(input)
+            tokenizer = self.tokenizer_class(input)
             self.assertRaises(InvalidDefinitionError, tokenizer.next_token)
 
         invalid_start_defs = [": 'HOWDY", ": HOW'DY", ": HOW[DY", ": HOW]DY", ": HOW{DY", ": HOW}DY"]
@@ -29,5 +31,11 @@ class TestTokenizerErrors(unittest.TestCase):
             check_for_exception(forthic)
 
 
+class TestFastTokenizerErrors(TestTokenizerErrors):
+    """Runs the same tests against the FastTokenizer
+    """
+    tokenizer_class = FastTokenizer
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,169 @@
+import os
+import tempfile
+import threading
+import unittest
+from forthic.interpreter import Interpreter
+from forthic.module import Module
+from forthic.word_metrics import LatencyHistogram, WordMetrics, bucket_index, bucket_upper_bound
+
+
+class SampleModule(Module):
+    def __init__(self, interp):
+        super().__init__('sample', interp)
+        self.add_module_word('SEARCH', self.word_SEARCH)
+        self.add_module_word('FAIL', self.word_FAIL)
+        self.add_module_word('COUNT', self.word_COUNT, uses_module_stack=False)
+        self.count = 0
+
+    # ( query -- results )
+    def word_SEARCH(self, interp):
+        query = interp.stack_pop()
+        interp.stack_push([query])
+
+    # ( -- )
+    def word_FAIL(self, interp):
+        raise RuntimeError('failed')
+
+    # ( -- count )
+    def word_COUNT(self, interp):
+        self.count += 1
+        interp.stack_push(self.count)
+
+
+class OtherModule(Module):
+    def __init__(self, interp):
+        super().__init__('other', interp)
+        self.add_module_word('"ROWS"', self.word_ROWS)
+
+    # ( -- rows )
+    def word_ROWS(self, interp):
+        interp.stack_push([])
+
+
+class TestWordMetrics(unittest.TestCase):
+    def test_histogram(self):
+        histogram = LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record(i / 1000)
+        snapshot = histogram.snapshot()
+        self.assertEqual(100, snapshot['count'])
+        self.assertAlmostEqual(5.05, snapshot['sum'])
+        self.assertEqual(0.001, snapshot['min'])
+        self.assertEqual(0.1, snapshot['max'])
+        for name, expected in [('p50', 0.05), ('p90', 0.09), ('p99', 0.099)]:
+            self.assertLess(abs(snapshot[name] - expected) / expected, 0.04, name)
+        # Calls in the bucket containing 0.05 might be slower, so they aren't counted
+        self.assertEqual(49, histogram.count_at_most(0.05))
+        self.assertIsNone(LatencyHistogram().quantile(0.5))
+
+        # Buckets have the same relative precision at every scale
+        for seconds in [2e-7, 0.003, 1.5, 400.0]:
+            upper_bound = bucket_upper_bound(bucket_index(seconds))
+            self.assertLessEqual(seconds, upper_bound)
+            self.assertLess(upper_bound / seconds, 1.035)
+
+    def test_words(self):
+        interp = Interpreter()
+        interp.register_module(SampleModule)
+        metrics = interp.enable_word_metrics()
+        self.assertIs(metrics, interp.enable_word_metrics())
+        self.assertIs(metrics, interp.word_metrics)
+        interp.register_module(OtherModule)
+
+        interp.run("""
+        ['sample' 'other'] USE-MODULES
+        : SEARCH-ALL   "sample.SEARCH" MAP ;
+        ['a' 'b' 'c'] SEARCH-ALL  other."ROWS"
+        """)
+        with self.assertRaises(RuntimeError):
+            interp.run("sample.FAIL")
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(['other."ROWS"', 'sample.FAIL', 'sample.SEARCH'], list(snapshot))
+        self.assertEqual(3, snapshot['sample.SEARCH']['calls'])
+        self.assertEqual(3, snapshot['sample.SEARCH']['count'])
+        self.assertEqual(1, snapshot['sample.FAIL']['count'])
+
+        # Global words aren't timed by default
+        self.assertNotIn('MAP', snapshot)
+        self.assertEqual([[['a'], ['b'], ['c']], []], interp.stack)
+
+    def test_sampling(self):
+        interp = Interpreter()
+        interp.register_module(SampleModule)
+        metrics = interp.enable_word_metrics(sample_every=4, include_global=True)
+        interp.run("['sample'] USE-MODULES  [1 2 3 4 5 6 7 8 9 10] 'sample.SEARCH' MAP")
+        stats = metrics.snapshot()['sample.SEARCH']
+        self.assertEqual(10, stats['calls'])
+        self.assertEqual(2, stats['count'])
+        self.assertEqual(1, metrics.snapshot()['MAP']['calls'])
+
+        with self.assertRaises(ValueError):
+            Interpreter().enable_word_metrics(sample_every=0)
+
+    def test_concurrent_calls(self):
+        metrics = WordMetrics(sample_every=3)
+        histogram = LatencyHistogram()
+        handler = metrics.timed_handler(lambda interp: None, histogram)
+
+        def call_handler():
+            for _ in range(10000):
+                handler(None)
+
+        threads = [threading.Thread(target=call_handler) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(40000, histogram.calls)
+        self.assertEqual(13333, histogram.count)
+
+    def test_instrument_after_setup(self):
+        interp = Interpreter(codegen_mode=True)
+        interp.register_module(SampleModule)
+        interp.run("""
+        ['sample'] USE-MODULES
+        : COUNT-TWICE   sample.COUNT sample.COUNT ;
+        COUNT-TWICE  sample.COUNT  ['x'] "sample.SEARCH" MAP
+        """)
+
+        # Words that were imported or compiled before metrics were enabled are timed
+        metrics = interp.enable_word_metrics()
+        interp.run("COUNT-TWICE  sample.COUNT  ['x'] 'sample.SEARCH' MAP")
+        snapshot = metrics.snapshot()
+        self.assertEqual(3, snapshot['sample.COUNT']['calls'])
+        self.assertEqual(1, snapshot['sample.SEARCH']['calls'])
+
+        # Clones time their words with their own modules
+        clone = interp.clone()
+        clone.run("sample.COUNT")
+        self.assertEqual(7, clone.stack[-1])
+        self.assertEqual(4, metrics.snapshot()['sample.COUNT']['calls'])
+        self.assertEqual(6, interp.find_module('sample').count)
+
+    def test_prometheus(self):
+        interp = Interpreter()
+        interp.register_module(SampleModule)
+        interp.register_module(OtherModule)
+        metrics = interp.enable_word_metrics()
+        interp.run("['sample' 'other'] USE-MODULES  'q' sample.SEARCH  other.\"ROWS\"")
+
+        text = metrics.prometheus_text()
+        lines = text.splitlines()
+        self.assertIn('# TYPE forthic_word_duration_seconds histogram', lines)
+        self.assertIn('forthic_word_duration_seconds_bucket{word="sample.SEARCH",le="+Inf"} 1', lines)
+        self.assertIn('forthic_word_duration_seconds_bucket{word="sample.SEARCH",le="60.0"} 1', lines)
+        self.assertIn('forthic_word_duration_seconds_count{word="other.\\"ROWS\\""} 1', lines)
+        self.assertIn('forthic_word_calls_total{word="sample.SEARCH"} 1', lines)
+        self.assertNotIn('sample.FAIL', text)
+
+        with tempfile.TemporaryDirectory() as dirname:
+            path = os.path.join(dirname, 'forthic.prom')
+            metrics.write_prometheus(path)
+            with open(path) as f:
+                self.assertEqual(text, f.read())
+            self.assertEqual(['forthic.prom'], os.listdir(dirname))
+
+
+if __name__ == '__main__':
+    unittest.main()